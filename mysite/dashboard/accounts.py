@@ -0,0 +1,59 @@
+"""
+여러 사용자의 활성 상태를 한 번에 바꾸는 일괄 처리.
+
+관리자 대시보드의 일괄 변경 API 와 'set_user_status' 관리 명령이 함께 사용합니다.
+사용자를 한 명씩 get() 후 save() 하지 않고, chunk_size 개씩 현재 상태를 한 번 읽은 뒤
+바꿀 행만 UPDATE ... WHERE id IN (...) 한 번으로 갱신합니다.
+
+QuerySet.update() 는 post_save 시그널을 보내지 않습니다. 활성 상태는 검색 색인이나
+캐시된 화면에 쓰이지 않지만 로그인 사용자 캐시(dashboard/auth.py)에는 들어 있으므로 바뀐 사용자의
+캐시를 직접 지웁니다. 그래서 비활성화된 사용자의 기존 세션은 인증 백엔드가 다음 요청에서 거부합니다.
+"""
+from django.contrib.auth.models import User
+from django.db import transaction
+
+from . import auth
+
+DEFAULT_CHUNK_SIZE = 500
+
+# 사용자 id 별 처리 결과
+ACTIVATED = 'activated'
+DEACTIVATED = 'deactivated'
+UNCHANGED = 'unchanged'
+NOT_FOUND = 'not_found'
+SELF = 'self'
+
+
+def set_users_active(user_ids, is_active, acting_user=None, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    user_ids 의 활성 상태를 is_active 로 맞추고 {사용자 id: 결과} 를 입력 순서대로 반환합니다.
+    acting_user(요청한 관리자) 자신의 계정은 건드리지 않고 SELF 로 표시합니다.
+    """
+    results = {}
+    for user_id in user_ids:
+        results.setdefault(int(user_id), NOT_FOUND)
+    if acting_user is not None and acting_user.pk in results:
+        results[acting_user.pk] = SELF
+
+    pending = [user_id for user_id, result in results.items() if result == NOT_FOUND]
+    changed_result = ACTIVATED if is_active else DEACTIVATED
+    for start in range(0, len(pending), chunk_size):
+        chunk = pending[start:start + chunk_size]
+        # 읽기와 갱신 사이에 다른 요청이 상태를 바꾸더라도 결과가 어긋나지 않도록 한 트랜잭션에서 처리합니다.
+        with transaction.atomic():
+            current = dict(User.objects.filter(pk__in=chunk).values_list('pk', 'is_active'))
+            to_change = [user_id for user_id, active in current.items() if active != is_active]
+            if to_change:
+                User.objects.filter(pk__in=to_change).update(is_active=is_active)
+                auth.invalidate_users(to_change)
+        for user_id, active in current.items():
+            results[user_id] = UNCHANGED if active == is_active else changed_result
+    return results
+
+
+def summarize(results):
+    """결과 dict 를 결과별 건수로 요약합니다."""
+    summary = dict.fromkeys((ACTIVATED, DEACTIVATED, UNCHANGED, NOT_FOUND, SELF), 0)
+    for result in results.values():
+        summary[result] += 1
+    return summary
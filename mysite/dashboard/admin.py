@@ -1,6 +1,7 @@
 from django.contrib import admin
 from django.utils.text import Truncator
-from .models import Post, Comment, Like, Bookmark, Category
+from django.utils import timezone
+from .models import Post, Comment, Like, Bookmark, Category, OutboxMessage
 
 @admin.register(Category)
 class CategoryAdmin(admin.ModelAdmin):
@@ -11,10 +12,12 @@ class CategoryAdmin(admin.ModelAdmin):
 @admin.register(Post)
 class PostAdmin(admin.ModelAdmin):
     """게시글 관리자 페이지 설정"""
-    list_display = ('title', 'author', 'category', 'created_at')
+    list_display = ('title', 'author', 'category', 'like_count', 'comment_count', 'created_at')
     list_filter = ('created_at', 'author', 'category')
     search_fields = ('title', 'content', 'author__username')
     raw_id_fields = ('author', 'category')
+    # 카운터는 시그널과 repair_post_counters 명령으로만 갱신됩니다.
+    readonly_fields = ('like_count', 'comment_count', 'bookmark_count')
     date_hierarchy = 'created_at'
 
 @admin.register(Comment)
@@ -48,3 +51,21 @@ class BookmarkAdmin(admin.ModelAdmin):
     search_fields = ('post__title', 'user__username')
     raw_id_fields = ('post', 'user')
     date_hierarchy = 'created_at'
+
+
+@admin.register(OutboxMessage)
+class OutboxMessageAdmin(admin.ModelAdmin):
+    """이메일 발송 대기열 관리자 페이지 설정"""
+    list_display = ('subject', 'recipients', 'status', 'attempts', 'next_attempt_at', 'sent_at', 'created_at')
+    list_filter = ('status', 'created_at')
+    search_fields = ('subject', 'recipients')
+    readonly_fields = ('payload', 'claim_token', 'claimed_at', 'last_error', 'created_at', 'sent_at')
+    date_hierarchy = 'created_at'
+    actions = ['retry_now']
+
+    @admin.action(description='선택한 메시지를 즉시 다시 발송 대기열에 넣기')
+    def retry_now(self, request, queryset):
+        updated = queryset.exclude(status=OutboxMessage.SENT).update(
+            status=OutboxMessage.PENDING, attempts=0, next_attempt_at=timezone.now(), claim_token='',
+        )
+        self.message_user(request, f'{updated}건을 다시 발송 대기열에 넣었습니다.')
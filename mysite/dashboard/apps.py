@@ -4,3 +4,11 @@ from django.apps import AppConfig
 class DashboardConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'dashboard'
+
+    def ready(self):
+        # 모델 변경 시그널 핸들러를 등록합니다.
+        from . import signals  # noqa: F401
+        # 시스템 체크를 등록합니다.
+        from . import checks  # noqa: F401
+        # 이후에 열리는 모든 DB 연결에 쿼리 측정 훅을 등록합니다.
+        from . import profiling  # noqa: F401
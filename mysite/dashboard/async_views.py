@@ -0,0 +1,239 @@
+"""
+읽기 위주 뷰의 async 버전 (ASGI 배포용).
+
+settings.DASHBOARD_ASYNC_VIEWS 가 켜져 있으면 dashboard/urls.py 가 같은 URL 이름으로
+이 모듈의 뷰를 연결합니다. 조회는 Django 의 async ORM (acount, aget, async for) 으로 하고,
+템플릿 렌더링처럼 request.user / 세션을 지연 평가할 수 있는 작업만 sync_to_async 로 넘깁니다.
+
+Django 의 async ORM 은 쿼리 자체를 요청 전용 동기 스레드에서 차례로 실행하므로
+asyncio.gather 가 쿼리를 DB 에서 병렬로 돌려 주지는 않습니다. 대신 쿼리를 기다리는 동안
+이벤트 루프가 다른 연결을 처리할 수 있어, 워커 하나가 훨씬 많은 동시 연결을 감당합니다.
+"""
+import asyncio
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.contrib.auth.decorators import login_required
+from django.contrib.auth.models import User
+from django.core.paginator import Paginator
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import aget_object_or_404, render
+from django.template.loader import render_to_string
+from django.utils import timezone
+from django.views.decorators.http import require_POST
+
+from . import caching, categories, live, views
+from .forms import CommentForm
+from .models import DashboardStats, Like, Post
+from .pagination import CursorPaginator
+from .routers import read_from_replica
+from .search import filter_users
+from .views import (
+    MAU_CACHE_TIMEOUT, POST_LIST_ORDERING, USER_LIST_ORDERING, _attach_user_state, _chart_response,
+    _comment_cache_parts, _comment_paginator, _dashboard_context, _mau_chart, _mau_querysets, _post_detail_queryset,
+    _post_list_queryset, _post_list_states_queryset, _recent_querysets, _user_state_queryset, _user_states_of,
+    cacheable_page, staff_member_required,
+)
+
+
+async def _render(request, template_name, context):
+    # 로그인 데코레이터가 auser() 로 읽어 둔 사용자를 request.user 에 넣어 템플릿에서 다시 조회하지 않게 하고,
+    # messages 처럼 세션을 지연 평가하는 값이 있으므로 렌더링은 동기 스레드에서 합니다.
+    request.user = await request.auser()
+    return await sync_to_async(render)(request, template_name, context)
+
+
+async def apaginate(request, queryset, ordering, per_page):
+    """
+    views.paginate 의 async 버전.
+    """
+    cursor = request.GET.get('cursor')
+    if cursor is not None or getattr(settings, 'DASHBOARD_CURSOR_PAGINATION', False):
+        return await CursorPaginator(queryset, ordering, per_page).apage(cursor)
+    paginator = Paginator(queryset.order_by(*ordering), per_page)
+    # Paginator.count 는 동기 COUNT(*) 를 실행하므로 acount() 결과로 미리 채워 둡니다.
+    paginator.count = await queryset.acount()
+    page = paginator.get_page(request.GET.get('page'))
+    page.object_list = [obj async for obj in page.object_list]
+    return page
+
+
+async def _amau_count(current_date):
+    return await _mau_querysets(current_date)[0].acount()
+
+
+async def _amau_chart_data(current_date):
+    rows = [row async for row in _mau_querysets(current_date)[1]]
+    return _mau_chart(current_date, rows)
+
+
+async def _arecent():
+    users, posts = _recent_querysets()
+    return [user async for user in users], [post async for post in posts]
+
+
+@staff_member_required
+@read_from_replica
+async def dashboard_view(request):
+    """
+    views.dashboard_view 의 async 버전. 서로 독립적인 요약 조회를 asyncio.gather 로 함께 기다립니다.
+    """
+    current_date = timezone.localdate()
+    users, stats, mau_count, recent = await asyncio.gather(
+        apaginate(request, User.objects.all(), USER_LIST_ORDERING, 10),
+        DashboardStats.aload(),
+        caching.aget_or_set(
+            [caching.DASHBOARD], ('mau_count', current_date), lambda: _amau_count(current_date),
+            timeout=MAU_CACHE_TIMEOUT,
+        ),
+        caching.aget_or_set([caching.DASHBOARD], ('recent',), _arecent),
+    )
+    context = _dashboard_context(users, stats, mau_count, recent)
+    return await _render(request, 'dashboard/dashboard.html', context)
+
+
+@staff_member_required
+@read_from_replica
+async def chart_data_view(request):
+    """
+    views.chart_data_view 의 async 버전.
+    """
+    current_date = timezone.localdate()
+    stats, mau_chart = await asyncio.gather(
+        DashboardStats.aload(),
+        caching.aget_or_set(
+            [caching.DASHBOARD], ('mau_chart', current_date), lambda: _amau_chart_data(current_date),
+            timeout=MAU_CACHE_TIMEOUT,
+        ),
+    )
+    return _chart_response(request, stats, mau_chart)
+
+
+@staff_member_required
+@read_from_replica
+async def user_list_partial(request):
+    """
+    views.user_list_partial 의 async 버전.
+    """
+    search_query = request.GET.get('search', '')
+    user_list = User.objects.all()
+    if search_query:
+        user_list = filter_users(user_list, search_query)
+    users = await apaginate(request, user_list, USER_LIST_ORDERING, 10)
+    return await _render(request, 'dashboard/_user_list.html', {'users': users})
+
+
+@login_required
+async def post_list_view(request):
+    """
+    views.post_list_view 의 async 버전.
+    """
+    user = await request.auser()
+
+    loaded_states = None
+
+    async def load_page():
+        nonlocal loaded_states
+        page_obj = await apaginate(request, _post_list_queryset(user), POST_LIST_ORDERING, 10)
+        page_obj.object_list = await categories.aattach(page_obj.object_list)
+        loaded_states = _user_states_of(page_obj.object_list)
+        return cacheable_page(page_obj)
+
+    async def load_states():
+        if loaded_states is not None or not post_ids:
+            return loaded_states or {}
+        return {pk: (liked, bookmarked) async for pk, liked, bookmarked in _post_list_states_queryset(post_ids, user)}
+
+    page_obj = await caching.aget_or_set(
+        [caching.BOARD, caching.POST_LIST], ('post_list', request.GET.get('page'), request.GET.get('cursor')), load_page,
+    )
+    post_ids = [post.pk for post in page_obj.object_list]
+    states = await caching.aget_or_set(
+        [caching.user_namespace(user.pk)], ('post_list_state', user.pk, *post_ids), load_states,
+    )
+    _attach_user_state(page_obj.object_list, states)
+    post_list_html = render_to_string('dashboard/_post_list_items.html', {'page_obj': page_obj})
+    return await _render(request, 'dashboard/post_list.html', {'post_list_html': post_list_html})
+
+
+async def _aget_cached_post(pk):
+    async def load():
+        post = await aget_object_or_404(_post_detail_queryset(), pk=pk)
+        return (await categories.aattach([post]))[0]
+
+    return await caching.aget_or_set([caching.BOARD, caching.post_namespace(pk)], ('post', pk), load)
+
+
+async def _arender_comments(post_id, cursor=None):
+    paginator = _comment_paginator(post_id)
+    cache_parts, is_first_page = _comment_cache_parts(paginator, post_id, cursor)
+
+    async def render_page():
+        return render_to_string('dashboard/_comment_list.html', {
+            'comments': await paginator.apage(cursor),
+            'post_id': post_id,
+            'is_first_page': is_first_page,
+        })
+
+    namespaces = [caching.BOARD, caching.post_namespace(post_id)]
+    return await caching.aget_or_set(namespaces, cache_parts, render_page)
+
+
+@login_required
+async def post_detail_view(request, pk):
+    """
+    views.post_detail_view 의 async 버전. 댓글 작성(POST)은 동기 뷰에 그대로 맡깁니다.
+    """
+    if request.method == 'POST':
+        return await sync_to_async(views.post_detail_view)(request, pk)
+
+    post = await _aget_cached_post(pk)
+    user = await request.auser()
+
+    async def user_state():
+        return await _user_state_queryset(pk, user).afirst() or (False, False)
+
+    comments_html, (liked, bookmarked) = await asyncio.gather(
+        _arender_comments(post.pk),
+        caching.aget_or_set([caching.post_namespace(pk)], ('user_state', pk, user.pk), user_state),
+    )
+    context = {
+        'post': post,
+        'comments_html': comments_html,
+        'comment_form': CommentForm(),
+        'like_count': post.like_count,
+        'user_has_liked': liked,
+        'user_has_bookmarked': bookmarked,
+    }
+    return await _render(request, 'dashboard/post_detail.html', context)
+
+
+@login_required
+@require_POST
+async def toggle_like_view(request, pk):
+    """
+    views.toggle_like_view 의 async 버전.
+    """
+    user = await request.auser()
+    # Like.toggle 은 한 트랜잭션 안에서 여러 쿼리를 실행하는데, async ORM 은 트랜잭션을
+    # 지원하지 않으므로 동기 스레드에서 실행합니다.
+    try:
+        is_liked, like_count = await sync_to_async(Like.toggle)(pk, user)
+    except Post.DoesNotExist:
+        raise Http404('게시글을 찾을 수 없습니다.')
+    return JsonResponse({'is_liked': is_liked, 'like_count': like_count})
+
+
+@login_required
+async def post_events_view(request, pk):
+    """
+    게시글의 좋아요 수 변화와 새 댓글을 Server-Sent Events 로 보내는 뷰.
+    연결을 오래 유지하므로 ASGI(DASHBOARD_ASYNC_VIEWS)에서만 연결됩니다. WSGI 에서는 views.post_events_view 를 씁니다.
+    """
+    if not await Post.objects.filter(pk=pk).aexists():
+        raise Http404('게시글을 찾을 수 없습니다.')
+    response = StreamingHttpResponse(live.event_stream(pk), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    # nginx 같은 프록시가 응답을 모아 두지 않고 바로 흘려보내도록 합니다.
+    response['X-Accel-Buffering'] = 'no'
+    return response
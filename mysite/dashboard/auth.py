@@ -0,0 +1,64 @@
+"""
+로그인한 사용자 조회 캐시.
+
+AuthenticationMiddleware 는 요청마다 세션의 사용자 id 로 auth_user 를 한 번 조회합니다.
+CachedModelBackend 는 그 결과를 settings.DASHBOARD_AUTH_USER_CACHE_TIMEOUT 초 동안 캐시합니다.
+워커끼리 공유하는 캐시(DASHBOARD_CACHE_DIR)를 쓰면 세션도 cached_db 엔진으로 캐시에서 읽으므로,
+캐시가 데워진 뒤에는 login_required 뷰가 뷰 자체의 쿼리 외에 쿼리를 하나도 실행하지 않습니다.
+
+User 를 저장하거나 삭제하면 시그널(dashboard/signals.py)이 캐시를 지웁니다.
+QuerySet.update() 처럼 시그널을 보내지 않는 변경은 invalidate_users() 를 직접 호출해야 합니다.
+(예: accounts.set_users_active) 따라서 비활성화된 사용자는 다음 요청에서 바로 거부됩니다.
+프로세스별 로컬 메모리 캐시에서는 무효화가 다른 워커에 전달되지 않으므로 settings 의 기본값이
+TTL 0(캐시하지 않음)이며, 직접 켜면 시스템 체크가 경고합니다. (dashboard/checks.py)
+"""
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core.cache import cache
+from django.db import transaction
+
+from . import caching
+
+KEY_PREFIX = f'{caching.KEY_PREFIX}:auth_user:'
+
+
+def _key(user_id):
+    return f'{KEY_PREFIX}{user_id}'
+
+
+def invalidate_users(user_ids):
+    """
+    사용자 캐시를 지웁니다. 트랜잭션 안이라면 커밋 후에 한 번 더 지워,
+    커밋 전에 다른 요청이 예전 값을 다시 캐시했더라도 버려지게 합니다.
+    """
+    keys = [_key(user_id) for user_id in user_ids]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+class CachedModelBackend(ModelBackend):
+    """get_user() 결과를 짧은 시간 캐시하는 ModelBackend."""
+
+    def get_user(self, user_id):
+        timeout = getattr(settings, 'DASHBOARD_AUTH_USER_CACHE_TIMEOUT', 0)
+        if not timeout:
+            return super().get_user(user_id)
+        key = _key(user_id)
+        user = cache.get(key)
+        if user is None:
+            user = super().get_user(user_id)
+            # 없는 사용자나 비활성 사용자(None)는 캐시하지 않습니다.
+            if user is not None:
+                cache.set(key, user, timeout)
+        return user
+
+    async def aget_user(self, user_id):
+        """get_user 의 async 버전. 캐시 적중 시 동기 스레드로 넘어가지 않습니다."""
+        if getattr(settings, 'DASHBOARD_AUTH_USER_CACHE_TIMEOUT', 0):
+            user = await cache.aget(_key(user_id))
+            if user is not None:
+                return user
+        return await super().aget_user(user_id)
@@ -0,0 +1,258 @@
+"""
+게시판/대시보드 부하 측정기.
+
+게시판 목록, 게시글 상세, 좋아요 토글, 관리자 대시보드 URL 을 여러 스레드에서 반복 요청하고
+지연 시간 백분위(p50/p95/p99), 처리량, 요청당 쿼리 수를 JSON 으로 정리합니다.
+커밋 전후 결과를 diff 하기 쉽도록 키 순서와 반올림을 고정합니다.
+
+모드
+    client  django.test.Client 로 같은 프로세스 안에서 WSGI 핸들러를 바로 호출합니다.
+    wsgi    wsgiref 기반의 스레드 서버를 로컬 포트에 띄우고 실제 HTTP 로 요청합니다.
+
+요청당 쿼리 수는 profiling.QueryProfilingMiddleware 가 URL 이름별로 누적한 값에서 구합니다.
+"""
+import random
+import threading
+import time
+import urllib.error
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from socketserver import ThreadingMixIn
+from wsgiref.simple_server import WSGIRequestHandler, WSGIServer, make_server
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.wsgi import get_wsgi_application
+from django.db import connections
+from django.test import Client
+from django.urls import reverse
+from django.utils.crypto import get_random_string
+
+from .models import Post
+from .profiling import registry
+
+SCENARIOS = ('board', 'detail', 'like', 'dashboard')
+# 시나리오 -> 프로파일링 레지스트리의 URL 이름
+SCENARIO_VIEWS = {
+    'board': 'dashboard:post_list',
+    'detail': 'dashboard:post_detail',
+    'like': 'dashboard:toggle_like',
+    'dashboard': 'dashboard:dashboard',
+}
+PERCENTILES = (50, 95, 99)
+
+
+class BenchmarkError(Exception):
+    """측정을 시작할 수 없을 때 발생합니다. (사용자나 게시글이 없는 경우 등)"""
+
+
+def benchmark_host():
+    """요청에 쓸 Host 헤더. ALLOWED_HOSTS 에 적힌 첫 번째 일반 호스트, 없으면 DEBUG 에서 허용되는 localhost."""
+    for host in settings.ALLOWED_HOSTS:
+        if host != '*' and not host.startswith('.'):
+            return host
+    return 'localhost'
+
+
+def percentile(sorted_values, pct):
+    """정렬된 값 목록의 nearest-rank 백분위 값."""
+    if not sorted_values:
+        return None
+    rank = max(1, -(-pct * len(sorted_values) // 100))
+    return sorted_values[rank - 1]
+
+
+def build_plan(scenarios, requests, post_ids, seed=0):
+    """
+    (시나리오, method, path) 요청 목록을 만듭니다.
+    시나리오마다 requests 건씩, 같은 seed 면 같은 순서와 같은 게시글로 구성됩니다.
+    """
+    rng = random.Random(seed)
+    board_pages = max(1, len(post_ids) // 10)
+    plan = []
+    for scenario in scenarios:
+        for _ in range(requests):
+            if scenario == 'board':
+                page = rng.randint(1, min(board_pages, 20))
+                plan.append((scenario, 'GET', f"{reverse('dashboard:post_list')}?page={page}"))
+            elif scenario == 'detail':
+                plan.append((scenario, 'GET', reverse('dashboard:post_detail', args=[rng.choice(post_ids)])))
+            elif scenario == 'like':
+                plan.append((scenario, 'POST', reverse('dashboard:toggle_like', args=[rng.choice(post_ids)])))
+            elif scenario == 'dashboard':
+                plan.append((scenario, 'GET', reverse('dashboard:dashboard')))
+            else:
+                raise BenchmarkError(f'알 수 없는 시나리오: {scenario}')
+    rng.shuffle(plan)
+    return plan
+
+
+class ClientTransport:
+    """django.test.Client 로 요청합니다. 스레드마다 별도의 Client(세션)를 씁니다."""
+
+    def __init__(self, user):
+        self.user = user
+        self._local = threading.local()
+
+    def _client(self):
+        client = getattr(self._local, 'client', None)
+        if client is None:
+            client = Client(HTTP_HOST=benchmark_host())
+            client.force_login(self.user)
+            self._local.client = client
+        return client
+
+    def request(self, method, path):
+        client = self._client()
+        response = client.post(path) if method == 'POST' else client.get(path)
+        # 스트리밍 응답도 끝까지 읽어야 렌더링 시간까지 포함됩니다.
+        if response.streaming:
+            b''.join(response.streaming_content)
+        return response.status_code
+
+    def close(self):
+        pass
+
+
+class _ThreadingWSGIServer(ThreadingMixIn, WSGIServer):
+    daemon_threads = True
+
+
+class _QuietHandler(WSGIRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class _NoRedirect(urllib.request.HTTPRedirectHandler):
+    # 리디렉션(로그인 페이지 등)을 따라가지 않고 그대로 상태 코드로 기록합니다.
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class WSGITransport:
+    """
+    로컬 포트에 스레드 WSGI 서버를 띄우고 urllib 로 요청합니다.
+    로그인 세션과 CSRF 쿠키는 미리 만들어 모든 요청에 붙입니다.
+    """
+
+    def __init__(self, user):
+        login = Client(HTTP_HOST=benchmark_host())
+        login.force_login(user)
+        self.csrf_token = get_random_string(32)
+        self.cookie = (
+            f'{settings.SESSION_COOKIE_NAME}={login.cookies[settings.SESSION_COOKIE_NAME].value}; '
+            f'{settings.CSRF_COOKIE_NAME}={self.csrf_token}'
+        )
+        self.server = make_server(
+            '127.0.0.1', 0, get_wsgi_application(),
+            server_class=_ThreadingWSGIServer, handler_class=_QuietHandler,
+        )
+        self.host = benchmark_host()
+        self.base_url = f'http://127.0.0.1:{self.server.server_port}'
+        self._thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+        self._thread.start()
+        self._opener = urllib.request.build_opener(_NoRedirect)
+
+    def request(self, method, path):
+        headers = {'Cookie': self.cookie, 'Host': self.host}
+        data = None
+        if method == 'POST':
+            headers['X-CSRFToken'] = self.csrf_token
+            data = b''
+        request = urllib.request.Request(self.base_url + path, data=data, headers=headers, method=method)
+        try:
+            with self._opener.open(request, timeout=30) as response:
+                response.read()
+                return response.status
+        except urllib.error.HTTPError as exc:
+            return exc.code
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+TRANSPORTS = {'client': ClientTransport, 'wsgi': WSGITransport}
+
+
+def _summarize(samples, elapsed, queries):
+    latencies = sorted(latency for latency, _ in samples)
+    errors = sum(1 for _, status in samples if status >= 400)
+    summary = {
+        'requests': len(samples),
+        'errors': errors,
+        'throughput_rps': round(len(samples) / elapsed, 2) if elapsed else None,
+        'mean_ms': round(sum(latencies) / len(latencies) * 1000, 3) if latencies else None,
+    }
+    for pct in PERCENTILES:
+        value = percentile(latencies, pct)
+        summary[f'p{pct}_ms'] = round(value * 1000, 3) if value is not None else None
+    summary['queries_per_request'] = queries
+    return summary
+
+
+def run(scenarios=SCENARIOS, requests=100, concurrency=4, mode='client', username=None, seed=0, warmup=0):
+    """
+    측정을 실행하고 결과 dict 를 반환합니다.
+    username 이 없으면 첫 번째 활성 관리자 계정으로 요청합니다. (대시보드는 관리자 전용)
+    """
+    if mode not in TRANSPORTS:
+        raise BenchmarkError(f'알 수 없는 모드: {mode}')
+    users = User.objects.filter(is_active=True)
+    user = users.filter(username=username).first() if username else users.filter(is_staff=True).order_by('pk').first()
+    if user is None:
+        raise BenchmarkError('요청에 사용할 활성 사용자(기본값: 관리자)가 없습니다.')
+    post_ids = list(Post.objects.order_by('pk').values_list('pk', flat=True))
+    if not post_ids and {'detail', 'like'} & set(scenarios):
+        raise BenchmarkError('게시글이 없습니다. 먼저 seed_data 명령으로 데이터를 만들어 주세요.')
+
+    transport = TRANSPORTS[mode](user)
+    plan = build_plan(scenarios, requests, post_ids, seed=seed)
+    samples = defaultdict(list)
+    lock = threading.Lock()
+
+    def send(item):
+        scenario, method, path = item
+        start = time.perf_counter()
+        status = transport.request(method, path)
+        latency = time.perf_counter() - start
+        with lock:
+            samples[scenario].append((latency, status))
+
+    try:
+        for item in build_plan(scenarios, warmup, post_ids, seed=seed + 1):
+            transport.request(item[1], item[2])
+        samples.clear()
+        registry.reset()
+
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            for future in [executor.submit(send, item) for item in plan]:
+                future.result()
+        elapsed = time.perf_counter() - start
+    finally:
+        transport.close()
+
+    snapshot = registry.snapshot()
+    results = {}
+    all_samples = []
+    total_queries = total_requests = 0
+    for scenario in scenarios:
+        view = snapshot.get(SCENARIO_VIEWS[scenario], {'queries': 0, 'requests': 0})
+        queries = round(view['queries'] / view['requests'], 2) if view['requests'] else None
+        results[scenario] = _summarize(samples[scenario], elapsed, queries)
+        all_samples.extend(samples[scenario])
+        total_queries += view['queries']
+        total_requests += view['requests']
+    return {
+        'config': {
+            'mode': mode, 'scenarios': list(scenarios), 'requests_per_scenario': requests,
+            'concurrency': concurrency, 'seed': seed, 'warmup': warmup,
+            'database': connections['default'].vendor,
+            'posts': len(post_ids),
+        },
+        'elapsed_seconds': round(elapsed, 3),
+        'total': _summarize(all_samples, elapsed, round(total_queries / total_requests, 2) if total_requests else None),
+        'scenarios': results,
+    }
@@ -0,0 +1,165 @@
+"""
+읽기 전용 뷰를 위한 캐시 계층.
+
+렌더링된 HTML 조각이나 조회 결과를 Django 캐시 프레임워크에 저장합니다.
+캐시 키에는 "네임스페이스 버전" 이 포함되며, 모델 변경 시그널이 관련 네임스페이스의
+버전을 올리는 방식으로 무효화합니다. 예전 버전의 항목은 더 이상 조회되지 않고
+캐시 백엔드의 LRU 정리(cull) 에 의해 자연스럽게 밀려납니다.
+
+네임스페이스
+    board       게시판 전체 (카테고리 이름 변경 등 모든 게시판 화면에 영향을 주는 변경)
+    post_list   게시글 목록 페이지
+    post:<pk>   게시글 한 건의 상세 화면 (본문, 댓글, 좋아요)
+    user:<pk>   사용자 한 명에게만 보이는 값 (게시글 목록의 좋아요/북마크 표시)
+    dashboard   관리자 대시보드의 최근 가입자/게시글 목록
+    categories  카테고리 목록 (값은 dashboard/categories.py 가 프로세스 메모리에 들고 있고 버전만 여기서 공유)
+"""
+import hashlib
+import threading
+import time
+from collections import Counter
+
+from django.core.cache import cache
+from django.core.cache.backends.base import DEFAULT_TIMEOUT
+from django.db import transaction
+
+BOARD = 'board'
+POST_LIST = 'post_list'
+DASHBOARD = 'dashboard'
+CATEGORIES = 'categories'
+
+KEY_PREFIX = 'dashboard'
+VERSION_KEY_PREFIX = f'{KEY_PREFIX}:version:'
+
+_MISSING = object()
+_stats = Counter()
+_stats_lock = threading.Lock()
+
+
+def post_namespace(post_id):
+    return f'post:{post_id}'
+
+
+def user_namespace(user_id):
+    return f'user:{user_id}'
+
+
+def _new_version():
+    # 버전 키가 캐시에서 밀려났다가 다시 만들어지더라도 예전 항목과 겹치지 않도록
+    # 1 부터 다시 세지 않고 현재 시각을 초기값으로 사용합니다.
+    return time.time_ns()
+
+
+def _versions(namespaces):
+    keys = [VERSION_KEY_PREFIX + namespace for namespace in namespaces]
+    found = cache.get_many(keys)
+    versions = []
+    for key in keys:
+        if key not in found:
+            cache.add(key, _new_version(), timeout=None)
+            found[key] = cache.get(key)
+        versions.append(found[key])
+    return versions
+
+
+async def _aversions(namespaces):
+    keys = [VERSION_KEY_PREFIX + namespace for namespace in namespaces]
+    found = await cache.aget_many(keys)
+    versions = []
+    for key in keys:
+        if key not in found:
+            await cache.aadd(key, _new_version(), timeout=None)
+            found[key] = await cache.aget(key)
+        versions.append(found[key])
+    return versions
+
+
+def _key(versions, parts):
+    versions = ','.join(str(version) for version in versions)
+    raw = '|'.join(str(part) for part in parts)
+    digest = hashlib.md5(f'{versions}|{raw}'.encode()).hexdigest()
+    return f'{KEY_PREFIX}:{parts[0]}:{digest}'
+
+
+def version(namespace):
+    """네임스페이스의 현재 버전. 캐시 밖(프로세스 메모리)에 둔 값이 아직 유효한지 확인할 때 씁니다."""
+    return _versions([namespace])[0]
+
+
+async def aversion(namespace):
+    """version 의 async 버전."""
+    return (await _aversions([namespace]))[0]
+
+
+def make_key(namespaces, parts):
+    """네임스페이스들의 현재 버전과 parts 로 캐시 키를 만듭니다."""
+    return _key(_versions(namespaces), parts)
+
+
+def get_or_set(namespaces, parts, producer, timeout=DEFAULT_TIMEOUT):
+    """
+    캐시된 값을 반환하고, 없으면 producer() 의 결과를 저장한 뒤 반환합니다.
+    parts 의 첫 항목은 적중/실패 통계를 집계하는 이름으로도 사용됩니다.
+    """
+    key = make_key(namespaces, parts)
+    value = cache.get(key, _MISSING)
+    if value is _MISSING:
+        _record(parts[0], 'misses')
+        value = producer()
+        cache.set(key, value, timeout)
+    else:
+        _record(parts[0], 'hits')
+    return value
+
+
+async def aget_or_set(namespaces, parts, producer, timeout=DEFAULT_TIMEOUT):
+    """get_or_set 의 async 버전. producer 는 코루틴 함수여야 합니다."""
+    key = _key(await _aversions(namespaces), parts)
+    value = await cache.aget(key, _MISSING)
+    if value is _MISSING:
+        _record(parts[0], 'misses')
+        value = await producer()
+        await cache.aset(key, value, timeout)
+    else:
+        _record(parts[0], 'hits')
+    return value
+
+
+def invalidate(*namespaces):
+    """네임스페이스의 버전을 올려 그 안의 모든 캐시 항목을 무효화합니다."""
+    for namespace in namespaces:
+        key = VERSION_KEY_PREFIX + namespace
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, _new_version(), timeout=None)
+
+
+def invalidate_on_commit(*namespaces):
+    """
+    즉시 무효화하고, 트랜잭션 안이라면 커밋 후에도 한 번 더 무효화합니다.
+    커밋 전에 다른 요청이 예전 데이터를 다시 캐시하더라도 커밋 시점에 버려집니다.
+    """
+    invalidate(*namespaces)
+    if transaction.get_connection().in_atomic_block:
+        transaction.on_commit(lambda: invalidate(*namespaces))
+
+
+def _record(name, outcome):
+    with _stats_lock:
+        _stats[(name, outcome)] += 1
+
+
+def cache_stats():
+    """{이름: {'hits': n, 'misses': m}} 형태로 이 프로세스의 적중/실패 횟수를 반환합니다."""
+    with _stats_lock:
+        items = list(_stats.items())
+    result = {}
+    for (name, outcome), count in items:
+        result.setdefault(name, {'hits': 0, 'misses': 0})[outcome] = count
+    return result
+
+
+def reset_cache_stats():
+    with _stats_lock:
+        _stats.clear()
@@ -0,0 +1,92 @@
+"""
+카테고리 목록의 프로세스 로컬 캐시.
+
+카테고리는 거의 바뀌지 않지만 글쓰기 폼의 선택지와 검증, 글쓰기 전 존재 여부 확인,
+게시글 목록/상세/검색의 카테고리 이름 표시에 매번 필요합니다. 전체 목록을 프로세스 메모리에
+들고 있다가 caching.CATEGORIES 네임스페이스의 버전이 바뀐 경우에만 다시 읽습니다.
+버전은 Category 저장/삭제 시그널(dashboard/signals.py)이 올리며 Django 캐시에 저장되므로,
+워커끼리 공유하는 캐시(DASHBOARD_CACHE_DIR)를 쓰면 다른 워커에서의 변경도 반영됩니다.
+
+캐시된 Category 인스턴스는 여러 요청이 함께 쓰므로 수정하지 마세요.
+"""
+from asgiref.sync import sync_to_async
+
+from . import caching
+from .models import Category
+
+
+class _Snapshot:
+    def __init__(self, version, categories):
+        self.version = version
+        self.categories = categories
+        self.by_id = {category.pk: category for category in categories}
+
+
+_snapshot = None
+
+
+def _load(version):
+    global _snapshot
+    _snapshot = _Snapshot(version, tuple(Category.objects.order_by('pk')))
+    return _snapshot
+
+
+def snapshot():
+    current = _snapshot
+    version = caching.version(caching.CATEGORIES)
+    if current is not None and current.version == version:
+        return current
+    return _load(version)
+
+
+async def asnapshot():
+    """snapshot 의 async 버전."""
+    current = _snapshot
+    version = await caching.aversion(caching.CATEGORIES)
+    if current is not None and current.version == version:
+        return current
+    return await sync_to_async(_load)(version)
+
+
+def all_categories():
+    """모든 카테고리 (pk 순 튜플)."""
+    return snapshot().categories
+
+
+def get_category(pk):
+    """pk 에 해당하는 카테고리. 없으면 None."""
+    return snapshot().by_id.get(pk)
+
+
+def exists():
+    return bool(snapshot().categories)
+
+
+def _attach(snapshot, posts):
+    posts = list(posts)
+    for post in posts:
+        category = snapshot.by_id.get(post.category_id)
+        # 캐시에 없는 카테고리(방금 추가된 경우 등)는 그대로 두어 필요할 때 DB 에서 읽게 합니다.
+        if category is not None:
+            post.category = category
+    return posts
+
+
+def attach(posts):
+    """
+    게시글들의 category 를 캐시된 인스턴스로 채워 select_related('category') 조인 없이
+    post.category.name 을 쓸 수 있게 합니다. 게시글 목록을 반환합니다.
+    """
+    return _attach(snapshot(), posts)
+
+
+async def aattach(posts):
+    """attach 의 async 버전."""
+    return _attach(await asnapshot(), posts)
+
+
+def invalidate():
+    """이 프로세스의 목록을 버리고 버전을 올려 다른 워커도 다시 읽게 합니다."""
+    global _snapshot
+    _snapshot = None
+    caching.invalidate_on_commit(caching.CATEGORIES)
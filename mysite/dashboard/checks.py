@@ -0,0 +1,35 @@
+"""
+dashboard 앱의 시스템 체크.
+"""
+from django.conf import settings
+from django.core import checks
+
+# 프로세스마다 따로 두는 캐시. 워커가 여러 개라면 무효화가 다른 워커에 전달되지 않습니다.
+PROCESS_LOCAL_CACHES = {
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+}
+
+
+@checks.register(checks.Tags.caches)
+def check_auth_cache(app_configs, **kwargs):
+    """세션이나 로그인 사용자를 공유되지 않는 캐시에 두면 로그아웃/비활성화가 다른 워커에 늦게 반영됩니다."""
+    if settings.CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHES:
+        return []
+    errors = []
+    if settings.SESSION_ENGINE in ('django.contrib.sessions.backends.cache',
+                                   'django.contrib.sessions.backends.cached_db'):
+        errors.append(checks.Warning(
+            f'SESSION_ENGINE={settings.SESSION_ENGINE!r} 가 프로세스별 캐시를 사용합니다.',
+            hint='로그아웃한 세션이 다른 워커의 캐시에 남을 수 있습니다. '
+                 'DASHBOARD_CACHE_DIR 로 공유 캐시를 설정하거나 DB 세션을 사용하세요.',
+            id='dashboard.W001',
+        ))
+    if getattr(settings, 'DASHBOARD_AUTH_USER_CACHE_TIMEOUT', 0):
+        errors.append(checks.Warning(
+            'DASHBOARD_AUTH_USER_CACHE_TIMEOUT 이 프로세스별 캐시를 사용합니다.',
+            hint='비활성화된 사용자가 다른 워커에서 최대 TTL 동안 로그인 상태로 남을 수 있습니다. '
+                 'DASHBOARD_CACHE_DIR 로 공유 캐시를 설정하거나 0 으로 두세요.',
+            id='dashboard.W002',
+        ))
+    return errors
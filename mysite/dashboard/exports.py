@@ -0,0 +1,145 @@
+"""
+관리자용 데이터 내보내기 (CSV / NDJSON).
+
+응답은 StreamingHttpResponse 로 보내며 행은 QuerySet.values_list().iterator(chunk_size=...) 로
+chunk_size 개씩만 읽습니다. 모델 인스턴스를 만들지 않고 전체 결과를 메모리에 모으지도 않으므로
+행 수와 관계없이 메모리 사용량이 일정하고, 첫 묶음을 읽는 즉시 전송이 시작됩니다.
+
+행은 기본 키 순서로 내보냅니다. 기본 키 순서는 정렬 없이 테이블을 그대로 읽으면 되므로
+DB 쪽에서도 전체 결과를 모아 정렬하는 일이 생기지 않습니다.
+
+CSV 는 엑셀 등에서 열리므로 = + - @ (와 탭, CR)로 시작하는 문자열 값은 앞에 ' 를 붙여
+수식으로 실행되지 않게 합니다. (CSV injection) NDJSON 은 값을 그대로 내보냅니다.
+"""
+import csv
+import json
+from datetime import datetime, time, timedelta
+
+from django.contrib.auth.models import User
+from django.utils import timezone
+
+from .models import Comment, Like, Post
+
+# DB 에서 한 번에 가져올 행 수
+EXPORT_CHUNK_SIZE = 2000
+# 응답으로 한 번에 흘려보낼 크기. 행마다 yield 하면 WSGI 서버의 쓰기 호출이 너무 잦아집니다.
+EXPORT_FLUSH_BYTES = 64 * 1024
+
+# 내보내기 이름 -> (모델, 내보낼 필드, 기간 필터에 쓸 필드)
+EXPORTS = {
+    'users': (User, (
+        'id', 'username', 'email', 'first_name', 'last_name', 'is_active', 'is_staff', 'date_joined', 'last_login',
+    ), 'date_joined'),
+    'posts': (Post, (
+        'id', 'author_id', 'author__username', 'category__name', 'title', 'content', 'created_at',
+        'like_count', 'comment_count', 'bookmark_count',
+    ), 'created_at'),
+    'comments': (Comment, ('id', 'post_id', 'author_id', 'author__username', 'content', 'created_at'), 'created_at'),
+    'likes': (Like, ('id', 'post_id', 'user_id', 'created_at'), 'created_at'),
+}
+# 스프레드시트가 수식으로 해석하는 첫 글자
+CSV_FORMULA_PREFIXES = ('=', '+', '-', '@', '\t', '\r')
+FORMATS = {
+    'csv': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+}
+
+
+class ExportError(ValueError):
+    """내보내기 요청이 올바르지 않을 때 발생합니다. (알 수 없는 이름, 잘못된 날짜 등)"""
+
+
+def parse_date_range(since=None, until=None):
+    """
+    'YYYY-MM-DD' 형식의 since/until 을 [시작 시각, 끝 시각) 으로 바꿉니다. until 은 그 날짜를 포함합니다.
+    """
+    bounds = []
+    for name, value, offset in (('since', since, 0), ('until', until, 1)):
+        if not value:
+            bounds.append(None)
+            continue
+        try:
+            day = datetime.strptime(value, '%Y-%m-%d').date() + timedelta(days=offset)
+        except ValueError:
+            raise ExportError(f'{name} 는 YYYY-MM-DD 형식이어야 합니다: {value!r}')
+        bounds.append(timezone.make_aware(datetime.combine(day, time.min)))
+    start, end = bounds
+    if start and end and start >= end:
+        raise ExportError('since 는 until 보다 이전 날짜여야 합니다.')
+    return start, end
+
+
+def export_queryset(name, start=None, end=None):
+    """내보낼 (필드 목록, values_list 쿼리셋) 을 반환합니다."""
+    try:
+        model, fields, date_field = EXPORTS[name]
+    except KeyError:
+        raise ExportError(f'알 수 없는 내보내기: {name}')
+    queryset = model.objects.all()
+    if start is not None:
+        queryset = queryset.filter(**{f'{date_field}__gte': start})
+    if end is not None:
+        queryset = queryset.filter(**{f'{date_field}__lt': end})
+    return fields, queryset.order_by('pk').values_list(*fields)
+
+
+def _value(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return value
+
+
+def _csv_value(value):
+    value = _value(value)
+    if isinstance(value, str) and value.startswith(CSV_FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+class _LineBuffer:
+    """csv.writer 가 쓴 줄을 모아 두는 버퍼."""
+
+    def __init__(self):
+        self.parts = []
+        self.size = 0
+
+    def write(self, value):
+        self.parts.append(value)
+        self.size += len(value)
+
+    def flush(self):
+        data, self.parts, self.size = ''.join(self.parts), [], 0
+        return data
+
+
+def _stream_rows(rows, buffer, write_row, chunk_size):
+    for row in rows.iterator(chunk_size=chunk_size):
+        write_row(row)
+        if buffer.size >= EXPORT_FLUSH_BYTES:
+            yield buffer.flush()
+    if buffer.size:
+        yield buffer.flush()
+
+
+def stream_csv(fields, rows, chunk_size=EXPORT_CHUNK_SIZE):
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer)
+    # 엑셀에서 한글이 깨지지 않도록 UTF-8 BOM 으로 시작합니다.
+    buffer.write('\ufeff')
+    writer.writerow(fields)
+    # 헤더는 쿼리를 실행하기 전에 바로 보내 클라이언트가 즉시 응답을 받기 시작하게 합니다.
+    yield buffer.flush()
+    yield from _stream_rows(rows, buffer, lambda row: writer.writerow([_csv_value(value) for value in row]), chunk_size)
+
+
+def stream_ndjson(fields, rows, chunk_size=EXPORT_CHUNK_SIZE):
+    buffer = _LineBuffer()
+
+    def write_row(row):
+        record = {field: _value(value) for field, value in zip(fields, row)}
+        buffer.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+    yield from _stream_rows(rows, buffer, write_row, chunk_size)
+
+
+STREAMERS = {'csv': stream_csv, 'ndjson': stream_ndjson}
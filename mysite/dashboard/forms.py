@@ -1,6 +1,9 @@
 from django import forms
 from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.forms.models import ModelChoiceIterator
 from django.utils.translation import gettext_lazy as _
+from . import categories
 from .models import Post, Comment, Category
 
 
@@ -19,10 +22,56 @@ class UserProfileForm(forms.ModelForm):
         self.fields['last_name'].label = _("Last name")
 
 
+class _CachedCategoryIterator(ModelChoiceIterator):
+    """폼을 렌더링할 때 카테고리 캐시에서 선택지를 만듭니다."""
+
+    def __iter__(self):
+        if self.field.empty_label is not None:
+            yield ('', self.field.empty_label)
+        for category in categories.all_categories():
+            yield self.choice(category)
+
+    def __len__(self):
+        return len(categories.all_categories()) + (self.field.empty_label is not None)
+
+    def __bool__(self):
+        return self.field.empty_label is not None or categories.exists()
+
+
+class CategoryChoiceField(forms.ModelChoiceField):
+    """
+    선택지와 선택 값 변환에 dashboard/categories.py 의 캐시를 쓰는 ModelChoiceField.
+    폼을 만들거나 렌더링할 때 카테고리 테이블을 조회하지 않습니다.
+    다른 워커에서 방금 삭제된 카테고리가 캐시에 남아 있을 수 있으므로, 제출된 값의 존재 여부는
+    ModelForm 의 모델 검증(ForeignKey.validate)이 DB 에서 한 번 더 확인합니다.
+    """
+    iterator = _CachedCategoryIterator
+
+    def __init__(self, **kwargs):
+        super().__init__(queryset=Category.objects.none(), **kwargs)
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        if isinstance(value, Category):
+            value = value.pk
+        try:
+            category = categories.get_category(int(value))
+        except (TypeError, ValueError):
+            category = None
+        if category is None:
+            raise ValidationError(
+                self.error_messages['invalid_choice'], code='invalid_choice', params={'value': value},
+            )
+        return category
+
+
 class PostForm(forms.ModelForm):
     """
     A form for creating and editing posts.
     """
+    category = CategoryChoiceField()
+
     class Meta:
         model = Post
         fields = ['title', 'category', 'content']
@@ -35,7 +84,6 @@ class PostForm(forms.ModelForm):
         self.fields['title'].label = _("Title")
         self.fields['category'].label = _("Category")
         self.fields['content'].label = _("Content")
-        self.fields['category'].queryset = Category.objects.all()
         # 사용자가 카테고리를 선택하지 않고 폼을 제출하는 것을 방지하기 위해
         # 이 필드를 명시적으로 필수로 설정합니다.
         self.fields['category'].empty_label = _("카테고리를 선택해주세요")
@@ -0,0 +1,342 @@
+"""
+게시글/댓글 일괄 가져오기.
+
+JSONL(한 줄에 JSON 하나) 또는 CSV 파일을 한 줄씩 읽어 batch_size 개씩 묶고, 묶음마다 한
+트랜잭션 안에서 bulk_create 로 넣습니다. 파일 전체를 메모리에 올리지 않습니다.
+
+레코드 형식 (CSV 는 같은 이름의 열을 사용하며 빈 칸은 값이 없는 것으로 봅니다.)
+    {"type": "post", "author": "사용자명", "category": "카테고리", "title": "...", "content": "...",
+     "created_at": "2024-01-01T09:00:00+09:00", "ref": "외부 id"}
+    {"type": "comment", "author": "사용자명", "content": "...", "post": 123}
+    {"type": "comment", "author": "사용자명", "content": "...", "post_ref": "외부 id"}
+
+    created_at, ref 는 생략할 수 있습니다. 댓글은 기존 게시글 id(post) 또는 같은 파일에서 앞서
+    가져온 게시글의 ref(post_ref) 로 게시글을 가리킵니다.
+
+검증은 PostForm/CommentForm 과 같은 규칙(필드의 clean(), 카테고리 필수)을 따르지만 폼 인스턴스는
+만들지 않습니다. 작성자와 카테고리는 묶음 단위로 한 번에 조회한 뒤 캐시해 두고 다시 조회하지 않습니다.
+댓글이 가리킬 게시글 ref 는 LOOKUP_CACHE_SIZE 건까지 메모리에 두고, 넘으면 임시 SQLite 파일로 옮겨
+ref 가 수백만 개여도 메모리 사용량이 늘지 않습니다.
+통과하지 못한 줄은 건너뛰고 reject 콜백으로 (줄 번호, 사유, 원본 레코드) 를 넘깁니다.
+
+bulk_create 는 시그널을 보내지 않으므로 묶음마다 검색 색인, 게시글 카운터, DashboardStats 를
+직접 맞추고, 끝난 뒤 게시판/대시보드 캐시를 무효화합니다.
+"""
+import csv
+import json
+import sqlite3
+import time
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.dateparse import parse_datetime
+from django.utils import timezone
+
+from . import caching, categories as category_cache
+from .forms import CommentForm, PostForm
+from .models import Category, Comment, DashboardStats, Post
+from .search import get_backend
+
+DEFAULT_BATCH_SIZE = 2000
+# 작성자/게시글 id 캐시의 최대 크기. 넘으면 비우고 다시 채웁니다. (수백만 줄에서도 메모리를 제한)
+LOOKUP_CACHE_SIZE = 100000
+
+# 폼 인스턴스를 만들지 않고 폼 클래스의 필드 정의만 빌려 씁니다. (Field.clean 은 상태가 없습니다.)
+_POST_FIELDS = PostForm.base_fields
+_COMMENT_FIELDS = CommentForm.base_fields
+
+
+class RowError(ValueError):
+    """레코드 하나를 가져올 수 없을 때 발생합니다. 메시지가 거부 사유가 됩니다."""
+
+
+def read_jsonl(stream):
+    """(줄 번호, 레코드) 를 차례로 돌려줍니다. JSON 이 아닌 줄은 레코드 대신 RowError 를 돌려줍니다."""
+    for line_number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError as exc:
+            yield line_number, RowError(f'JSON 형식이 아닙니다: {exc}')
+            continue
+        yield line_number, record if isinstance(record, dict) else RowError('JSON 객체가 아닙니다.')
+
+
+def read_csv(stream):
+    """(줄 번호, 레코드) 를 차례로 돌려줍니다. 첫 줄은 열 이름이며 빈 칸은 생략된 값으로 봅니다."""
+    reader = csv.DictReader(stream)
+    for record in reader:
+        yield reader.line_num, {key: value for key, value in record.items() if key and value not in ('', None)}
+
+
+READERS = {'jsonl': read_jsonl, 'csv': read_csv}
+
+
+def _clean(fields, name, value):
+    try:
+        return fields[name].clean(value)
+    except ValidationError as exc:
+        raise RowError(f'{name}: {" ".join(exc.messages)}')
+
+
+def _clean_created_at(record):
+    value = record.get('created_at')
+    if value in (None, ''):
+        return None
+    created_at = parse_datetime(str(value)) if not isinstance(value, (int, float)) else None
+    if created_at is None:
+        raise RowError(f'created_at: 날짜/시간 형식이 아닙니다: {value!r}')
+    if timezone.is_naive(created_at):
+        created_at = timezone.make_aware(created_at)
+    return created_at
+
+
+def _text(record, name):
+    value = record.get(name)
+    return '' if value is None else str(value).strip()
+
+
+class _BoundedCache(dict):
+    """크기가 limit 를 넘으면 통째로 비우는 단순한 조회 캐시."""
+
+    def __init__(self, limit):
+        super().__init__()
+        self.limit = limit
+
+    def missing(self, keys):
+        """keys 중 캐시에 없는 것. 모두 넣으면 limit 를 넘는 경우 캐시를 비우고 keys 전체를 돌려줍니다."""
+        missing = keys - self.keys()
+        if len(self) + len(missing) > self.limit:
+            self.clear()
+            missing = set(keys)
+        return missing
+
+
+class _RefMap:
+    """
+    게시글 ref -> id. limit 건까지는 메모리에 두고, 넘으면 모두 임시 SQLite 파일로 옮깁니다.
+    임시 파일은 close() 할 때 SQLite 가 지웁니다.
+    """
+
+    def __init__(self, limit):
+        self.limit = limit
+        self._memory = {}
+        self._spilled = None
+
+    def __contains__(self, ref):
+        return self.get(ref) is not None
+
+    def get(self, ref):
+        post_id = self._memory.get(ref)
+        if post_id is None and self._spilled is not None:
+            row = self._spilled.execute('SELECT post_id FROM refs WHERE ref = ?', (ref,)).fetchone()
+            post_id = row[0] if row else None
+        return post_id
+
+    def update(self, refs):
+        self._memory.update(refs)
+        if len(self._memory) > self.limit:
+            self._spill()
+
+    def _spill(self):
+        if self._spilled is None:
+            # 빈 파일 이름은 연결마다 따로 만들어지고 닫으면 지워지는 임시 DB 입니다.
+            self._spilled = sqlite3.connect('')
+            self._spilled.execute('CREATE TABLE refs (ref TEXT PRIMARY KEY, post_id INTEGER NOT NULL)')
+        with self._spilled:
+            self._spilled.executemany('INSERT INTO refs (ref, post_id) VALUES (?, ?)', self._memory.items())
+        self._memory.clear()
+
+    def close(self):
+        self._memory.clear()
+        if self._spilled is not None:
+            self._spilled.close()
+            self._spilled = None
+
+
+class Importer:
+    """
+    레코드를 묶음 단위로 검증하고 넣습니다. run() 은 {'read', 'posts', 'comments', 'rejected'} 건수를 반환합니다.
+
+    create_categories 가 켜져 있으면 없는 카테고리를 만들고, 꺼져 있으면 그 줄을 거부합니다.
+    index 를 끄면 검색 색인을 건너뜁니다. (나중에 rebuild_search_index 로 한 번에 만드는 편이 빠릅니다.)
+    """
+
+    def __init__(self, batch_size=DEFAULT_BATCH_SIZE, create_categories=False, index=True, log=None, reject=None):
+        self.batch_size = batch_size
+        self.create_categories = create_categories
+        self.index = index
+        self.log = log or (lambda message: None)
+        self.reject = reject or (lambda line_number, reason, record: None)
+        self.counts = {'read': 0, 'posts': 0, 'comments': 0, 'rejected': 0}
+        # 사용자명 -> 사용자 id (없는 사용자는 None)
+        self.authors = _BoundedCache(LOOKUP_CACHE_SIZE)
+        # 존재하는 게시글 id
+        self.post_ids = _BoundedCache(LOOKUP_CACHE_SIZE)
+        # 게시글 ref -> 가져온 게시글 id. 댓글이 나중에 가리킬 수 있도록 run() 이 끝날 때까지 유지합니다.
+        self.post_refs = _RefMap(LOOKUP_CACHE_SIZE)
+        # 카테고리 이름 -> id. 카테고리는 행 수가 적으므로 처음에 모두 읽어 둡니다.
+        self.categories = dict(Category.objects.values_list('name', 'pk'))
+
+    def run(self, rows):
+        started = time.monotonic()
+        batch = []
+        try:
+            for line_number, record in rows:
+                self.counts['read'] += 1
+                batch.append((line_number, record))
+                if len(batch) >= self.batch_size:
+                    self._import_batch(batch)
+                    batch = []
+                    elapsed = time.monotonic() - started
+                    self.log(
+                        f"{self.counts['read']}줄 처리: 게시글 {self.counts['posts']}, 댓글 {self.counts['comments']}, "
+                        f"거부 {self.counts['rejected']} ({self.counts['read'] / elapsed if elapsed else 0:.0f}줄/초)"
+                    )
+            if batch:
+                self._import_batch(batch)
+        finally:
+            self.post_refs.close()
+        if self.counts['posts'] or self.counts['comments']:
+            caching.invalidate(caching.BOARD, caching.POST_LIST, caching.DASHBOARD)
+        return self.counts
+
+    def _rejected(self, line_number, reason, record):
+        self.counts['rejected'] += 1
+        self.reject(line_number, str(reason), record if isinstance(record, dict) else None)
+
+    def _validate(self, record):
+        """필드 단위 검증. 조회가 필요한 값(작성자, 카테고리, 게시글)은 이름/id 만 정리해 둡니다."""
+        kind = record.get('type')
+        author = _text(record, 'author')
+        if not author:
+            raise RowError('author: 작성자가 없습니다.')
+        if kind == 'post':
+            category = _text(record, 'category')
+            if not category:
+                # PostForm 은 카테고리를 필수로 바꿔 사용합니다.
+                raise RowError('category: 카테고리가 없습니다.')
+            return {
+                'type': kind, 'author': author, 'category': category,
+                'title': _clean(_POST_FIELDS, 'title', record.get('title')),
+                'content': _clean(_POST_FIELDS, 'content', record.get('content')),
+                'created_at': _clean_created_at(record),
+                'ref': _text(record, 'ref'),
+            }
+        if kind == 'comment':
+            cleaned = {
+                'type': kind, 'author': author,
+                'content': _clean(_COMMENT_FIELDS, 'content', record.get('content')),
+                'created_at': _clean_created_at(record),
+                'post': None, 'post_ref': _text(record, 'post_ref'),
+            }
+            if not cleaned['post_ref']:
+                try:
+                    cleaned['post'] = int(record['post'])
+                except (KeyError, TypeError, ValueError):
+                    raise RowError('post: 게시글 id(post) 또는 post_ref 가 필요합니다.')
+            return cleaned
+        raise RowError(f"type: 'post' 또는 'comment' 여야 합니다: {kind!r}")
+
+    def _resolve_lookups(self, rows):
+        """묶음에 처음 나온 작성자/카테고리/게시글을 종류별로 한 번씩만 조회합니다."""
+        usernames = self.authors.missing({row['author'] for _, row, _ in rows})
+        if usernames:
+            found = dict(User.objects.filter(username__in=usernames).values_list('username', 'pk'))
+            self.authors.update({username: found.get(username) for username in usernames})
+
+        post_ids = self.post_ids.missing({row['post'] for _, row, _ in rows if row['type'] == 'comment' and row['post']})
+        if post_ids:
+            found = set(Post.objects.filter(pk__in=post_ids).values_list('pk', flat=True))
+            self.post_ids.update({post_id: post_id in found for post_id in post_ids})
+
+        categories = {row['category'] for _, row, _ in rows if row['type'] == 'post'} - self.categories.keys()
+        if categories and self.create_categories:
+            Category.objects.bulk_create([Category(name=name) for name in categories], ignore_conflicts=True)
+            # bulk_create 는 시그널을 보내지 않으므로 카테고리 캐시를 직접 무효화합니다.
+            category_cache.invalidate()
+            self.categories.update(Category.objects.filter(name__in=categories).values_list('name', 'pk'))
+
+    def _import_batch(self, batch):
+        rows = []
+        for line_number, record in batch:
+            if isinstance(record, Exception):
+                self._rejected(line_number, record, None)
+                continue
+            try:
+                rows.append((line_number, self._validate(record), record))
+            except RowError as exc:
+                self._rejected(line_number, exc, record)
+
+        with transaction.atomic():
+            self._resolve_lookups(rows)
+            posts = self._insert_posts([row for row in rows if row[1]['type'] == 'post'])
+            comments = self._insert_comments([row for row in rows if row[1]['type'] == 'comment'])
+            if self.index and posts:
+                get_backend().index_new_posts(posts)
+            if self.index and comments:
+                get_backend().index_new_comments(comments)
+            if comments:
+                Post.objects.filter(pk__in={comment.post_id for comment in comments}).refresh_counters()
+            if posts:
+                DashboardStats.adjust('post_count', len(posts))
+            if comments:
+                DashboardStats.adjust('comment_count', len(comments))
+        self.counts['posts'] += len(posts)
+        self.counts['comments'] += len(comments)
+
+    def _insert_posts(self, rows):
+        objects, refs = [], []
+        # 이번 묶음에서 이미 나온 ref. post_refs 에는 bulk_create 가 끝난 뒤에야 들어갑니다.
+        batch_refs = set()
+        for line_number, row, record in rows:
+            author_id = self.authors.get(row['author'])
+            category_id = self.categories.get(row['category'])
+            if author_id is None:
+                self._rejected(line_number, f"author: 사용자를 찾을 수 없습니다: {row['author']}", record)
+            elif category_id is None:
+                self._rejected(line_number, f"category: 카테고리를 찾을 수 없습니다: {row['category']}", record)
+            elif row['ref'] and (row['ref'] in batch_refs or row['ref'] in self.post_refs):
+                self._rejected(line_number, f"ref: 이미 가져온 게시글입니다: {row['ref']}", record)
+            else:
+                if row['ref']:
+                    batch_refs.add(row['ref'])
+                objects.append(Post(
+                    author_id=author_id, category_id=category_id, title=row['title'], content=row['content'],
+                ))
+                refs.append((row['ref'], row['created_at']))
+        objects = Post.objects.bulk_create(objects, batch_size=self.batch_size)
+        self.post_refs.update({ref: post.pk for post, (ref, _) in zip(objects, refs) if ref})
+        self._set_created_at(Post, objects, [created_at for _, created_at in refs])
+        return objects
+
+    def _insert_comments(self, rows):
+        objects, created = [], []
+        for line_number, row, record in rows:
+            author_id = self.authors.get(row['author'])
+            post_id = self.post_refs.get(row['post_ref']) if row['post_ref'] else row['post']
+            if author_id is None:
+                self._rejected(line_number, f"author: 사용자를 찾을 수 없습니다: {row['author']}", record)
+            elif post_id is None:
+                self._rejected(line_number, f"post_ref: 가져온 게시글 중에 없습니다: {row['post_ref']}", record)
+            elif not row['post_ref'] and not self.post_ids.get(post_id):
+                self._rejected(line_number, f'post: 게시글을 찾을 수 없습니다: {post_id}', record)
+            else:
+                objects.append(Comment(post_id=post_id, author_id=author_id, content=row['content']))
+                created.append(row['created_at'])
+        objects = Comment.objects.bulk_create(objects, batch_size=self.batch_size)
+        self._set_created_at(Comment, objects, created)
+        return objects
+
+    def _set_created_at(self, model, objects, created):
+        # auto_now_add 필드는 bulk_create 에서 현재 시각으로 덮어써지므로 값이 있던 행만 다시 맞춥니다.
+        changed = []
+        for obj, created_at in zip(objects, created):
+            if created_at is not None:
+                obj.created_at = created_at
+                changed.append(obj)
+        if changed:
+            model.objects.bulk_update(changed, ['created_at'], batch_size=self.batch_size)
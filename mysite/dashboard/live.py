@@ -0,0 +1,308 @@
+"""
+게시글 상세 화면의 실시간 갱신 (Server-Sent Events).
+
+좋아요 토글과 새 댓글이 커밋되면 시그널이 publish() 로 이벤트를 보내고, 게시글별 구독자
+(SSE 연결 하나당 하나)에게 전달됩니다. 구독자는 받은 이벤트를 바로 보내지 않고 대기 중인
+갱신 하나로 합쳐 두었다가 settings.DASHBOARD_LIVE_INTERVAL 초에 최대 한 번만 내보냅니다.
+좋아요가 몰려도 연결마다 메시지는 한 개이고, 아무 일도 없는 연결은 heartbeat 외에는
+이벤트 루프에서 잠들어 있을 뿐이므로 비용이 거의 들지 않습니다.
+
+브로커
+    InProcessBroker  같은 프로세스 안의 구독자에게만 전달합니다. (기본값)
+    RelayBroker      여러 워커 프로세스가 있을 때 사용합니다. 'live_broker' 관리 명령으로 띄운
+                     로컬 TCP 중계 서버에 이벤트를 보내고, 중계 서버가 모든 워커에 다시 뿌립니다.
+                     (Redis pub/sub 등을 대신하는 간단한 구현입니다.)
+                     settings.DASHBOARD_LIVE_BROKER_URL = 'tcp://127.0.0.1:8765'
+
+WSGI 로 배포하면(DASHBOARD_ASYNC_VIEWS 가 꺼져 있으면) 연결 하나가 워커 하나를 계속 붙잡게 되므로
+연결을 열어 두지 않습니다. 대신 snapshot_stream() 이 현재 좋아요 수를 한 번 보내고 끝나며,
+브라우저의 EventSource 가 DASHBOARD_LIVE_POLL_INTERVAL 초 뒤에 다시 연결합니다. (폴링)
+"""
+import asyncio
+import json
+import logging
+import socket
+import threading
+from collections import defaultdict
+from functools import lru_cache
+from urllib.parse import urlsplit
+
+from django.conf import settings
+
+logger = logging.getLogger('dashboard.live')
+
+DEFAULT_INTERVAL = 1.0
+DEFAULT_HEARTBEAT = 20.0
+DEFAULT_POLL_INTERVAL = 10.0
+# 한 번의 갱신에 담는 새 댓글 수. 넘치는 댓글은 개수만 알려 주고 화면에서 "더 보기" 로 불러옵니다.
+MAX_COMMENTS_PER_UPDATE = 20
+
+
+def _merge(pending, event):
+    """대기 중인 갱신(pending)에 이벤트 하나를 합친 결과를 반환합니다."""
+    if pending is None:
+        pending = {'like_count': None, 'like_delta': 0, 'comment_delta': 0, 'comments': [], 'comments_skipped': 0}
+    if event['type'] == 'like':
+        pending['like_delta'] += event.get('delta', 0)
+        if event.get('like_count') is not None:
+            pending['like_count'] = event['like_count']
+    elif event['type'] == 'comment':
+        pending['comment_delta'] += 1
+        if len(pending['comments']) < MAX_COMMENTS_PER_UPDATE:
+            pending['comments'].append(event['html'])
+        else:
+            pending['comments_skipped'] += 1
+    return pending
+
+
+class Subscription:
+    """
+    SSE 연결 하나의 구독. publish 는 어느 스레드에서든 호출될 수 있으므로 대기 중인 갱신은
+    잠금으로 보호하고, 이벤트 루프는 갱신이 처음 생겼을 때 한 번만 깨웁니다.
+    """
+
+    def __init__(self, broker, post_id):
+        self.broker = broker
+        self.post_id = post_id
+        self._loop = asyncio.get_running_loop()
+        self._ready = asyncio.Event()
+        self._lock = threading.Lock()
+        self._pending = None
+        self._wakeup_scheduled = False
+
+    def push(self, event):
+        with self._lock:
+            self._pending = _merge(self._pending, event)
+            if self._wakeup_scheduled:
+                return
+            self._wakeup_scheduled = True
+        try:
+            self._loop.call_soon_threadsafe(self._ready.set)
+        except RuntimeError:
+            # 연결이 끊겨 이벤트 루프가 이미 닫혔습니다.
+            self.close()
+
+    async def wait(self, timeout):
+        """갱신이 생기면 True, timeout 초 동안 없으면 False."""
+        try:
+            await asyncio.wait_for(self._ready.wait(), timeout)
+        except asyncio.TimeoutError:
+            return False
+        return True
+
+    def drain(self):
+        with self._lock:
+            pending, self._pending = self._pending, None
+            self._wakeup_scheduled = False
+            self._ready.clear()
+        return pending
+
+    def close(self):
+        self.broker.unsubscribe(self)
+
+
+class InProcessBroker:
+    """같은 프로세스 안의 구독자에게 이벤트를 나눠 주는 브로커."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscriptions = defaultdict(set)
+
+    def subscribe(self, post_id):
+        subscription = Subscription(self, post_id)
+        with self._lock:
+            self._subscriptions[post_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscriptions = self._subscriptions.get(subscription.post_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscriptions[subscription.post_id]
+
+    def subscriber_count(self, post_id):
+        with self._lock:
+            return len(self._subscriptions.get(post_id, ()))
+
+    def has_subscribers(self, post_id):
+        """post_id 로 보낸 이벤트를 받을 구독자가 있을 수 있으면 True."""
+        return self.subscriber_count(post_id) > 0
+
+    def publish(self, post_id, event):
+        self.deliver(post_id, event)
+
+    def deliver(self, post_id, event):
+        with self._lock:
+            subscriptions = list(self._subscriptions.get(post_id, ()))
+        for subscription in subscriptions:
+            subscription.push(event)
+
+
+class RelayBroker(InProcessBroker):
+    """
+    로컬 TCP 중계 서버를 거쳐 모든 워커에 이벤트를 전달하는 브로커.
+    한 줄에 JSON 하나 ({"post_id": ..., "event": {...}}) 를 주고받습니다.
+    중계 서버에 연결할 수 없으면 이 프로세스의 구독자에게만 전달합니다.
+    """
+    RECONNECT_DELAY = 1.0
+
+    def __init__(self, host, port):
+        super().__init__()
+        self.address = (host, port)
+        self._socket = None
+        self._send_lock = threading.Lock()
+        self._connected = threading.Event()
+        self._closed = threading.Event()
+        self._reader = threading.Thread(target=self._read_forever, name='dashboard-live-relay', daemon=True)
+        self._reader.start()
+
+    def has_subscribers(self, post_id):
+        # 다른 워커의 구독자는 알 수 없으므로 중계 서버에 연결되어 있는 동안은 있다고 봅니다.
+        return self._connected.is_set() or super().has_subscribers(post_id)
+
+    def publish(self, post_id, event):
+        line = json.dumps({'post_id': post_id, 'event': event}, ensure_ascii=False).encode() + b'\n'
+        with self._send_lock:
+            sock = self._socket
+            if sock is not None:
+                try:
+                    sock.sendall(line)
+                    return
+                except OSError:
+                    logger.warning('Live relay connection lost; delivering locally.')
+        self.deliver(post_id, event)
+
+    def _read_forever(self):
+        while not self._closed.is_set():
+            try:
+                sock = socket.create_connection(self.address, timeout=5)
+            except OSError:
+                self._closed.wait(self.RECONNECT_DELAY)
+                continue
+            sock.settimeout(None)
+            with self._send_lock:
+                self._socket = sock
+            self._connected.set()
+            try:
+                for line in sock.makefile('rb'):
+                    message = json.loads(line)
+                    self.deliver(message['post_id'], message['event'])
+            except (OSError, ValueError, KeyError):
+                if not self._closed.is_set():
+                    logger.exception('Live relay connection failed.')
+            finally:
+                self._connected.clear()
+                with self._send_lock:
+                    self._socket = None
+                sock.close()
+
+    def wait_connected(self, timeout=None):
+        return self._connected.wait(timeout)
+
+    def close(self):
+        self._closed.set()
+        with self._send_lock:
+            if self._socket is not None:
+                self._socket.shutdown(socket.SHUT_RDWR)
+        self._reader.join(timeout=5)
+
+
+async def serve_relay(host='127.0.0.1', port=8765, ready=None):
+    """
+    RelayBroker 용 중계 서버. 받은 줄을 연결된 모든 워커(보낸 워커 포함)에게 그대로 보냅니다.
+    ready 를 주면 서버가 열린 뒤 실제로 바인딩된 (host, port) 로 호출합니다. (port=0 일 때 유용)
+    """
+    writers = set()
+
+    async def handle(reader, writer):
+        writers.add(writer)
+        try:
+            while line := await reader.readline():
+                for peer in list(writers):
+                    try:
+                        peer.write(line)
+                    except (ConnectionError, RuntimeError):
+                        writers.discard(peer)
+        finally:
+            writers.discard(writer)
+            writer.close()
+
+    # 댓글 HTML 이 담긴 긴 줄도 받을 수 있도록 readline 한도를 넉넉히 둡니다.
+    server = await asyncio.start_server(handle, host, port, limit=2 ** 20)
+    if ready is not None:
+        ready(*server.sockets[0].getsockname()[:2])
+    async with server:
+        await server.serve_forever()
+
+
+@lru_cache(maxsize=None)
+def _broker_for(url):
+    if not url:
+        return InProcessBroker()
+    parts = urlsplit(url)
+    if parts.scheme != 'tcp' or not parts.hostname or not parts.port:
+        raise ValueError(f'Unsupported DASHBOARD_LIVE_BROKER_URL: {url!r} (expected tcp://host:port)')
+    return RelayBroker(parts.hostname, parts.port)
+
+
+def get_broker():
+    return _broker_for(getattr(settings, 'DASHBOARD_LIVE_BROKER_URL', ''))
+
+
+def publish(post_id, event):
+    """게시글 post_id 를 보고 있는 모든 연결에 이벤트를 보냅니다."""
+    get_broker().publish(post_id, event)
+
+
+def has_subscribers(post_id):
+    """게시글 post_id 를 보고 있는 연결이 있을 수 있으면 True. 이벤트를 만드는 비용이 클 때 먼저 확인합니다."""
+    return get_broker().has_subscribers(post_id)
+
+
+def format_event(data, event='update'):
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    return f'event: {event}\ndata: {payload}\n\n'
+
+
+def snapshot_stream(post_id, like_count, poll_interval=None):
+    """
+    WSGI 용 SSE 응답. 다시 연결할 간격(retry)과 현재 좋아요 수를 보내고 바로 끝나는 동기 이터레이터입니다.
+    """
+    if poll_interval is None:
+        poll_interval = getattr(settings, 'DASHBOARD_LIVE_POLL_INTERVAL', DEFAULT_POLL_INTERVAL)
+    yield f'retry: {int(poll_interval * 1000)}\n\n'
+    yield format_event({'post_id': post_id, **_merge(None, {'type': 'like', 'like_count': like_count})})
+
+
+async def event_stream(post_id, interval=None, heartbeat=None):
+    """
+    게시글 post_id 의 SSE 스트림. 첫 줄(retry)을 내보내기 전에 구독을 시작하고,
+    연결이 끊기면(제너레이터가 닫히거나 취소되면) 구독을 해제합니다.
+    """
+    if interval is None:
+        interval = getattr(settings, 'DASHBOARD_LIVE_INTERVAL', DEFAULT_INTERVAL)
+    if heartbeat is None:
+        heartbeat = getattr(settings, 'DASHBOARD_LIVE_HEARTBEAT', DEFAULT_HEARTBEAT)
+    subscription = get_broker().subscribe(post_id)
+    loop = asyncio.get_running_loop()
+    last_sent = None
+    try:
+        # 연결이 끊기면 브라우저가 몇 초 뒤 다시 연결하도록 합니다.
+        yield f'retry: {int(interval * 1000) + 2000}\n\n'
+        while True:
+            if not await subscription.wait(heartbeat):
+                yield ': keepalive\n\n'
+                continue
+            if last_sent is not None:
+                # 직전 전송 후 interval 이 지나기 전에 온 이벤트는 기다렸다가 한 번에 보냅니다.
+                delay = last_sent + interval - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            update = subscription.drain()
+            if update is not None:
+                last_sent = loop.time()
+                yield format_event({'post_id': post_id, **update})
+    finally:
+        subscription.close()
@@ -0,0 +1,190 @@
+"""
+DB 기반 이메일 발송 대기열(outbox).
+
+settings.EMAIL_BACKEND = 'dashboard.mail.OutboxEmailBackend' 로 두면 send_mail() 이나
+PasswordResetView 의 메일은 OutboxMessage 행으로 저장만 되고 요청은 바로 끝납니다.
+실제 발송은 'manage.py send_outbox' 워커가 settings.DASHBOARD_OUTBOX_DELIVERY_BACKEND
+(기본값: SMTP) 연결 하나를 열어 묶음 단위로 처리하며, 일시적인 실패는 지수 백오프로 재시도합니다.
+"""
+import base64
+import logging
+import smtplib
+import uuid
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMultiAlternatives, get_connection
+from django.core.mail.backends.base import BaseEmailBackend
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+
+from .models import OutboxMessage
+
+logger = logging.getLogger('dashboard.mail')
+
+DEFAULT_DELIVERY_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+DEFAULT_MAX_ATTEMPTS = 5
+# 재시도 간격: BACKOFF_BASE * 2 ** (시도 횟수 - 1) 초, 최대 BACKOFF_MAX 초
+BACKOFF_BASE = 30
+BACKOFF_MAX = 3600
+# SENDING 상태로 이 시간(초)보다 오래 남은 행은 워커가 중간에 죽은 것으로 보고 다시 가져갑니다.
+CLAIM_TIMEOUT = 600
+
+
+def serialize_message(message):
+    """EmailMessage 를 OutboxMessage.payload 에 넣을 JSON 으로 바꿉니다."""
+    attachments = []
+    for attachment in message.attachments:
+        filename, content, mimetype = attachment
+        if isinstance(content, str):
+            content = content.encode(message.encoding or settings.DEFAULT_CHARSET)
+        attachments.append([filename, base64.b64encode(content).decode('ascii'), mimetype])
+    return {
+        'subject': message.subject,
+        'body': message.body,
+        'from_email': message.from_email,
+        'to': list(message.to),
+        'cc': list(message.cc),
+        'bcc': list(message.bcc),
+        'reply_to': list(message.reply_to),
+        'headers': dict(message.extra_headers),
+        'alternatives': [[content, mimetype] for content, mimetype in getattr(message, 'alternatives', [])],
+        'attachments': attachments,
+        'content_subtype': message.content_subtype,
+        'encoding': message.encoding,
+    }
+
+
+def deserialize_message(payload, connection=None):
+    """serialize_message 의 역변환."""
+    message = EmailMultiAlternatives(
+        subject=payload['subject'], body=payload['body'], from_email=payload['from_email'],
+        to=payload['to'], cc=payload['cc'], bcc=payload['bcc'], reply_to=payload['reply_to'],
+        headers=payload['headers'], alternatives=[tuple(item) for item in payload['alternatives']],
+        connection=connection,
+    )
+    for filename, content, mimetype in payload['attachments']:
+        message.attach(filename, base64.b64decode(content), mimetype)
+    message.content_subtype = payload.get('content_subtype', 'plain')
+    message.encoding = payload.get('encoding')
+    return message
+
+
+class OutboxEmailBackend(BaseEmailBackend):
+    """메일을 보내지 않고 OutboxMessage 로 저장하는 이메일 백엔드."""
+
+    def send_messages(self, email_messages):
+        rows = [
+            OutboxMessage(
+                subject=message.subject,
+                recipients=', '.join(message.recipients()),
+                payload=serialize_message(message),
+            )
+            for message in email_messages
+            if message.recipients()
+        ]
+        try:
+            OutboxMessage.objects.bulk_create(rows)
+        except Exception:
+            if not self.fail_silently:
+                raise
+            return 0
+        return len(rows)
+
+
+def backoff_delay(attempts):
+    """attempts 번째 실패 후 다음 시도까지 기다릴 시간."""
+    return timedelta(seconds=min(BACKOFF_BASE * 2 ** max(attempts - 1, 0), BACKOFF_MAX))
+
+
+def is_permanent_failure(exc):
+    """다시 보내도 성공할 가능성이 없는 오류(SMTP 5xx 응답)인지 판단합니다."""
+    if isinstance(exc, smtplib.SMTPRecipientsRefused):
+        return all(code >= 500 for code, _ in exc.recipients.values())
+    if isinstance(exc, smtplib.SMTPResponseException):
+        return 500 <= exc.smtp_code < 600
+    return False
+
+
+def _connection_lost(exc):
+    # smtplib 의 응답 오류도 OSError 의 하위 클래스이므로, 소켓 오류와 연결 끊김만 골라냅니다.
+    if isinstance(exc, smtplib.SMTPServerDisconnected):
+        return True
+    return isinstance(exc, OSError) and not isinstance(exc, smtplib.SMTPException)
+
+
+def claim_batch(batch_size, now=None):
+    """
+    지금 보낼 차례인 메시지를 최대 batch_size 개 가져와 SENDING 으로 표시하고 반환합니다.
+    여러 워커가 동시에 실행되어도 같은 행을 두 워커가 가져가지 않도록 claim_token 으로 확인합니다.
+    """
+    now = now or timezone.now()
+    token = uuid.uuid4().hex
+    due = (
+        Q(status=OutboxMessage.PENDING, next_attempt_at__lte=now)
+        | Q(status=OutboxMessage.SENDING, claimed_at__lt=now - timedelta(seconds=CLAIM_TIMEOUT))
+    )
+    with transaction.atomic():
+        candidates = OutboxMessage.objects.filter(due).order_by('next_attempt_at', 'pk')
+        ids = list(candidates.values_list('pk', flat=True)[:batch_size])
+        if not ids:
+            return []
+        OutboxMessage.objects.filter(due, pk__in=ids).update(
+            status=OutboxMessage.SENDING, claim_token=token, claimed_at=now,
+        )
+    return list(OutboxMessage.objects.filter(claim_token=token, status=OutboxMessage.SENDING).order_by('pk'))
+
+
+def _mark_failed_attempt(row, exc, max_attempts, now):
+    row.attempts += 1
+    row.last_error = f'{type(exc).__name__}: {exc}'[:2000]
+    if is_permanent_failure(exc) or row.attempts >= max_attempts:
+        row.status = OutboxMessage.FAILED
+    else:
+        row.status = OutboxMessage.PENDING
+        row.next_attempt_at = now + backoff_delay(row.attempts)
+    row.save(update_fields=['attempts', 'last_error', 'status', 'next_attempt_at'])
+
+
+def deliver_outbox(batch_size=50, max_attempts=DEFAULT_MAX_ATTEMPTS, backend=None):
+    """
+    대기 중인 메시지를 한 묶음 보내고 {'sent': n, 'retry': n, 'failed': n} 을 반환합니다.
+    묶음 전체에 하나의 발송 연결을 쓰며, 연결이 끊기면 다음 메시지에서 다시 엽니다.
+    """
+    counts = {'sent': 0, 'retry': 0, 'failed': 0}
+    rows = claim_batch(batch_size)
+    if not rows:
+        return counts
+
+    backend = backend or getattr(settings, 'DASHBOARD_OUTBOX_DELIVERY_BACKEND', DEFAULT_DELIVERY_BACKEND)
+    connection = get_connection(backend, fail_silently=False)
+    opened = False
+    try:
+        for row in rows:
+            now = timezone.now()
+            try:
+                if not opened:
+                    connection.open()
+                    opened = True
+                if not connection.send_messages([deserialize_message(row.payload, connection)]):
+                    raise ValueError('message has no recipients')
+            except Exception as exc:
+                logger.warning('Outbox message %s failed: %s', row.pk, exc)
+                _mark_failed_attempt(row, exc, max_attempts, now)
+                counts['failed' if row.status == OutboxMessage.FAILED else 'retry'] += 1
+                if opened and _connection_lost(exc):
+                    # 연결 자체가 끊긴 경우 다음 메시지에서 새로 연결합니다.
+                    connection.close()
+                    opened = False
+                continue
+            row.status = OutboxMessage.SENT
+            row.attempts += 1
+            row.sent_at = now
+            row.last_error = ''
+            row.save(update_fields=['status', 'attempts', 'sent_at', 'last_error'])
+            counts['sent'] += 1
+    finally:
+        if opened:
+            connection.close()
+    return counts
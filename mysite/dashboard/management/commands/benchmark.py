@@ -0,0 +1,45 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dashboard.benchmark import SCENARIOS, TRANSPORTS, BenchmarkError, run
+
+
+class Command(BaseCommand):
+    help = (
+        '게시판 목록/상세/좋아요 토글/대시보드 URL 을 동시에 반복 요청하여 '
+        'p50/p95/p99 지연 시간, 처리량, 요청당 쿼리 수를 JSON 으로 출력합니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--scenario', action='append', choices=SCENARIOS, dest='scenarios',
+            help='측정할 시나리오 (여러 번 지정 가능, 기본값: 전부)',
+        )
+        parser.add_argument('--requests', type=int, default=100, help='시나리오별 요청 수 (기본값: 100)')
+        parser.add_argument('--concurrency', type=int, default=4, help='동시에 요청하는 스레드 수 (기본값: 4)')
+        parser.add_argument(
+            '--mode', choices=sorted(TRANSPORTS), default='client',
+            help="client: 테스트 클라이언트, wsgi: 로컬 WSGI 서버 (기본값: client)",
+        )
+        parser.add_argument('--username', help='요청에 사용할 계정 (기본값: 첫 번째 관리자)')
+        parser.add_argument('--seed', type=int, default=0, help='요청 순서와 대상 게시글을 정하는 난수 시드')
+        parser.add_argument('--warmup', type=int, default=10, help='측정 전 시나리오별 예열 요청 수 (기본값: 10)')
+        parser.add_argument('--output', help='결과 JSON 을 저장할 파일 (기본값: 표준 출력)')
+
+    def handle(self, *args, **options):
+        try:
+            result = run(
+                scenarios=options['scenarios'] or SCENARIOS, requests=options['requests'],
+                concurrency=options['concurrency'], mode=options['mode'], username=options['username'],
+                seed=options['seed'], warmup=options['warmup'],
+            )
+        except BenchmarkError as exc:
+            raise CommandError(str(exc))
+        text = json.dumps(result, indent=2, ensure_ascii=False)
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8') as fh:
+                fh.write(text + '\n')
+            self.stdout.write(self.style.SUCCESS(f"결과를 {options['output']} 에 저장했습니다."))
+        else:
+            self.stdout.write(text)
@@ -0,0 +1,94 @@
+import re
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from dashboard.models import Comment, DashboardStats, Post
+from dashboard.pagination import CursorPaginator
+from dashboard.views import (
+    POST_LIST_ORDERING, USER_LIST_ORDERING, _comment_paginator, _mau_querysets, _post_detail_queryset,
+    _post_list_queryset, _post_list_states_queryset, _recent_querysets, _user_state_queryset,
+)
+
+# 실행 계획에서 테이블 전체 스캔을 나타내는 줄 (SQLite / PostgreSQL / MySQL)
+FULL_SCAN_PATTERNS = [
+    re.compile(r'\bSCAN (?!CONSTANT ROW)(?!.*\bUSING\b)\S+'),
+    re.compile(r'\bSeq Scan on\b'),
+    re.compile(r"'type': 'ALL'|\bALL\b.*\bUsing where\b"),
+]
+# 인덱스 순서를 쓰지 못해 별도 정렬이 필요한 경우
+TEMP_SORT_PATTERN = re.compile(r'USE TEMP B-TREE FOR ORDER BY|Using filesort|\bSort\b')
+
+
+def representative_queries():
+    """
+    각 뷰가 실제로 실행하는 대표 쿼리 목록 (이름, queryset).
+    뷰와 같은 헬퍼(dashboard.views)로 queryset 을 만들므로 뷰의 쿼리가 바뀌면 여기에도 그대로 반영됩니다.
+    """
+    now = timezone.now()
+    today = timezone.localdate()
+    # 실행 계획만 보므로 저장되지 않은 인스턴스의 키 값으로 충분합니다.
+    user = User(pk=1, date_joined=now)
+    post_paginator = CursorPaginator(_post_list_queryset(user), POST_LIST_ORDERING, 10)
+    comment_paginator = _comment_paginator(1)
+    user_paginator = CursorPaginator(User.objects.all(), USER_LIST_ORDERING, 10)
+    mau_count, mau_chart = _mau_querysets(today)
+    recent_users, recent_posts = _recent_querysets()
+    return [
+        ('post_list_view: page', _post_list_queryset(user).order_by(*POST_LIST_ORDERING)[:10]),
+        ('post_list_view: cursor', post_paginator.page_queryset(
+            post_paginator.encode_cursor(Post(pk=1, created_at=now)))),
+        ('post_list_view: user_state', _post_list_states_queryset(list(range(1, 11)), user)),
+        ('post_detail_view: post', _post_detail_queryset().filter(pk=1)),
+        ('post_detail_view: comments', comment_paginator.page_queryset()),
+        ('post_detail_view: user_state', _user_state_queryset(1, user)),
+        ('comment_list_view: cursor', comment_paginator.page_queryset(
+            comment_paginator.encode_cursor(Comment(pk=1, created_at=now)))),
+        ('user_list_partial: page', User.objects.order_by(*USER_LIST_ORDERING)[:10]),
+        ('user_list_partial: cursor', user_paginator.page_queryset(user_paginator.encode_cursor(user))),
+        ('dashboard_view: stats', DashboardStats.objects.filter(pk=DashboardStats.SINGLETON_PK)),
+        ('dashboard_view: mau_count', mau_count),
+        ('dashboard_view: mau_chart', mau_chart),
+        ('dashboard_view: recent_users', recent_users),
+        ('dashboard_view: recent_posts', recent_posts),
+    ]
+
+
+class Command(BaseCommand):
+    help = (
+        '대시보드/게시판 뷰의 대표 쿼리에 EXPLAIN (SQLite 는 EXPLAIN QUERY PLAN) 을 실행하여 '
+        '테이블 전체 스캔과 별도 정렬이 필요한 쿼리를 찾아냅니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--fail-on-scan', action='store_true',
+            help='전체 스캔이 하나라도 있으면 오류로 종료합니다. (CI 용)',
+        )
+
+    def handle(self, *args, **options):
+        verbosity = options['verbosity']
+        full_scans = []
+        for name, queryset in representative_queries():
+            plan = queryset.explain()
+            scan_lines = [line for line in plan.splitlines() if any(p.search(line) for p in FULL_SCAN_PATTERNS)]
+            needs_sort = bool(TEMP_SORT_PATTERN.search(plan))
+
+            if scan_lines:
+                full_scans.append(name)
+                self.stdout.write(self.style.ERROR(f'[FULL SCAN] {name}'))
+                for line in scan_lines:
+                    self.stdout.write(f'    {line.strip()}')
+            elif needs_sort:
+                self.stdout.write(self.style.WARNING(f'[SORT]      {name}'))
+            else:
+                self.stdout.write(self.style.SUCCESS(f'[OK]        {name}'))
+            if verbosity >= 2:
+                for line in plan.splitlines():
+                    self.stdout.write(f'        {line}')
+
+        self.stdout.write(f'\n{connection.vendor}: 전체 스캔 {len(full_scans)}건')
+        if full_scans and options['fail_on_scan']:
+            raise CommandError(f'전체 스캔이 발견되었습니다: {", ".join(full_scans)}')
@@ -0,0 +1,67 @@
+import json
+import sys
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from dashboard.importing import DEFAULT_BATCH_SIZE, READERS, Importer
+
+
+class Command(BaseCommand):
+    help = 'JSONL 또는 CSV 파일의 게시글과 댓글을 bulk_create 로 일괄 가져옵니다. (형식은 dashboard/importing.py 참고)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help="가져올 파일 ('-' 이면 표준 입력)")
+        parser.add_argument(
+            '--format', choices=sorted(READERS),
+            help='파일 형식 (기본값: 확장자가 .csv 이면 csv, 그 밖에는 jsonl)',
+        )
+        parser.add_argument(
+            '--batch-size', type=int, default=DEFAULT_BATCH_SIZE,
+            help=f'한 트랜잭션에서 넣을 줄 수 (기본값: {DEFAULT_BATCH_SIZE})',
+        )
+        parser.add_argument('--rejects', help='거부된 줄을 JSONL 로 기록할 파일 (사유와 원본 레코드 포함)')
+        parser.add_argument(
+            '--create-categories', action='store_true', help='없는 카테고리를 만듭니다. (기본값: 그 줄을 거부)',
+        )
+        parser.add_argument(
+            '--no-index', action='store_true',
+            help='검색 색인을 건너뜁니다. 끝난 뒤 rebuild_search_index 를 실행해 주세요.',
+        )
+
+    def handle(self, *args, **options):
+        path = options['path']
+        file_format = options['format'] or ('csv' if path.lower().endswith('.csv') else 'jsonl')
+        try:
+            stream = sys.stdin if path == '-' else open(path, encoding='utf-8-sig', newline='')
+        except OSError as exc:
+            raise CommandError(f'파일을 열 수 없습니다: {exc}')
+        rejects = open(options['rejects'], 'w', encoding='utf-8') if options['rejects'] else None
+
+        def reject(line_number, reason, record):
+            if options['verbosity'] >= 2:
+                self.stderr.write(f'{line_number}번째 줄 거부: {reason}')
+            if rejects is not None:
+                rejects.write(json.dumps({'line': line_number, 'reason': reason, 'record': record}, ensure_ascii=False) + '\n')
+
+        importer = Importer(
+            batch_size=options['batch_size'], create_categories=options['create_categories'],
+            index=not options['no_index'], reject=reject,
+            log=lambda message: self.stdout.write(message) if options['verbosity'] >= 1 else None,
+        )
+        started = time.monotonic()
+        try:
+            counts = importer.run(READERS[file_format](stream))
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+            if rejects is not None:
+                rejects.close()
+        elapsed = time.monotonic() - started
+        self.stdout.write(self.style.SUCCESS(
+            f"가져오기 완료: {counts['read']}줄 중 게시글 {counts['posts']}건, 댓글 {counts['comments']}건 "
+            f"({elapsed:.1f}초, {counts['read'] / elapsed if elapsed else 0:.0f}줄/초)"
+        ))
+        if counts['rejected']:
+            target = f" ({options['rejects']} 참고)" if options['rejects'] else ''
+            self.stdout.write(self.style.WARNING(f"거부된 줄: {counts['rejected']}{target}"))
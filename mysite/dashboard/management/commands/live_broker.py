@@ -0,0 +1,23 @@
+import asyncio
+
+from django.core.management.base import BaseCommand
+
+from dashboard.live import serve_relay
+
+
+class Command(BaseCommand):
+    help = (
+        '여러 워커 프로세스가 게시글 실시간 갱신(SSE) 이벤트를 공유하도록 로컬 TCP 중계 서버를 실행합니다. '
+        '워커에는 DASHBOARD_LIVE_BROKER_URL=tcp://<host>:<port> 를 지정하세요.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--host', default='127.0.0.1', help='바인딩할 주소 (기본값: 127.0.0.1)')
+        parser.add_argument('--port', type=int, default=8765, help='바인딩할 포트 (기본값: 8765)')
+
+    def handle(self, *args, **options):
+        self.stdout.write(self.style.SUCCESS(f"live broker: tcp://{options['host']}:{options['port']}"))
+        try:
+            asyncio.run(serve_relay(options['host'], options['port']))
+        except KeyboardInterrupt:
+            pass
@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from dashboard.models import DashboardStats
+
+
+class Command(BaseCommand):
+    help = '대시보드 요약 카드 집계(DashboardStats)를 전체 테이블 기준으로 다시 계산합니다.'
+
+    def handle(self, *args, **options):
+        stats = DashboardStats.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f'사용자 {stats.user_count}, 게시글 {stats.post_count}, 댓글 {stats.comment_count}, '
+            f'좋아요 {stats.like_count}, 북마크 {stats.bookmark_count} 으로 갱신했습니다.'
+        ))
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from dashboard.search import get_backend, get_user_backend, rebuild_index, rebuild_user_index
+
+
+class Command(BaseCommand):
+    help = '게시글/댓글 검색 색인과 사용자 검색 색인을 비우고 처음부터 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='한 번에 읽어올 행 수 (기본값: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            post_total, comment_total = rebuild_index(batch_size=options['batch_size'])
+            user_total = rebuild_user_index(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f'{type(get_backend()).__name__}: 게시글 {post_total}건, 댓글 {comment_total}건, '
+            f'{type(get_user_backend()).__name__}: 사용자 {user_total}명을 색인했습니다.'
+        ))
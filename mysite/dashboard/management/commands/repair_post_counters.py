@@ -0,0 +1,28 @@
+from django.core.management.base import BaseCommand
+
+from dashboard.models import Post
+
+
+class Command(BaseCommand):
+    help = '게시글의 좋아요/댓글/북마크 카운터를 실제 행 수 기준으로 다시 계산합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size', type=int, default=1000,
+            help='한 번의 UPDATE 로 처리할 게시글 수 (기본값: 1000)',
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options['batch_size']
+        # 기본 키 구간 단위로 나누어 갱신하여 큰 테이블에서도 잠금 시간을 짧게 유지합니다.
+        last_pk = 0
+        updated = 0
+        while True:
+            pks = list(
+                Post.objects.filter(pk__gt=last_pk).order_by('pk').values_list('pk', flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+            updated += Post.objects.filter(pk__gte=pks[0], pk__lte=pks[-1]).refresh_counters()
+            last_pk = pks[-1]
+        self.stdout.write(self.style.SUCCESS(f'게시글 {updated}건의 카운터를 다시 계산했습니다.'))
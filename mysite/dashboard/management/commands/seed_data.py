@@ -0,0 +1,35 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from dashboard.checks import PROCESS_LOCAL_CACHES
+from dashboard.seeding import SEED_PASSWORD, seed
+
+
+class Command(BaseCommand):
+    help = '성능 측정용 합성 데이터(사용자, 카테고리, 게시글, 댓글, 좋아요, 북마크)를 bulk_create 로 생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=100, help='생성할 사용자 수 (기본값: 100)')
+        parser.add_argument('--categories', type=int, default=5, help='생성할 카테고리 수 (기본값: 5)')
+        parser.add_argument('--posts', type=int, default=1000, help='생성할 게시글 수 (기본값: 1000)')
+        parser.add_argument('--comments', type=int, default=5000, help='생성할 댓글 수 (기본값: 5000)')
+        parser.add_argument('--likes', type=int, default=5000, help='생성할 좋아요 수 (기본값: 5000)')
+        parser.add_argument('--bookmarks', type=int, default=1000, help='생성할 북마크 수 (기본값: 1000)')
+        parser.add_argument('--seed', type=int, default=0, help='난수 시드. 같은 값이면 같은 데이터가 만들어집니다.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='bulk_create 한 번에 넣을 행 수 (기본값: 1000)')
+        parser.add_argument('--prefix', default='seed', help="사용자/카테고리 이름 접두어 (기본값: 'seed')")
+
+    def handle(self, *args, **options):
+        created = seed(
+            users=options['users'], categories=options['categories'], posts=options['posts'],
+            comments=options['comments'], likes=options['likes'], bookmarks=options['bookmarks'],
+            seed=options['seed'], batch_size=options['batch_size'], prefix=options['prefix'],
+            log=lambda message: self.stdout.write(message) if options['verbosity'] > 1 else None,
+        )
+        summary = ', '.join(f'{name} {count}' for name, count in created.items())
+        self.stdout.write(self.style.SUCCESS(f'생성 완료: {summary} (비밀번호: {SEED_PASSWORD!r})'))
+        if settings.CACHES['default']['BACKEND'] in PROCESS_LOCAL_CACHES:
+            self.stdout.write(self.style.WARNING(
+                '실행 중인 서버는 프로세스별 캐시를 쓰므로 다시 시작해야 새 데이터가 보입니다. '
+                '(DASHBOARD_CACHE_DIR 로 공유 캐시를 쓰면 바로 반영됩니다.)'
+            ))
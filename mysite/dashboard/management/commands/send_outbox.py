@@ -0,0 +1,38 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from dashboard.mail import DEFAULT_MAX_ATTEMPTS, deliver_outbox
+
+
+class Command(BaseCommand):
+    help = 'OutboxEmailBackend 가 쌓아 둔 이메일을 SMTP 연결 하나로 묶어 발송합니다. (실패 시 백오프 후 재시도)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=50, help='한 번에 가져와 보낼 메시지 수 (기본값: 50)')
+        parser.add_argument(
+            '--max-attempts', type=int, default=DEFAULT_MAX_ATTEMPTS,
+            help=f'이 횟수만큼 실패하면 더 이상 재시도하지 않습니다. (기본값: {DEFAULT_MAX_ATTEMPTS})',
+        )
+        parser.add_argument('--loop', action='store_true', help='대기열을 계속 감시하며 발송합니다. (워커 모드)')
+        parser.add_argument('--interval', type=float, default=5.0, help='--loop 에서 대기열이 비었을 때 쉬는 시간(초)')
+
+    def handle(self, *args, **options):
+        total = {'sent': 0, 'retry': 0, 'failed': 0}
+        try:
+            while True:
+                counts = deliver_outbox(batch_size=options['batch_size'], max_attempts=options['max_attempts'])
+                for key, value in counts.items():
+                    total[key] += value
+                if any(counts.values()):
+                    self.stdout.write(f"발송 {counts['sent']}건, 재시도 예정 {counts['retry']}건, 실패 {counts['failed']}건")
+                    # 보낼 메시지가 남아 있을 수 있으므로 쉬지 않고 다음 묶음을 가져옵니다.
+                    continue
+                if not options['loop']:
+                    break
+                time.sleep(options['interval'])
+        except KeyboardInterrupt:
+            pass
+        self.stdout.write(self.style.SUCCESS(
+            f"합계: 발송 {total['sent']}건, 재시도 예정 {total['retry']}건, 실패 {total['failed']}건"
+        ))
@@ -0,0 +1,66 @@
+import sys
+
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from dashboard import accounts
+
+
+class Command(BaseCommand):
+    help = '여러 사용자를 한 번에 활성화하거나 비활성화합니다. (스팸 계정 정리 등)'
+
+    def add_arguments(self, parser):
+        action = parser.add_mutually_exclusive_group(required=True)
+        action.add_argument('--activate', action='store_true', help='사용자를 활성화합니다.')
+        action.add_argument('--deactivate', action='store_true', help='사용자를 비활성화합니다.')
+        parser.add_argument('user_ids', nargs='*', type=int, help='대상 사용자 id')
+        parser.add_argument(
+            '--file',
+            help="한 줄에 하나씩 사용자 id 가 적힌 파일 ('-' 이면 표준 입력). 빈 줄과 # 주석은 무시합니다.",
+        )
+        parser.add_argument('--usernames', nargs='+', default=[], help='대상 사용자명')
+        parser.add_argument(
+            '--chunk-size', type=int, default=accounts.DEFAULT_CHUNK_SIZE,
+            help=f'한 번의 UPDATE 로 처리할 사용자 수 (기본값: {accounts.DEFAULT_CHUNK_SIZE})',
+        )
+
+    def handle(self, *args, **options):
+        user_ids = list(options['user_ids'])
+        if options['file']:
+            user_ids.extend(self._read_ids(options['file']))
+        if options['usernames']:
+            found = dict(User.objects.filter(username__in=options['usernames']).values_list('username', 'pk'))
+            for username in options['usernames']:
+                if username not in found:
+                    self.stderr.write(f'사용자명을 찾을 수 없습니다: {username}')
+            user_ids.extend(found.values())
+        if not user_ids:
+            raise CommandError('대상 사용자를 하나 이상 지정해 주세요. (user_ids, --file, --usernames)')
+
+        is_active = options['activate']
+        results = accounts.set_users_active(user_ids, is_active, chunk_size=options['chunk_size'])
+        if options['verbosity'] >= 2:
+            for user_id, result in results.items():
+                self.stdout.write(f'{user_id}\t{result}')
+        summary = accounts.summarize(results)
+        changed = summary[accounts.ACTIVATED] + summary[accounts.DEACTIVATED]
+        action = '활성화' if is_active else '비활성화'
+        self.stdout.write(self.style.SUCCESS(
+            f'사용자 {len(results)}명 중 {changed}명을 {action}했습니다. '
+            f'(변경 없음 {summary[accounts.UNCHANGED]}명, 없음 {summary[accounts.NOT_FOUND]}명)'
+        ))
+
+    def _read_ids(self, path):
+        stream = sys.stdin if path == '-' else open(path, encoding='utf-8')
+        try:
+            for line_number, line in enumerate(stream, 1):
+                line = line.split('#', 1)[0].strip()
+                if not line:
+                    continue
+                try:
+                    yield int(line)
+                except ValueError:
+                    raise CommandError(f'{path}:{line_number}: 사용자 id 가 아닙니다: {line!r}')
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
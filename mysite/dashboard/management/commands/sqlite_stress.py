@@ -0,0 +1,41 @@
+import json
+import os
+import tempfile
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from dashboard.stress import run_write_stress
+from mysite.database import PROFILES, apply_profile
+
+
+class Command(BaseCommand):
+    help = (
+        '임시 SQLite 파일에 여러 스레드로 동시에 쓰면서 DB 프로필(development/production)별 '
+        '"database is locked" 실패 수와 처리량을 JSON 으로 출력합니다. 운영 DB 파일은 건드리지 않습니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--profile', action='append', choices=PROFILES, dest='profiles',
+            help='측정할 프로필 (여러 번 지정 가능, 기본값: 전부)',
+        )
+        parser.add_argument('--writers', type=int, default=8, help='동시에 쓰는 스레드 수 (기본값: 8)')
+        parser.add_argument('--readers', type=int, default=2, help='동시에 읽는 스레드 수 (기본값: 2)')
+        parser.add_argument('--operations', type=int, default=100, help='쓰기 스레드마다 실행할 트랜잭션 수 (기본값: 100)')
+
+    def handle(self, *args, **options):
+        if not settings.DATABASES['default']['ENGINE'].endswith('sqlite3'):
+            raise CommandError('SQLite 를 쓸 때만 의미가 있습니다.')
+        results = {}
+        for profile in options['profiles'] or PROFILES:
+            with tempfile.TemporaryDirectory() as directory:
+                database = {**settings.DATABASES['default'], 'NAME': os.path.join(directory, 'stress.sqlite3')}
+                # settings 에 이미 적용된 프로필 설정을 지우고 측정할 프로필만 적용합니다.
+                database.pop('OPTIONS', None)
+                database.pop('CONN_MAX_AGE', None)
+                results[profile] = run_write_stress(
+                    apply_profile(database, profile),
+                    writers=options['writers'], operations=options['operations'], readers=options['readers'],
+                )
+        self.stdout.write(json.dumps(results, indent=2, ensure_ascii=False))
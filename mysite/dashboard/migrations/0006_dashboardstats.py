@@ -0,0 +1,26 @@
+# Generated by Django 5.2.4 on 2026-10-18 17:03
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0005_alter_bookmark_user_alter_comment_author_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DashboardStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('user_count', models.BigIntegerField(default=0)),
+                ('post_count', models.BigIntegerField(default=0)),
+                ('comment_count', models.BigIntegerField(default=0)),
+                ('like_count', models.BigIntegerField(default=0)),
+                ('bookmark_count', models.BigIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now)),
+            ],
+        ),
+    ]
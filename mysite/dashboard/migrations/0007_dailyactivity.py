@@ -0,0 +1,41 @@
+# Generated by Django 5.2.4 on 2026-10-18 17:04
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.utils import timezone
+
+
+def backfill_from_last_login(apps, schema_editor):
+    # 기존 사용자의 마지막 로그인 일자를 첫 활동 기록으로 옮겨 차트가 비지 않도록 합니다.
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    DailyActivity = apps.get_model('dashboard', 'DailyActivity')
+    activities = (
+        DailyActivity(user_id=user_id, date=timezone.localtime(last_login).date())
+        for user_id, last_login in User.objects.filter(last_login__isnull=False).values_list('id', 'last_login').iterator()
+    )
+    DailyActivity.objects.bulk_create(activities, batch_size=1000, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0006_dashboardstats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='DailyActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_activities', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['date', 'user'], name='dashboard_activity_date_user')],
+                'unique_together': {('user', 'date')},
+            },
+        ),
+        migrations.RunPython(backfill_from_last_login, migrations.RunPython.noop),
+    ]
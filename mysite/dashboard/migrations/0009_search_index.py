@@ -0,0 +1,45 @@
+# Generated by Django 5.2.4 on 2026-10-18 17:09
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def create_fts_tables(apps, schema_editor):
+    # FTS5 를 지원하는 SQLite 에서만 가상 테이블을 만듭니다. (그 밖의 DB 는 SearchToken 을 사용)
+    from dashboard.search import COMMENT_FTS_TABLE, POST_FTS_TABLE, fts5_available
+    if not fts5_available(schema_editor.connection):
+        return
+    schema_editor.execute(f'CREATE VIRTUAL TABLE IF NOT EXISTS {POST_FTS_TABLE} USING fts5(title, content)')
+    schema_editor.execute(f'CREATE VIRTUAL TABLE IF NOT EXISTS {COMMENT_FTS_TABLE} USING fts5(content, post_id UNINDEXED)')
+
+
+def drop_fts_tables(apps, schema_editor):
+    from dashboard.search import COMMENT_FTS_TABLE, POST_FTS_TABLE, fts5_available
+    if not fts5_available(schema_editor.connection):
+        return
+    schema_editor.execute(f'DROP TABLE IF EXISTS {POST_FTS_TABLE}')
+    schema_editor.execute(f'DROP TABLE IF EXISTS {COMMENT_FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0008_post_counters'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SearchToken',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('term', models.CharField(max_length=64)),
+                ('weight', models.PositiveIntegerField(default=1)),
+                ('comment', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='dashboard.comment')),
+                ('post', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='+', to='dashboard.post')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['term', 'post'], name='dashboard_searchtoken_term')],
+            },
+        ),
+        migrations.RunPython(create_fts_tables, drop_fts_tables),
+    ]
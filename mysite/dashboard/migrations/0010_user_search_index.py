@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-18 17:10
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def create_user_fts_table(apps, schema_editor):
+    # FTS5 trigram 토크나이저를 지원하는 SQLite 에서는 trigram 색인을 만들고 기존 사용자를 채워 넣습니다.
+    # (그 밖의 DB 는 UserSearchIndex 를 사용하며 rebuild_search_index 명령으로 채웁니다.)
+    from dashboard.search import USER_FTS_TABLE, fts5_trigram_available, normalize_user_text
+    if not fts5_trigram_available(schema_editor.connection):
+        return
+    schema_editor.execute(f"CREATE VIRTUAL TABLE IF NOT EXISTS {USER_FTS_TABLE} USING fts5(text, tokenize='trigram')")
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    with schema_editor.connection.cursor() as cursor:
+        for user in User.objects.iterator(chunk_size=1000):
+            cursor.execute(f'INSERT INTO {USER_FTS_TABLE} (rowid, text) VALUES (%s, %s)', [user.pk, normalize_user_text(user)])
+
+
+def drop_user_fts_table(apps, schema_editor):
+    from dashboard.search import USER_FTS_TABLE, fts5_trigram_available
+    if fts5_trigram_available(schema_editor.connection):
+        schema_editor.execute(f'DROP TABLE IF EXISTS {USER_FTS_TABLE}')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('dashboard', '0009_search_index'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='UserSearchIndex',
+            fields=[
+                ('user', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='+', serialize=False, to=settings.AUTH_USER_MODEL)),
+                ('text', models.TextField()),
+            ],
+        ),
+        migrations.RunPython(create_user_fts_table, drop_user_fts_table),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.2.4 on 2026-10-18 17:14
+
+from django.conf import settings
+from django.db import migrations, models
+
+# auth.User 는 다른 앱의 모델이라 Meta.indexes 를 선언할 수 없으므로
+# 사용자 목록의 (date_joined, id) 정렬/키셋 조회용 인덱스를 여기서 직접 만듭니다.
+USER_JOINED_INDEX = models.Index(fields=['date_joined', 'id'], name='dashboard_user_joined_id')
+
+
+def add_user_joined_index(apps, schema_editor):
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    schema_editor.add_index(User, USER_JOINED_INDEX)
+
+
+def remove_user_joined_index(apps, schema_editor):
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    schema_editor.remove_index(User, USER_JOINED_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('dashboard', '0011_comment_post_created_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='post',
+            index=models.Index(fields=['created_at', 'id'], name='dashboard_post_created_id'),
+        ),
+        migrations.RunPython(add_user_joined_index, remove_user_joined_index),
+    ]
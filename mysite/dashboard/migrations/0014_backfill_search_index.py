@@ -0,0 +1,101 @@
+# Generated by Django 5.2.4 on 2026-10-18 18:40
+
+from collections import Counter
+
+from django.conf import settings
+from django.db import migrations
+
+BATCH_SIZE = 1000
+
+
+def _batches(queryset):
+    batch = []
+    for row in queryset.iterator(chunk_size=BATCH_SIZE):
+        batch.append(row)
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def backfill_search_index(apps, schema_editor):
+    # 0009 는 색인 테이블만 만들었으므로, 그 전부터 있던 게시글·댓글을 search.get_backend() 가 고르는
+    # 백엔드(FTS5 또는 SearchToken)의 색인에 채웁니다. 게시글·댓글 색인은 비우고 다시 채우므로 여러 번 실행해도 됩니다.
+    # 사용자는 0010 이 trigram 색인에 이미 채웠으므로, UserSearchIndex 를 쓰는 DB 에서 빠진 사용자만 채웁니다.
+    from dashboard.search import (
+        COMMENT_FTS_TABLE, COMMENT_WEIGHT, CONTENT_WEIGHT, POST_FTS_TABLE, TITLE_WEIGHT,
+        fts5_available, fts5_trigram_available, normalize_user_text, tokenize,
+    )
+    connection = schema_editor.connection
+    Post = apps.get_model('dashboard', 'Post')
+    Comment = apps.get_model('dashboard', 'Comment')
+    SearchToken = apps.get_model('dashboard', 'SearchToken')
+    UserSearchIndex = apps.get_model('dashboard', 'UserSearchIndex')
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split('.'))
+    term_max_length = SearchToken._meta.get_field('term').max_length
+    use_tokens_only = getattr(settings, 'DASHBOARD_SEARCH_BACKEND', 'auto') == 'tokens'
+    use_fts5 = not use_tokens_only and fts5_available(connection)
+    use_trigram = not use_tokens_only and fts5_trigram_available(connection)
+
+    SearchToken.objects.all().delete()
+    with connection.cursor() as cursor:
+        if use_fts5:
+            cursor.execute(f'DELETE FROM {POST_FTS_TABLE}')
+            cursor.execute(f'DELETE FROM {COMMENT_FTS_TABLE}')
+
+        for posts in _batches(Post.objects.only('pk', 'title', 'content')):
+            if use_fts5:
+                cursor.executemany(
+                    f'INSERT INTO {POST_FTS_TABLE} (rowid, title, content) VALUES (%s, %s, %s)',
+                    [(post.pk, ' '.join(tokenize(post.title)), ' '.join(tokenize(post.content))) for post in posts],
+                )
+                continue
+            tokens = []
+            for post in posts:
+                weights = Counter()
+                for token in tokenize(post.title):
+                    weights[token] += TITLE_WEIGHT
+                for token in tokenize(post.content):
+                    weights[token] += CONTENT_WEIGHT
+                tokens.extend(
+                    SearchToken(term=term[:term_max_length], post_id=post.pk, weight=weight)
+                    for term, weight in weights.items()
+                )
+            SearchToken.objects.bulk_create(tokens, batch_size=BATCH_SIZE)
+
+        for comments in _batches(Comment.objects.only('pk', 'post_id', 'content')):
+            if use_fts5:
+                cursor.executemany(
+                    f'INSERT INTO {COMMENT_FTS_TABLE} (rowid, content, post_id) VALUES (%s, %s, %s)',
+                    [(comment.pk, ' '.join(tokenize(comment.content)), comment.post_id) for comment in comments],
+                )
+            else:
+                SearchToken.objects.bulk_create([
+                    SearchToken(
+                        term=term[:term_max_length], post_id=comment.post_id,
+                        comment_id=comment.pk, weight=count * COMMENT_WEIGHT,
+                    )
+                    for comment in comments
+                    for term, count in Counter(tokenize(comment.content)).items()
+                ], batch_size=BATCH_SIZE)
+
+    if use_trigram:
+        return
+    missing_users = User.objects.exclude(pk__in=UserSearchIndex.objects.values('user_id'))
+    for users in _batches(missing_users.only('pk', 'username', 'email', 'first_name', 'last_name')):
+        UserSearchIndex.objects.bulk_create(
+            [UserSearchIndex(user_id=user.pk, text=normalize_user_text(user)) for user in users],
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('auth', '0012_alter_user_first_name_max_length'),
+        ('dashboard', '0013_outboxmessage'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_search_index, migrations.RunPython.noop),
+    ]
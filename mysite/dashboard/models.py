@@ -1,5 +1,15 @@
-from django.db import models
+from asgiref.sync import sync_to_async
+from django.db import connection, models, transaction
+from django.db.models import Count, Exists, F, OuterRef, Subquery, Value
+from django.db.models.constants import OnConflict
+from django.db.models.functions import Coalesce, Greatest
 from django.contrib.auth.models import User
+from django.dispatch import Signal
+from django.utils import timezone
+
+# Like.toggle() 은 모델 시그널을 거치지 않으므로, 토글이 커밋된 뒤 이 시그널을 따로 보냅니다.
+# 인자: post_id, user, is_liked, like_count
+like_toggled = Signal()
 
 class Category(models.Model):
     name = models.CharField(max_length=100, unique=True)
@@ -8,6 +18,42 @@ class Category(models.Model):
         return self.name
 
 
+def _related_count(model):
+    """게시글 한 건에 연결된 model 행 수를 구하는 상관 서브쿼리 (없으면 0)."""
+    rows = model.objects.filter(post=OuterRef('pk')).order_by().values('post').annotate(n=Count('pk')).values('n')
+    return Coalesce(Subquery(rows), 0)
+
+
+class PostQuerySet(models.QuerySet):
+    def adjust_counter(self, field, delta):
+        """
+        비정규화 카운터 하나를 F() 식으로 원자적으로 증감하고 갱신된 행 수를 반환합니다.
+        카운터가 어긋나 있더라도 음수로 내려가 제약 조건 오류가 나지 않도록 0 에서 멈춥니다.
+        """
+        return self.update(**{field: Greatest(F(field) + delta, 0)})
+
+    def refresh_counters(self):
+        """선택된 게시글들의 like/comment/bookmark 카운터를 실제 행 수로 다시 계산합니다."""
+        return self.update(
+            like_count=_related_count(Like),
+            comment_count=_related_count(Comment),
+            bookmark_count=_related_count(Bookmark),
+        )
+
+    def with_user_state(self, user):
+        """
+        게시글마다 user 가 좋아요/북마크했는지를 user_has_liked, user_has_bookmarked 로 붙입니다.
+        상관 EXISTS 서브쿼리로 목록 조회와 같은 SELECT 안에서 계산되므로 게시글 수와 관계없이
+        쿼리가 늘지 않습니다. 로그인하지 않은 사용자는 항상 False 입니다.
+        """
+        if user is None or not user.is_authenticated:
+            return self.annotate(user_has_liked=Value(False), user_has_bookmarked=Value(False))
+        return self.annotate(
+            user_has_liked=Exists(Like.objects.filter(post=OuterRef('pk'), user=user)),
+            user_has_bookmarked=Exists(Bookmark.objects.filter(post=OuterRef('pk'), user=user)),
+        )
+
+
 class Post(models.Model):
     # 게시글 작성자를 연결합니다.
     author = models.ForeignKey(User, on_delete=models.CASCADE, related_name='posts')
@@ -18,6 +64,19 @@ class Post(models.Model):
     content = models.TextField()
     # 작성 시각을 자동으로 저장
     created_at = models.DateTimeField(auto_now_add=True)
+    # 목록/상세 화면에서 집계 쿼리 없이 읽을 수 있도록 비정규화한 카운터
+    # (Like/Comment/Bookmark 생성·삭제 시그널이 F() 식으로 증감합니다.)
+    like_count = models.PositiveIntegerField(default=0)
+    comment_count = models.PositiveIntegerField(default=0)
+    bookmark_count = models.PositiveIntegerField(default=0)
+
+    objects = PostQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # 게시판 목록과 커서 페이지네이션의 (created_at, id) 정렬/키셋 조회용
+            models.Index(fields=['created_at', 'id'], name='dashboard_post_created_id'),
+        ]
  
     def __str__(self):
         # 객체를 문자열로 보여줄 때 제목이 보이도록
@@ -29,6 +88,12 @@ class Comment(models.Model):
     content = models.TextField()
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # 게시글 상세 화면의 댓글 페이지네이션 (post_id, created_at, id) 키셋 조회용
+            models.Index(fields=['post', 'created_at', 'id'], name='dashboard_comment_post_created'),
+        ]
+
     def __str__(self):
         return f'Comment by {self.author} on {self.post}'
 
@@ -44,6 +109,66 @@ class Like(models.Model):
     def __str__(self):
         return f'Like by {self.user} on {self.post}'
 
+    @classmethod
+    def _delete_row(cls, post_id, user_id):
+        """좋아요 행을 DELETE 한 문장으로 지우고 지운 행 수를 반환합니다. (시그널용 SELECT 없이)"""
+        qn = connection.ops.quote_name
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'DELETE FROM {qn(cls._meta.db_table)} WHERE {qn("post_id")} = %s AND {qn("user_id")} = %s',
+                [post_id, user_id],
+            )
+            return cursor.rowcount
+
+    @classmethod
+    def _insert_row(cls, post_id, user_id):
+        """좋아요 행을 추가하고 추가한 행 수를 반환합니다. 이미 있으면(동시 요청) 무시하고 0 을 반환합니다."""
+        ops = connection.ops
+        qn = ops.quote_name
+        created_at = cls._meta.get_field('created_at').get_db_prep_value(timezone.now(), connection)
+        columns = ', '.join(qn(column) for column in ('post_id', 'user_id', 'created_at'))
+        suffix = ops.on_conflict_suffix_sql([cls._meta.get_field('post')], OnConflict.IGNORE, None, None)
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'{ops.insert_statement(on_conflict=OnConflict.IGNORE)} {qn(cls._meta.db_table)} '
+                f'({columns}) VALUES (%s, %s, %s) {suffix}',
+                [post_id, user_id, created_at],
+            )
+            return cursor.rowcount
+
+    @classmethod
+    def toggle(cls, post_id, user):
+        """
+        좋아요를 켜거나 끄고 (is_liked, like_count) 를 반환합니다.
+        게시글이 없으면 Post.DoesNotExist 를 발생시킵니다.
+
+        조건부 DELETE 가 지운 행 수로 상태를 판단하고, 없을 때만 충돌 무시 INSERT 를 실행하므로
+        세이브포인트 없이 한 트랜잭션 안에서 처리됩니다. 카운터는 실제로 지우거나 추가한 행이 있을 때만
+        증감하므로, 동시에 같은 좋아요를 추가한 요청이 있어도 어긋나지 않습니다.
+        이 경로는 모델 시그널을 거치지 않으므로 Post.like_count 와 DashboardStats 는 여기서 직접 갱신합니다.
+        """
+        with transaction.atomic():
+            if connection.features.has_select_for_update:
+                # 같은 게시글의 토글을 게시글 행 잠금으로 직렬화합니다.
+                # (SQLite 에서는 첫 문장인 DELETE 가 잡는 쓰기 잠금이 같은 역할을 합니다.)
+                list(Post.objects.select_for_update().filter(pk=post_id).values_list('pk'))
+            deleted = cls._delete_row(post_id, user.pk)
+            inserted = 0 if deleted else cls._insert_row(post_id, user.pk)
+            delta = inserted - deleted
+
+            if delta:
+                if not Post.objects.filter(pk=post_id).adjust_counter('like_count', delta):
+                    raise Post.DoesNotExist(f'Post {post_id} does not exist.')
+                DashboardStats.adjust('like_count', delta)
+            # 다른 요청이 먼저 같은 좋아요를 추가했다면(delta 0) 게시글이 없을 때 여기서 DoesNotExist 가 납니다.
+            like_count = Post.objects.filter(pk=post_id).values_list('like_count', flat=True).get()
+            is_liked = not deleted
+            if delta:
+                transaction.on_commit(lambda: like_toggled.send(
+                    sender=cls, post_id=post_id, user=user, is_liked=is_liked, like_count=like_count,
+                ))
+        return is_liked, like_count
+
 class Bookmark(models.Model):
     post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='bookmarks')
     user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='bookmarks')
@@ -55,3 +180,167 @@ class Bookmark(models.Model):
 
     def __str__(self):
         return f'Bookmark by {self.user} on {self.post}'
+
+
+class DashboardStats(models.Model):
+    """
+    대시보드 요약 카드에 표시할 전체 집계 값을 한 행에 저장하는 싱글톤 모델.
+    각 모델의 생성/삭제 시그널이 값을 증감시키며, 요약 카드는 기본 키 조회 한 번으로 끝납니다.
+    """
+    SINGLETON_PK = 1
+
+    user_count = models.BigIntegerField(default=0)
+    post_count = models.BigIntegerField(default=0)
+    comment_count = models.BigIntegerField(default=0)
+    like_count = models.BigIntegerField(default=0)
+    bookmark_count = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(default=timezone.now)
+
+    def __str__(self):
+        return f'DashboardStats (updated {self.updated_at:%Y-%m-%d %H:%M})'
+
+    @classmethod
+    def load(cls):
+        """집계 행을 반환합니다. 아직 없다면 전체 테이블을 기준으로 새로 만듭니다."""
+        try:
+            return cls.objects.get(pk=cls.SINGLETON_PK)
+        except cls.DoesNotExist:
+            return cls.rebuild()
+
+    @classmethod
+    async def aload(cls):
+        """load 의 async 버전."""
+        try:
+            return await cls.objects.aget(pk=cls.SINGLETON_PK)
+        except cls.DoesNotExist:
+            return await sync_to_async(cls.rebuild)()
+
+    @classmethod
+    def rebuild(cls):
+        """모든 카운터를 실제 테이블 기준으로 다시 계산하여 저장합니다."""
+        stats, _ = cls.objects.update_or_create(
+            pk=cls.SINGLETON_PK,
+            defaults={
+                'user_count': User.objects.count(),
+                'post_count': Post.objects.count(),
+                'comment_count': Comment.objects.count(),
+                'like_count': Like.objects.count(),
+                'bookmark_count': Bookmark.objects.count(),
+                'updated_at': timezone.now(),
+            },
+        )
+        return stats
+
+    @classmethod
+    def adjust(cls, field, delta):
+        """
+        카운터 하나를 F() 식으로 원자적으로 증감합니다.
+        집계 행이 아직 없으면 아무 것도 하지 않으며, 다음 load() 때 새로 계산됩니다.
+        """
+        cls.objects.filter(pk=cls.SINGLETON_PK).update(
+            **{field: F(field) + delta, 'updated_at': timezone.now()}
+        )
+
+
+class DailyActivity(models.Model):
+    """
+    사용자별·일자별 활동 기록. 한 사용자는 하루에 최대 한 행만 가집니다.
+    MAU 차트와 mau_count 는 auth_user 대신 이 테이블의 날짜 범위만 읽습니다.
+    """
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='daily_activities')
+    date = models.DateField()
+
+    class Meta:
+        unique_together = ('user', 'date')
+        indexes = [
+            # 날짜 범위로 잘라낸 뒤 사용자 수를 세는 집계를 인덱스만으로 처리합니다.
+            models.Index(fields=['date', 'user'], name='dashboard_activity_date_user'),
+        ]
+
+    def __str__(self):
+        return f'{self.user} active on {self.date}'
+
+    @classmethod
+    def record(cls, user, date=None):
+        """
+        사용자의 활동을 기록합니다. 같은 날 이미 기록이 있으면 아무 것도 하지 않는
+        멱등 upsert(INSERT ... ON CONFLICT DO NOTHING) 한 번으로 처리됩니다.
+        """
+        if date is None:
+            date = timezone.localdate()
+        cls.objects.bulk_create([cls(user=user, date=date)], ignore_conflicts=True)
+
+
+class SearchToken(models.Model):
+    """
+    FTS5 를 쓸 수 없는 DB 에서 사용하는 검색용 역색인 행.
+    게시글(제목·본문) 또는 댓글 하나에 들어 있는 토큰과 그 가중치를 저장합니다.
+    """
+    TERM_MAX_LENGTH = 64
+
+    term = models.CharField(max_length=TERM_MAX_LENGTH)
+    post = models.ForeignKey(Post, on_delete=models.CASCADE, related_name='+')
+    # 댓글에서 나온 토큰이면 댓글을, 게시글 제목/본문에서 나온 토큰이면 NULL 을 가집니다.
+    comment = models.ForeignKey(Comment, on_delete=models.CASCADE, null=True, blank=True, related_name='+')
+    weight = models.PositiveIntegerField(default=1)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=['term', 'post'], name='dashboard_searchtoken_term'),
+        ]
+
+    def __str__(self):
+        return f'{self.term} -> post {self.post_id}'
+
+
+class UserSearchIndex(models.Model):
+    """
+    FTS5 를 쓸 수 없는 DB 에서 사용하는 관리자용 사용자 검색 색인.
+    사용자명·이메일·이름을 소문자로 정규화해 한 컬럼에 모아 두어, 검색 시 auth_user 대신
+    이 좁은 컬럼만 훑습니다.
+    """
+    user = models.OneToOneField(User, on_delete=models.CASCADE, primary_key=True, related_name='+')
+    text = models.TextField()
+
+    def __str__(self):
+        return f'search index for user {self.user_id}'
+
+
+class OutboxMessage(models.Model):
+    """
+    발송 대기 중인 이메일. OutboxEmailBackend 가 요청 처리 중에 행을 넣기만 하고,
+    send_outbox 관리 명령(워커)이 SMTP 연결 하나로 묶어 보내며 실패 시 재시도합니다.
+    메시지는 pickle 대신 EmailMultiAlternatives 를 다시 만들 수 있는 JSON(payload)으로 저장합니다.
+    """
+    PENDING = 'pending'
+    SENDING = 'sending'
+    SENT = 'sent'
+    FAILED = 'failed'
+    STATUS_CHOICES = [
+        (PENDING, '대기'),
+        (SENDING, '발송 중'),
+        (SENT, '발송 완료'),
+        (FAILED, '실패'),
+    ]
+
+    subject = models.TextField(blank=True)
+    recipients = models.TextField(help_text='표시용 수신자 목록 (쉼표로 구분)')
+    payload = models.JSONField()
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=PENDING)
+    attempts = models.PositiveIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    # 워커가 행을 가져갈 때 기록합니다. 워커가 죽어 SENDING 으로 남은 행은 일정 시간 뒤 다시 가져갑니다.
+    claim_token = models.CharField(max_length=32, blank=True)
+    claimed_at = models.DateTimeField(null=True, blank=True)
+    last_error = models.TextField(blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # 워커가 "지금 보낼 차례인 대기 메시지" 를 오래된 순으로 가져오는 조회용
+            models.Index(fields=['status', 'next_attempt_at'], name='dashboard_outbox_due'),
+        ]
+
+    def __str__(self):
+        return f'{self.subject} -> {self.recipients} ({self.status})'
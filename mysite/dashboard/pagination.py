@@ -0,0 +1,151 @@
+"""
+키셋(커서) 기반 페이지네이션.
+
+Django 의 Paginator 는 COUNT(*) 와 OFFSET n 을 사용하므로 뒤쪽 페이지일수록 느려집니다.
+CursorPaginator 는 정렬 키의 마지막 값을 불투명한 커서로 넘겨 받아
+"WHERE (created_at, id) < (...)" 형태로 다음 페이지를 조회하므로
+몇 번째 페이지든 인덱스 범위 조회 한 번으로 끝납니다.
+"""
+import base64
+import binascii
+import json
+
+from django.db.models import Q
+
+
+class InvalidCursor(Exception):
+    """커서 문자열을 해석할 수 없을 때 발생합니다."""
+
+
+class CursorPage:
+    """
+    한 페이지 분량의 결과. 템플릿에서는 Paginator 의 Page 처럼 순회할 수 있고,
+    다음/이전 페이지로 이동할 때는 next_cursor / previous_cursor 를 사용합니다.
+    """
+    is_cursor_page = True
+
+    def __init__(self, object_list, next_cursor, previous_cursor):
+        self.object_list = object_list
+        self.next_cursor = next_cursor
+        self.previous_cursor = previous_cursor
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __repr__(self):
+        return f'<CursorPage of {len(self)} items>'
+
+    def has_next(self):
+        return self.next_cursor is not None
+
+    def has_previous(self):
+        return self.previous_cursor is not None
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+
+class CursorPaginator:
+    """
+    ordering 에 지정한 필드 조합(마지막 필드는 유일해야 함)을 키로 하는 키셋 페이지네이터.
+
+        CursorPaginator(Post.objects.all(), ordering=('-created_at', '-id'), per_page=10)
+    """
+
+    def __init__(self, queryset, ordering, per_page):
+        self.queryset = queryset
+        self.ordering = tuple(ordering)
+        self.per_page = int(per_page)
+        self._fields = [name.lstrip('-') for name in self.ordering]
+        self._descending = [name.startswith('-') for name in self.ordering]
+
+    def page(self, cursor=None):
+        """
+        커서가 가리키는 페이지를 반환합니다. 커서가 없거나 잘못되었다면 첫 페이지를 반환합니다.
+        """
+        queryset, values, backwards = self._page_queryset(cursor)
+        return self._build_page(list(queryset), values, backwards)
+
+    def page_queryset(self, cursor=None):
+        """page(cursor) 가 실행하는 queryset. (EXPLAIN 등으로 실행 계획을 볼 때 사용합니다.)"""
+        return self._page_queryset(cursor)[0]
+
+    async def apage(self, cursor=None):
+        """page 의 async 버전. 행을 async 반복으로 읽습니다."""
+        queryset, values, backwards = self._page_queryset(cursor)
+        return self._build_page([obj async for obj in queryset], values, backwards)
+
+    def _page_queryset(self, cursor):
+        try:
+            values, backwards = self.decode_cursor(cursor) if cursor else (None, False)
+        except InvalidCursor:
+            values, backwards = None, False
+
+        queryset = self.queryset
+        if values is not None:
+            queryset = queryset.filter(self._keyset_filter(values, backwards))
+        ordering = self._reversed_ordering() if backwards else self.ordering
+        # 한 건을 더 읽어 그 방향으로 다음 페이지가 있는지 확인합니다.
+        return queryset.order_by(*ordering)[:self.per_page + 1], values, backwards
+
+    def _build_page(self, rows, values, backwards):
+        has_more = len(rows) > self.per_page
+        rows = rows[:self.per_page]
+
+        if backwards:
+            rows.reverse()
+            has_next, has_previous = True, has_more
+        else:
+            has_next, has_previous = has_more, values is not None
+
+        next_cursor = self.encode_cursor(rows[-1], backwards=False) if rows and has_next else None
+        previous_cursor = self.encode_cursor(rows[0], backwards=True) if rows and has_previous else None
+        return CursorPage(rows, next_cursor, previous_cursor)
+
+    def encode_cursor(self, obj, backwards=False):
+        """객체의 정렬 키 값을 URL 에 넣을 수 있는 불투명한 문자열로 만듭니다."""
+        payload = {
+            'v': [self._serialize(getattr(obj, name)) for name in self._fields],
+            'b': backwards,
+        }
+        raw = json.dumps(payload, separators=(',', ':')).encode()
+        return base64.urlsafe_b64encode(raw).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        """encode_cursor 의 역변환. (정렬 키 값 목록, 역방향 여부) 를 반환합니다."""
+        try:
+            raw = base64.urlsafe_b64decode(cursor + '=' * (-len(cursor) % 4))
+            payload = json.loads(raw)
+            values = payload['v']
+            backwards = bool(payload.get('b', False))
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise InvalidCursor(cursor)
+        if not isinstance(values, list) or len(values) != len(self._fields):
+            raise InvalidCursor(cursor)
+        model_meta = self.queryset.model._meta
+        try:
+            values = [model_meta.get_field(name).to_python(value) for name, value in zip(self._fields, values)]
+        except Exception:
+            raise InvalidCursor(cursor)
+        return values, backwards
+
+    def _keyset_filter(self, values, backwards):
+        # (a, b, c) 보다 "뒤" 에 오는 행 = a 가 뒤 OR (a 같고 b 가 뒤) OR (a, b 같고 c 가 뒤)
+        condition = Q()
+        for i, (name, value, descending) in enumerate(zip(self._fields, values, self._descending)):
+            lookup = 'lt' if descending != backwards else 'gt'
+            equal_prefix = {self._fields[j]: values[j] for j in range(i)}
+            condition |= Q(**equal_prefix, **{f'{name}__{lookup}': value})
+        return condition
+
+    def _reversed_ordering(self):
+        return tuple(name if desc else f'-{name}' for name, desc in zip(self._fields, self._descending))
+
+    @staticmethod
+    def _serialize(value):
+        if hasattr(value, 'isoformat'):
+            return value.isoformat()
+        return value
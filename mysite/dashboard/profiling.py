@@ -0,0 +1,245 @@
+"""
+요청별 SQL 쿼리 수·DB 시간·템플릿 렌더링 시간·전체 처리 시간 측정.
+
+QueryProfilingMiddleware 가 요청마다 RequestProfile 을 컨텍스트 변수에 두면, 모든 DB 연결에
+등록된 execute_wrapper 가 그 요청의 쿼리를 세고, 결과를 URL 이름(예: 'dashboard:post_list') 별로
+누적합니다. 누적 값은 metrics_text() 로 Prometheus 텍스트
+형식으로 내보낼 수 있습니다.
+
+settings.DASHBOARD_QUERY_BUDGETS 에 뷰별 쿼리 수 상한을 적어 두면, 초과 시
+DASHBOARD_QUERY_BUDGET_ACTION 에 따라 경고 로그를 남기거나('log') QueryBudgetExceeded 를
+발생시킵니다('raise', 테스트용).
+
+템플릿 렌더링 시간은 settings.TEMPLATES 의 BACKEND 를 ProfilingDjangoTemplates 로 지정했을 때만
+잽니다. Template 클래스를 프로세스 전체에서 바꾸지 않고 템플릿 엔진이 돌려주는 템플릿만 감쌉니다.
+"""
+import contextvars
+import logging
+import threading
+import time
+from collections import defaultdict
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db.backends.signals import connection_created
+from django.template.backends.django import DjangoTemplates
+
+from . import caching
+
+logger = logging.getLogger('dashboard.profiling')
+
+UNRESOLVED_VIEW = '<unresolved>'
+
+# 현재 요청의 측정 값. sync_to_async 스레드에도 복사되므로 async 뷰의 ORM 호출에서도 보입니다.
+_current_profile = contextvars.ContextVar('dashboard_request_profile', default=None)
+# 템플릿 렌더링의 중첩 깊이 ({% include %}, {% extends %} 중복 집계 방지)
+_template_depth = contextvars.ContextVar('dashboard_template_depth', default=0)
+
+
+class QueryBudgetExceeded(AssertionError):
+    """뷰가 settings.DASHBOARD_QUERY_BUDGETS 에 정한 쿼리 수를 넘었을 때 발생합니다."""
+
+
+class RequestProfile:
+    """요청 하나의 측정 값."""
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+        self.template_time = 0.0
+        self.wall_time = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        # 측정 중인 요청에서는 _profile_execute 가 모든 SQL 실행을 이 메서드로 감쌉니다.
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.db_time += time.perf_counter() - start
+            self.queries += 1
+
+
+class MetricsRegistry:
+    """URL 이름별 누적 측정 값. 프로세스 안에서 스레드 간에 공유됩니다."""
+
+    FIELDS = ('requests', 'queries', 'db_seconds', 'template_seconds', 'seconds', 'budget_exceeded')
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._views = defaultdict(lambda: dict.fromkeys(self.FIELDS, 0))
+
+    def record(self, view_name, profile, budget_exceeded=False):
+        with self._lock:
+            values = self._views[view_name]
+            values['requests'] += 1
+            values['queries'] += profile.queries
+            values['db_seconds'] += profile.db_time
+            values['template_seconds'] += profile.template_time
+            values['seconds'] += profile.wall_time
+            values['budget_exceeded'] += int(budget_exceeded)
+
+    def snapshot(self):
+        with self._lock:
+            return {name: dict(values) for name, values in self._views.items()}
+
+    def reset(self):
+        with self._lock:
+            self._views.clear()
+
+
+registry = MetricsRegistry()
+
+_METRIC_HELP = {
+    'requests': ('dashboard_view_requests_total', 'Requests handled, by resolved URL name.'),
+    'queries': ('dashboard_view_queries_total', 'SQL queries executed, by resolved URL name.'),
+    'db_seconds': ('dashboard_view_db_seconds_total', 'Time spent in SQL queries, by resolved URL name.'),
+    'template_seconds': ('dashboard_view_template_seconds_total', 'Time spent rendering templates.'),
+    'seconds': ('dashboard_view_seconds_total', 'Wall time spent handling requests.'),
+    'budget_exceeded': ('dashboard_view_query_budget_exceeded_total', 'Requests over their query budget.'),
+}
+
+
+def _escape_label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def metrics_text():
+    """누적 측정 값과 캐시 적중/실패 횟수를 Prometheus 텍스트 형식으로 반환합니다."""
+    snapshot = registry.snapshot()
+    lines = []
+    for field in MetricsRegistry.FIELDS:
+        metric, help_text = _METRIC_HELP[field]
+        lines.append(f'# HELP {metric} {help_text}')
+        lines.append(f'# TYPE {metric} counter')
+        for view_name in sorted(snapshot):
+            lines.append(f'{metric}{{view="{_escape_label(view_name)}"}} {snapshot[view_name][field]}')
+
+    lines.append('# HELP dashboard_cache_requests_total Cache lookups made through dashboard.caching.')
+    lines.append('# TYPE dashboard_cache_requests_total counter')
+    for name, outcomes in sorted(caching.cache_stats().items()):
+        for outcome, count in sorted(outcomes.items()):
+            lines.append(f'dashboard_cache_requests_total{{name="{_escape_label(name)}",outcome="{outcome}"}} {count}')
+    return '\n'.join(lines) + '\n'
+
+
+class _TimedTemplate:
+    """엔진이 돌려준 템플릿을 감싸 프로파일링 중인 요청의 render() 시간을 잽니다."""
+
+    def __init__(self, template):
+        self._template = template
+
+    def __getattr__(self, name):
+        # origin, template, backend 등은 감싼 템플릿의 것을 그대로 씁니다.
+        return getattr(self._template, name)
+
+    def render(self, context=None, request=None):
+        timer = _current_profile.get()
+        if timer is None:
+            return self._template.render(context, request)
+        depth = _template_depth.get()
+        token = _template_depth.set(depth + 1)
+        start = time.perf_counter()
+        try:
+            return self._template.render(context, request)
+        finally:
+            _template_depth.reset(token)
+            # 가장 바깥 템플릿의 시간만 더해 중첩 렌더링이 두 번 집계되지 않도록 합니다.
+            if depth == 0:
+                timer.template_time += time.perf_counter() - start
+
+
+class ProfilingDjangoTemplates(DjangoTemplates):
+    """
+    템플릿 렌더링 시간을 QueryProfilingMiddleware 의 측정 값에 더하는 DjangoTemplates 백엔드.
+    settings.TEMPLATES 의 BACKEND 로 지정합니다. 옵션은 DjangoTemplates 와 같습니다.
+    """
+
+    def from_string(self, template_code):
+        return _TimedTemplate(super().from_string(template_code))
+
+    def get_template(self, template_name):
+        return _TimedTemplate(super().get_template(template_name))
+
+
+def _profile_execute(execute, sql, params, many, context):
+    profile = _current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+    return profile(execute, sql, params, many, context)
+
+
+def install_query_profiler(connection):
+    """
+    DB 연결에 쿼리 측정용 execute_wrapper 를 한 번만 등록합니다.
+    DB 연결은 스레드마다 따로 있으므로 요청 단위로 감싸면 async 뷰가 sync_to_async 스레드에서 실행하는
+    쿼리를 놓칩니다. 연결마다 항상 등록해 두고 측정할 요청인지는 _current_profile 로 판단합니다.
+    """
+    # connection.execute_wrapper() 는 맨 뒤의 항목을 꺼내므로 맨 앞에 둡니다.
+    if _profile_execute not in connection.execute_wrappers:
+        connection.execute_wrappers.insert(0, _profile_execute)
+
+
+def _install_on_connection_created(sender, connection, **kwargs):
+    install_query_profiler(connection)
+
+
+connection_created.connect(_install_on_connection_created, dispatch_uid='dashboard_query_profiler')
+
+
+class QueryProfilingMiddleware:
+    """
+    요청마다 쿼리 수, DB 시간, 템플릿 렌더링 시간, 전체 처리 시간을 측정하여
+    URL 이름별로 누적하고, 설정된 쿼리 예산을 검사하는 미들웨어.
+
+    WSGI/ASGI 양쪽에서 동작합니다. async 뷰의 ORM 호출은 다른 스레드의 DB 연결에서 실행되지만,
+    측정 값은 컨텍스트 변수로 그 스레드에 전달되고 모든 연결에 install_query_profiler 가 등록되어 있으므로
+    함께 집계됩니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            profile.wall_time = time.perf_counter() - start
+            _current_profile.reset(token)
+        self._finish(request, profile)
+        return response
+
+    async def __acall__(self, request):
+        profile = RequestProfile()
+        token = _current_profile.set(profile)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            profile.wall_time = time.perf_counter() - start
+            _current_profile.reset(token)
+        self._finish(request, profile)
+        return response
+
+    def _finish(self, request, profile):
+        match = getattr(request, 'resolver_match', None)
+        view_name = match.view_name if match else UNRESOLVED_VIEW
+        budget = getattr(settings, 'DASHBOARD_QUERY_BUDGETS', {}).get(view_name)
+        exceeded = budget is not None and profile.queries > budget
+        registry.record(view_name, profile, budget_exceeded=exceeded)
+        if exceeded:
+            self._handle_budget_exceeded(view_name, budget, profile)
+
+    def _handle_budget_exceeded(self, view_name, budget, profile):
+        message = f'{view_name} executed {profile.queries} queries (budget {budget}).'
+        if getattr(settings, 'DASHBOARD_QUERY_BUDGET_ACTION', 'log') == 'raise':
+            raise QueryBudgetExceeded(message)
+        logger.warning(message)
@@ -0,0 +1,143 @@
+"""
+읽기 복제본(read replica) 라우팅.
+
+settings.DATABASES 에 settings.DASHBOARD_REPLICA_DATABASE(기본값 'replica') 별칭이 있으면
+@read_from_replica 로 표시한 읽기 전용 뷰(대시보드, 사용자 목록, 내보내기)의 조회를 그 DB 로 보냅니다.
+그 밖의 뷰와 모든 쓰기는 언제나 'default' 를 사용합니다. 복제본이 설정되어 있지 않으면 아무것도 바꾸지 않습니다.
+
+복제본은 default 보다 늦게 따라오므로, 요청 중에 DB 에 쓴 세션은
+settings.DASHBOARD_REPLICA_STICKY_SECONDS 초 동안 모든 조회를 default 에서 합니다. (sticky-after-write)
+예: 사용자 상태를 바꾼 직후 다시 불러오는 사용자 목록에 변경 내용이 그대로 보입니다.
+이 기간은 ReplicaRoutingMiddleware 가 세션에 기록하므로 SessionMiddleware 뒤에 두어야 합니다.
+"""
+import contextvars
+import time
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+# 세션에 저장하는 "이 시각까지는 default 에서 읽기" 타임스탬프
+STICKY_SESSION_KEY = '_dashboard_db_sticky_until'
+# 복제본에서 읽지 않는 앱. 세션은 방금 쓴 값을 바로 읽어야 합니다.
+PRIMARY_ONLY_APPS = {'sessions'}
+
+# 현재 요청의 라우팅 상태 (ReplicaRoutingMiddleware 가 요청마다 설정)
+_request_state = contextvars.ContextVar('dashboard_db_request_state', default=None)
+# @read_from_replica 뷰를 실행하는 동안 조회에 쓸 DB 별칭
+_read_alias = contextvars.ContextVar('dashboard_db_read_alias', default=None)
+
+
+class _RequestState:
+    def __init__(self, sticky):
+        self.sticky = sticky
+        self.wrote = False
+
+
+def replica_alias():
+    """설정된 복제본 별칭을 반환합니다. DATABASES 에 없으면 None."""
+    alias = getattr(settings, 'DASHBOARD_REPLICA_DATABASE', 'replica')
+    return alias if alias in connections.settings else None
+
+
+def _replica_for_request():
+    state = _request_state.get()
+    if state is not None and (state.sticky or state.wrote):
+        return None
+    return replica_alias()
+
+
+def read_from_replica(view_func):
+    """
+    뷰 안의 조회를 복제본으로 보내는 데코레이터. (sync/async 뷰 모두 지원)
+    권한 검사는 항상 default 에서 하도록 staff_member_required 같은 데코레이터보다 안쪽에 둡니다.
+    """
+    if iscoroutinefunction(view_func):
+        @wraps(view_func)
+        async def wrapper(request, *args, **kwargs):
+            token = _read_alias.set(_replica_for_request())
+            try:
+                return await view_func(request, *args, **kwargs)
+            finally:
+                _read_alias.reset(token)
+    else:
+        @wraps(view_func)
+        def wrapper(request, *args, **kwargs):
+            token = _read_alias.set(_replica_for_request())
+            try:
+                return view_func(request, *args, **kwargs)
+            finally:
+                _read_alias.reset(token)
+    return wrapper
+
+
+class ReplicaRouter:
+    """settings.DATABASE_ROUTERS 에 등록하는 라우터."""
+
+    def db_for_read(self, model, **hints):
+        if model._meta.app_label in PRIMARY_ONLY_APPS:
+            return DEFAULT_DB_ALIAS
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        state = _request_state.get()
+        if state is not None:
+            state.wrote = True
+        # 복제본에서 읽은 인스턴스도 저장은 default 로 합니다. (None 이면 인스턴스를 읽은 DB 에 씁니다.)
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 default 와 같은 데이터이므로 어느 쪽에서 읽은 객체끼리든 연결할 수 있습니다.
+        aliases = {DEFAULT_DB_ALIAS, getattr(settings, 'DASHBOARD_REPLICA_DATABASE', 'replica')}
+        if obj1._state.db in aliases and obj2._state.db in aliases:
+            return True
+        return None
+
+    def allow_migrate(self, db, app_label, **hints):
+        # 복제본의 스키마는 default 에서 복제됩니다.
+        if db == getattr(settings, 'DASHBOARD_REPLICA_DATABASE', 'replica'):
+            return False
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """
+    요청 중에 DB 쓰기가 있었으면 세션에 sticky 기간을 기록하고,
+    그 기간 안의 요청은 @read_from_replica 뷰에서도 default 에서 읽게 하는 미들웨어.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(self.get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        if replica_alias() is None:
+            return self.get_response(request)
+        state = _RequestState(sticky=request.session.get(STICKY_SESSION_KEY, 0) > time.time())
+        token = _request_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        if state.wrote:
+            request.session[STICKY_SESSION_KEY] = time.time() + settings.DASHBOARD_REPLICA_STICKY_SECONDS
+        return response
+
+    async def __acall__(self, request):
+        if replica_alias() is None:
+            return await self.get_response(request)
+        state = _RequestState(sticky=await request.session.aget(STICKY_SESSION_KEY, 0) > time.time())
+        token = _request_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_state.reset(token)
+        if state.wrote:
+            await request.session.aset(STICKY_SESSION_KEY, time.time() + settings.DASHBOARD_REPLICA_STICKY_SECONDS)
+        return response
@@ -0,0 +1,370 @@
+"""
+게시글/댓글 전문 검색과 관리자용 사용자 검색.
+
+제목·본문·댓글 내용을 토큰으로 나눈 역색인을 유지하고, 저장/삭제 시그널로 증분 갱신합니다.
+SQLite 에서 FTS5 를 쓸 수 있으면 FTS5 가상 테이블을, 그렇지 않으면 SearchToken 테이블에
+파이썬으로 토큰화한 결과를 저장하는 방식을 사용합니다.
+
+한국어는 조사가 붙어도 검색되도록 한글 구간을 2글자 단위(bigram)로 나누어 색인합니다.
+예) "게시판에서" -> "게시", "시판", "판에", "에서"
+
+사용자 검색은 사용자명·이메일·이름을 하나로 정규화한 문자열에 대해 부분 문자열 일치를 지원합니다.
+FTS5 에서는 trigram 토크나이저 색인을, 대체 백엔드나 trigram 을 지원하지 않는 SQLite(3.34 미만)에서는
+UserSearchIndex 의 좁은 컬럼을 사용합니다.
+"""
+import re
+import sqlite3
+import unicodedata
+from collections import Counter
+from contextlib import closing
+from functools import lru_cache
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.db.models import Case, IntegerField, Max, Q, Sum, When
+from django.db.models.expressions import RawSQL
+
+from .models import Comment, Post, SearchToken, UserSearchIndex
+
+# 한글 음절 구간과 그 밖의 단어 문자 구간을 나누어 찾습니다.
+_TOKEN_RE = re.compile(r'[가-힣]+|[^\W_가-힣]+')
+
+# 필드별 가중치 (제목 일치를 본문/댓글 일치보다 높게 평가합니다.)
+TITLE_WEIGHT = 3
+CONTENT_WEIGHT = 1
+COMMENT_WEIGHT = 1
+
+POST_FTS_TABLE = 'dashboard_post_fts'
+COMMENT_FTS_TABLE = 'dashboard_comment_fts'
+USER_FTS_TABLE = 'dashboard_user_fts'
+
+# 사용자 검색 색인에 영향을 주는 User 필드
+USER_SEARCH_FIELDS = ('username', 'email', 'first_name', 'last_name')
+
+# trigram 색인은 3글자 이상의 검색어에만 사용할 수 있습니다.
+TRIGRAM_MIN_LENGTH = 3
+
+
+def tokenize(text):
+    """검색용 토큰 목록을 반환합니다. 한글 구간은 2글자 단위로 겹쳐 나눕니다."""
+    tokens = []
+    for word in _TOKEN_RE.findall(unicodedata.normalize('NFKC', text or '').lower()):
+        if '가' <= word[0] <= '힣' and len(word) > 1:
+            tokens.extend(word[i:i + 2] for i in range(len(word) - 1))
+        else:
+            tokens.append(word)
+    return tokens
+
+
+def normalize_user_text(user):
+    """
+    사용자 검색용 정규화 문자열을 만듭니다. 한국식 이름(성+이름) 표기로도 찾을 수 있도록
+    last_name + first_name 을 함께 넣습니다.
+    """
+    parts = [user.username, user.email, f'{user.first_name} {user.last_name}', f'{user.last_name}{user.first_name}']
+    return normalize_user_query('\n'.join(part for part in parts if part.strip()))
+
+
+def normalize_user_query(text):
+    return unicodedata.normalize('NFKC', text or '').lower().strip()
+
+
+def parse_query(query):
+    """
+    검색어를 (토큰, 접두어 일치 여부) 목록으로 바꿉니다.
+    한 글자 한글 검색어는 그 글자로 시작하는 bigram 과 접두어로 일치시킵니다.
+    """
+    terms = []
+    for token in dict.fromkeys(tokenize(query)):
+        terms.append((token, len(token) == 1 and '가' <= token <= '힣'))
+    return terms
+
+
+class SQLiteFTS5Backend:
+    """SQLite FTS5 가상 테이블을 사용하는 검색 백엔드. 순위는 bm25() 로 계산합니다."""
+
+    def index_post(self, post):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {POST_FTS_TABLE} WHERE rowid = %s', [post.pk])
+            cursor.execute(
+                f'INSERT INTO {POST_FTS_TABLE} (rowid, title, content) VALUES (%s, %s, %s)',
+                [post.pk, ' '.join(tokenize(post.title)), ' '.join(tokenize(post.content))],
+            )
+
+    def remove_post(self, post_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {POST_FTS_TABLE} WHERE rowid = %s', [post_id])
+
+    def index_comment(self, comment):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {COMMENT_FTS_TABLE} WHERE rowid = %s', [comment.pk])
+            cursor.execute(
+                f'INSERT INTO {COMMENT_FTS_TABLE} (rowid, content, post_id) VALUES (%s, %s, %s)',
+                [comment.pk, ' '.join(tokenize(comment.content)), comment.post_id],
+            )
+
+    def remove_comment(self, comment_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {COMMENT_FTS_TABLE} WHERE rowid = %s', [comment_id])
+
+    def index_new_posts(self, posts):
+        # 아직 색인에 없는 게시글(일괄 가져오기 등)은 지울 항목이 없으므로 INSERT 만 한 번에 실행합니다.
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {POST_FTS_TABLE} (rowid, title, content) VALUES (%s, %s, %s)',
+                [(post.pk, ' '.join(tokenize(post.title)), ' '.join(tokenize(post.content))) for post in posts],
+            )
+
+    def index_new_comments(self, comments):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {COMMENT_FTS_TABLE} (rowid, content, post_id) VALUES (%s, %s, %s)',
+                [(comment.pk, ' '.join(tokenize(comment.content)), comment.post_id) for comment in comments],
+            )
+
+    def clear(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {POST_FTS_TABLE}')
+            cursor.execute(f'DELETE FROM {COMMENT_FTS_TABLE}')
+
+    def index_user(self, user):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {USER_FTS_TABLE} WHERE rowid = %s', [user.pk])
+            cursor.execute(
+                f'INSERT INTO {USER_FTS_TABLE} (rowid, text) VALUES (%s, %s)', [user.pk, normalize_user_text(user)]
+            )
+
+    def index_new_users(self, users):
+        with connection.cursor() as cursor:
+            cursor.executemany(
+                f'INSERT INTO {USER_FTS_TABLE} (rowid, text) VALUES (%s, %s)',
+                [(user.pk, normalize_user_text(user)) for user in users],
+            )
+
+    def remove_user(self, user_id):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {USER_FTS_TABLE} WHERE rowid = %s', [user_id])
+
+    def clear_users(self):
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {USER_FTS_TABLE}')
+
+    def filter_users(self, queryset, query):
+        if len(query) >= TRIGRAM_MIN_LENGTH:
+            # trigram 색인으로 부분 문자열 일치를 찾습니다.
+            sql = f'SELECT rowid FROM {USER_FTS_TABLE} WHERE {USER_FTS_TABLE} MATCH %s'
+            params = ['"{}"'.format(query.replace('"', '""'))]
+        else:
+            # 1~2 글자 검색어는 색인을 쓸 수 없으므로 정규화된 짧은 문자열만 훑습니다.
+            sql = f"SELECT rowid FROM {USER_FTS_TABLE} WHERE text LIKE %s ESCAPE '\\'"
+            params = ['%{}%'.format(re.sub(r'([\\%_])', r'\\\1', query))]
+        return queryset.filter(pk__in=RawSQL(sql, params))
+
+    def search(self, terms, limit, offset=0):
+        match = ' AND '.join(
+            '"{}"{}'.format(token.replace('"', '""'), '*' if prefix else '') for token, prefix in terms
+        )
+        # bm25() 는 값이 작을수록 관련도가 높습니다. 댓글 일치는 절반만 반영합니다.
+        sql = f'''
+            SELECT post_id, MIN(score) AS score FROM (
+                SELECT rowid AS post_id, bm25({POST_FTS_TABLE}, {TITLE_WEIGHT}, {CONTENT_WEIGHT}) AS score
+                  FROM {POST_FTS_TABLE} WHERE {POST_FTS_TABLE} MATCH %s
+                UNION ALL
+                SELECT post_id, bm25({COMMENT_FTS_TABLE}, {COMMENT_WEIGHT}) * 0.5 AS score
+                  FROM {COMMENT_FTS_TABLE} WHERE {COMMENT_FTS_TABLE} MATCH %s
+            )
+            GROUP BY post_id ORDER BY score, post_id DESC LIMIT %s OFFSET %s
+        '''
+        with connection.cursor() as cursor:
+            cursor.execute(sql, [match, match, limit, offset])
+            return [post_id for post_id, _ in cursor.fetchall()]
+
+
+class TokenTableBackend:
+    """
+    FTS5 를 쓸 수 없는 DB 를 위한 대체 백엔드.
+    파이썬으로 토큰화한 (토큰, 게시글, 가중치) 행을 SearchToken 테이블에 저장합니다.
+    """
+
+    def _post_tokens(self, post):
+        weights = Counter()
+        for token in tokenize(post.title):
+            weights[token] += TITLE_WEIGHT
+        for token in tokenize(post.content):
+            weights[token] += CONTENT_WEIGHT
+        return [
+            SearchToken(term=term[:SearchToken.TERM_MAX_LENGTH], post_id=post.pk, weight=weight)
+            for term, weight in weights.items()
+        ]
+
+    def _comment_tokens(self, comment):
+        return [
+            SearchToken(
+                term=term[:SearchToken.TERM_MAX_LENGTH], post_id=comment.post_id,
+                comment_id=comment.pk, weight=count * COMMENT_WEIGHT,
+            )
+            for term, count in Counter(tokenize(comment.content)).items()
+        ]
+
+    def index_post(self, post):
+        SearchToken.objects.filter(post_id=post.pk, comment__isnull=True).delete()
+        SearchToken.objects.bulk_create(self._post_tokens(post))
+
+    def remove_post(self, post_id):
+        # SearchToken 은 Post 에 CASCADE 로 연결되어 함께 삭제됩니다.
+        pass
+
+    def index_comment(self, comment):
+        SearchToken.objects.filter(comment_id=comment.pk).delete()
+        SearchToken.objects.bulk_create(self._comment_tokens(comment))
+
+    def remove_comment(self, comment_id):
+        pass
+
+    def index_new_posts(self, posts):
+        SearchToken.objects.bulk_create(
+            [token for post in posts for token in self._post_tokens(post)], batch_size=1000,
+        )
+
+    def index_new_comments(self, comments):
+        SearchToken.objects.bulk_create(
+            [token for comment in comments for token in self._comment_tokens(comment)], batch_size=1000,
+        )
+
+    def clear(self):
+        SearchToken.objects.all().delete()
+
+    def index_user(self, user):
+        UserSearchIndex.objects.update_or_create(user_id=user.pk, defaults={'text': normalize_user_text(user)})
+
+    def index_new_users(self, users):
+        UserSearchIndex.objects.bulk_create(
+            [UserSearchIndex(user_id=user.pk, text=normalize_user_text(user)) for user in users], batch_size=1000,
+        )
+
+    def remove_user(self, user_id):
+        # UserSearchIndex 는 User 에 CASCADE 로 연결되어 함께 삭제됩니다.
+        pass
+
+    def clear_users(self):
+        UserSearchIndex.objects.all().delete()
+
+    def filter_users(self, queryset, query):
+        return queryset.filter(pk__in=UserSearchIndex.objects.filter(text__contains=query).values('user_id'))
+
+    def search(self, terms, limit, offset=0):
+        term_filters = [Q(term__startswith=token) if prefix else Q(term=token) for token, prefix in terms]
+        matched = {
+            f'matched_{i}': Max(Case(When(term_filter, then=1), default=0, output_field=IntegerField()))
+            for i, term_filter in enumerate(term_filters)
+        }
+        any_term = Q()
+        for term_filter in term_filters:
+            any_term |= term_filter
+        rows = (
+            SearchToken.objects.filter(any_term)
+            .values('post_id')
+            .annotate(score=Sum('weight'), **matched)
+            # 모든 검색어가 한 게시글(본문 또는 댓글) 안에 있어야 합니다.
+            .filter(**{name: 1 for name in matched})
+            .order_by('-score', '-post_id')
+        )
+        return [row['post_id'] for row in rows[offset:offset + limit]]
+
+
+@lru_cache(maxsize=None)
+def _sqlite_has_fts5():
+    try:
+        with closing(sqlite3.connect(':memory:')) as db:
+            db.execute('CREATE VIRTUAL TABLE fts5_probe USING fts5(body)')
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=None)
+def _sqlite_has_trigram():
+    # trigram 토크나이저는 SQLite 3.34 부터 지원합니다.
+    try:
+        with closing(sqlite3.connect(':memory:')) as db:
+            db.execute("CREATE VIRTUAL TABLE fts5_probe USING fts5(body, tokenize='trigram')")
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+def fts5_available(using=None):
+    """현재 DB 가 FTS5 를 지원하는 SQLite 인지 확인합니다."""
+    return (using or connection).vendor == 'sqlite' and _sqlite_has_fts5()
+
+
+def fts5_trigram_available(using=None):
+    """현재 DB 가 FTS5 trigram 토크나이저(사용자 검색 색인)를 지원하는 SQLite 인지 확인합니다."""
+    return fts5_available(using) and _sqlite_has_trigram()
+
+
+@lru_cache(maxsize=None)
+def _backend_for(name):
+    return SQLiteFTS5Backend() if name == 'fts5' else TokenTableBackend()
+
+
+def get_backend():
+    """
+    settings.DASHBOARD_SEARCH_BACKEND ('auto', 'fts5', 'tokens') 에 따라 검색 백엔드를 반환합니다.
+    'auto' 이면 FTS5 를 쓸 수 있을 때 FTS5 를 사용합니다.
+    """
+    name = getattr(settings, 'DASHBOARD_SEARCH_BACKEND', 'auto')
+    if name == 'auto':
+        name = 'fts5' if fts5_available() else 'tokens'
+    return _backend_for(name)
+
+
+def get_user_backend():
+    """
+    사용자 검색 색인의 백엔드. FTS5 백엔드를 쓰더라도 trigram 토크나이저가 없는 SQLite(3.34 미만)에서는
+    사용자 색인만 UserSearchIndex(대체 백엔드)를 사용합니다.
+    """
+    name = getattr(settings, 'DASHBOARD_SEARCH_BACKEND', 'auto')
+    return _backend_for('fts5' if name != 'tokens' and fts5_trigram_available() else 'tokens')
+
+
+def search_posts(query, limit=10, offset=0):
+    """검색어와 관련도가 높은 순서대로 게시글 id 목록을 반환합니다."""
+    terms = parse_query(query)
+    if not terms:
+        return []
+    return get_backend().search(terms, limit, offset)
+
+
+def filter_users(queryset, query):
+    """사용자명·이메일·이름 중 하나에 검색어가 포함된 사용자만 남긴 queryset 을 반환합니다."""
+    query = normalize_user_query(query)
+    if not query:
+        return queryset
+    return get_user_backend().filter_users(queryset, query)
+
+
+def rebuild_user_index(batch_size=1000):
+    """사용자 검색 색인을 비우고 모든 사용자를 다시 색인합니다. 색인한 사용자 수를 반환합니다."""
+    backend = get_user_backend()
+    backend.clear_users()
+    total = 0
+    for user in User.objects.only('pk', *USER_SEARCH_FIELDS).iterator(chunk_size=batch_size):
+        backend.index_user(user)
+        total += 1
+    return total
+
+
+def rebuild_index(batch_size=1000):
+    """검색 색인을 비우고 모든 게시글과 댓글을 다시 색인합니다. 색인한 (게시글, 댓글) 수를 반환합니다."""
+    backend = get_backend()
+    backend.clear()
+    post_total = comment_total = 0
+    for post in Post.objects.only('pk', 'title', 'content').iterator(chunk_size=batch_size):
+        backend.index_post(post)
+        post_total += 1
+    for comment in Comment.objects.only('pk', 'post_id', 'content').iterator(chunk_size=batch_size):
+        backend.index_comment(comment)
+        comment_total += 1
+    return post_total, comment_total
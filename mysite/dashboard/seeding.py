@@ -0,0 +1,149 @@
+"""
+성능 측정용 합성 데이터 생성기.
+
+같은 seed 로 실행하면 같은 사용자/게시글/댓글/좋아요/북마크 구성이 만들어집니다.
+(생성 시각은 실행 시점을 기준으로 한 상대값이므로 절대 시각만 달라집니다.)
+
+bulk_create 는 post_save 시그널을 보내지 않으므로 데이터를 모두 넣은 뒤
+DashboardStats, 게시글 카운터, 캐시를 한 번에 다시 맞추고, 새로 만든 행만 검색 색인에 더합니다.
+
+캐시 무효화는 이 프로세스가 보는 Django 캐시의 버전을 올리는 것이므로, 실행 중인 서버가
+프로세스별 캐시(dashboard.checks.PROCESS_LOCAL_CACHES)를 쓴다면 서버를 다시 시작해야
+새 데이터가 게시글 목록·대시보드에 보입니다. DASHBOARD_CACHE_DIR 로 공유 캐시를 쓰면 바로 반영됩니다.
+"""
+import random
+from datetime import timedelta
+
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.db import transaction
+from django.utils import timezone
+
+from . import caching
+from .models import Bookmark, Category, Comment, DailyActivity, DashboardStats, Like, Post
+from .search import get_backend, get_user_backend
+
+SEED_PASSWORD = 'password'
+
+_WORDS = [
+    '성능', '게시판', '대시보드', '캐시', '인덱스', '쿼리', '페이지', '댓글', '좋아요', '검색',
+    'django', 'sqlite', 'python', 'benchmark', 'latency', 'throughput', 'index', 'cursor',
+]
+
+
+def _sentence(rng, words):
+    return ' '.join(rng.choice(_WORDS) for _ in range(words))
+
+
+def _unique_pairs(rng, count, left, right):
+    """(left[i], right[j]) 조합 중 서로 다른 count 개를 고릅니다. (unique_together 충돌 방지)"""
+    count = min(count, len(left) * len(right))
+    return [(left[n // len(right)], right[n % len(right)]) for n in rng.sample(range(len(left) * len(right)), count)]
+
+
+def _set_created_at(model, objects, field, batch_size):
+    # auto_now_add 필드는 bulk_create 에서 현재 시각으로 덮어써지므로 생성 후 다시 맞춥니다.
+    model.objects.bulk_update(objects, [field], batch_size=batch_size)
+
+
+def seed(users=100, categories=5, posts=1000, comments=5000, likes=5000, bookmarks=1000,
+         seed=0, batch_size=1000, prefix='seed', log=None):
+    """
+    합성 데이터를 만들고 모델별 생성 건수를 dict 로 반환합니다.
+    사용자 이름은 '<prefix><seed>_<번호>' 형식이므로 seed 나 prefix 가 다르면 여러 번 넣을 수 있습니다.
+    """
+    rng = random.Random(seed)
+    now = timezone.now()
+    log = log or (lambda message: None)
+    name_prefix = f'{prefix}{seed}_'
+    created = {}
+
+    with transaction.atomic():
+        password = make_password(SEED_PASSWORD, salt=f'{name_prefix}salt')
+        user_objs = [
+            User(
+                username=f'{name_prefix}{i:06d}', email=f'{name_prefix}{i:06d}@example.com',
+                password=password, first_name=f'사용자{i}', last_name=rng.choice(['김', '이', '박', '최', '정']),
+                is_active=rng.random() > 0.05, date_joined=now - timedelta(minutes=rng.randrange(525600)),
+            )
+            for i in range(users)
+        ]
+        user_objs = User.objects.bulk_create(user_objs, batch_size=batch_size)
+        created['users'] = len(user_objs)
+        log(f'사용자 {len(user_objs)}명')
+
+        DailyActivity.objects.bulk_create(
+            [
+                DailyActivity(user=user, date=(now - timedelta(days=day)).date())
+                for user in user_objs
+                for day in sorted(rng.sample(range(365), rng.randrange(1, 8)))
+            ],
+            batch_size=batch_size, ignore_conflicts=True,
+        )
+
+        category_objs = Category.objects.bulk_create(
+            [Category(name=f'{name_prefix}카테고리 {i}') for i in range(categories)], batch_size=batch_size,
+        )
+        created['categories'] = len(category_objs)
+
+        post_objs = []
+        if user_objs and category_objs:
+            post_objs = Post.objects.bulk_create(
+                [
+                    Post(
+                        author=rng.choice(user_objs), category=rng.choice(category_objs),
+                        title=_sentence(rng, rng.randint(2, 6)), content=_sentence(rng, rng.randint(10, 80)),
+                    )
+                    for _ in range(posts)
+                ],
+                batch_size=batch_size,
+            )
+            for post in post_objs:
+                post.created_at = now - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+            _set_created_at(Post, post_objs, 'created_at', batch_size)
+        created['posts'] = len(post_objs)
+        log(f'게시글 {len(post_objs)}건')
+
+        comment_objs = []
+        if post_objs:
+            comment_objs = Comment.objects.bulk_create(
+                [
+                    Comment(post=rng.choice(post_objs), author=rng.choice(user_objs),
+                            content=_sentence(rng, rng.randint(3, 30)))
+                    for _ in range(comments)
+                ],
+                batch_size=batch_size,
+            )
+            for comment in comment_objs:
+                comment.created_at = min(now, comment.post.created_at + timedelta(seconds=rng.randrange(7 * 24 * 3600)))
+            _set_created_at(Comment, comment_objs, 'created_at', batch_size)
+        created['comments'] = len(comment_objs)
+        log(f'댓글 {len(comment_objs)}건')
+
+        like_pairs = _unique_pairs(rng, likes, post_objs, user_objs)
+        Like.objects.bulk_create([Like(post=post, user=user) for post, user in like_pairs], batch_size=batch_size)
+        created['likes'] = len(like_pairs)
+
+        bookmark_pairs = _unique_pairs(rng, bookmarks, post_objs, user_objs)
+        Bookmark.objects.bulk_create(
+            [Bookmark(post=post, user=user) for post, user in bookmark_pairs], batch_size=batch_size,
+        )
+        created['bookmarks'] = len(bookmark_pairs)
+        log(f'좋아요 {len(like_pairs)}건, 북마크 {len(bookmark_pairs)}건')
+
+        DashboardStats.rebuild()
+        for start in range(0, len(post_objs), batch_size):
+            Post.objects.filter(pk__in=[post.pk for post in post_objs[start:start + batch_size]]).refresh_counters()
+        # 기존 색인은 그대로 두고 이번에 만든 행만 더합니다.
+        backend = get_backend()
+        for start in range(0, len(post_objs), batch_size):
+            backend.index_new_posts(post_objs[start:start + batch_size])
+        for start in range(0, len(comment_objs), batch_size):
+            backend.index_new_comments(comment_objs[start:start + batch_size])
+        user_backend = get_user_backend()
+        for start in range(0, len(user_objs), batch_size):
+            user_backend.index_new_users(user_objs[start:start + batch_size])
+        log('집계 값을 다시 계산하고 새 행을 검색 색인에 추가했습니다.')
+
+    caching.invalidate(caching.BOARD, caching.POST_LIST, caching.DASHBOARD)
+    return created
@@ -0,0 +1,213 @@
+from django.contrib.auth.models import User
+from django.contrib.auth.signals import user_logged_in
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.template.loader import render_to_string
+
+from . import auth, caching, categories, live, search
+from .models import Bookmark, Category, Comment, DailyActivity, DashboardStats, Like, Post, like_toggled
+
+# 요약 카드에 집계되는 모델과 DashboardStats 필드의 대응 관계
+STATS_COUNTER_FIELDS = {
+    User: 'user_count',
+    Post: 'post_count',
+    Comment: 'comment_count',
+    Like: 'like_count',
+    Bookmark: 'bookmark_count',
+}
+
+
+def _update_stats_on_save(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        DashboardStats.adjust(STATS_COUNTER_FIELDS[sender], 1)
+
+
+def _update_stats_on_delete(sender, instance, **kwargs):
+    DashboardStats.adjust(STATS_COUNTER_FIELDS[sender], -1)
+
+
+for _model in STATS_COUNTER_FIELDS:
+    post_save.connect(_update_stats_on_save, sender=_model, dispatch_uid=f'dashboard_stats_save_{_model.__name__}')
+    post_delete.connect(_update_stats_on_delete, sender=_model, dispatch_uid=f'dashboard_stats_delete_{_model.__name__}')
+
+
+# Post 의 비정규화 카운터를 증감시키는 모델과 Post 필드의 대응 관계
+POST_COUNTER_FIELDS = {
+    Like: 'like_count',
+    Comment: 'comment_count',
+    Bookmark: 'bookmark_count',
+}
+
+
+def _adjust_post_counter(sender, post_id, delta):
+    Post.objects.filter(pk=post_id).adjust_counter(POST_COUNTER_FIELDS[sender], delta)
+
+
+def _update_post_counter_on_save(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        _adjust_post_counter(sender, instance.post_id, 1)
+
+
+def _update_post_counter_on_delete(sender, instance, **kwargs):
+    _adjust_post_counter(sender, instance.post_id, -1)
+
+
+for _model in POST_COUNTER_FIELDS:
+    post_save.connect(_update_post_counter_on_save, sender=_model, dispatch_uid=f'post_counter_save_{_model.__name__}')
+    post_delete.connect(_update_post_counter_on_delete, sender=_model, dispatch_uid=f'post_counter_delete_{_model.__name__}')
+
+
+def _record_daily_activity(sender, request, user, **kwargs):
+    DailyActivity.record(user)
+
+
+user_logged_in.connect(_record_daily_activity, dispatch_uid='dashboard_daily_activity_login')
+
+
+# 검색 색인은 게시글/댓글 저장과 삭제 시 증분으로 갱신합니다.
+def _index_post(sender, instance, raw=False, **kwargs):
+    if not raw:
+        search.get_backend().index_post(instance)
+
+
+def _unindex_post(sender, instance, **kwargs):
+    search.get_backend().remove_post(instance.pk)
+
+
+def _index_comment(sender, instance, raw=False, **kwargs):
+    if not raw:
+        search.get_backend().index_comment(instance)
+
+
+def _unindex_comment(sender, instance, **kwargs):
+    search.get_backend().remove_comment(instance.pk)
+
+
+post_save.connect(_index_post, sender=Post, dispatch_uid='search_index_post')
+post_delete.connect(_unindex_post, sender=Post, dispatch_uid='search_unindex_post')
+post_save.connect(_index_comment, sender=Comment, dispatch_uid='search_index_comment')
+post_delete.connect(_unindex_comment, sender=Comment, dispatch_uid='search_unindex_comment')
+
+
+def _index_user(sender, instance, raw=False, update_fields=None, **kwargs):
+    # 로그인 시 last_login 만 갱신하는 저장 등, 검색 필드와 무관한 저장은 건너뜁니다.
+    if raw or (update_fields is not None and not set(update_fields) & set(search.USER_SEARCH_FIELDS)):
+        return
+    search.get_user_backend().index_user(instance)
+
+
+def _unindex_user(sender, instance, **kwargs):
+    search.get_user_backend().remove_user(instance.pk)
+
+
+post_save.connect(_index_user, sender=User, dispatch_uid='search_index_user')
+post_delete.connect(_unindex_user, sender=User, dispatch_uid='search_unindex_user')
+
+
+# 캐시 무효화: 변경된 데이터가 보이는 화면의 네임스페이스 버전을 올립니다.
+def _invalidate_post_cache(sender, instance, **kwargs):
+    caching.invalidate_on_commit(caching.POST_LIST, caching.post_namespace(instance.pk), caching.DASHBOARD)
+
+
+def _invalidate_comment_cache(sender, instance, **kwargs):
+    caching.invalidate_on_commit(caching.post_namespace(instance.post_id))
+
+
+def _invalidate_like_cache(sender, post_id=None, user=None, instance=None, **kwargs):
+    # 좋아요 수는 모든 사용자의 목록에 보이므로 공용 목록을, 좋아요 여부는 누른 사용자의 표시만 무효화합니다.
+    if instance is not None:
+        post_id, user_id = instance.post_id, instance.user_id
+    else:
+        user_id = user.pk
+    caching.invalidate_on_commit(caching.POST_LIST, caching.post_namespace(post_id), caching.user_namespace(user_id))
+
+
+def _invalidate_bookmark_cache(sender, instance, **kwargs):
+    # 목록에는 북마크 수가 없으므로 공용 목록은 그대로 두고 북마크한 사용자의 표시와 상세 화면만 무효화합니다.
+    caching.invalidate_on_commit(caching.post_namespace(instance.post_id), caching.user_namespace(instance.user_id))
+
+
+def _invalidate_board_cache(sender, **kwargs):
+    caching.invalidate_on_commit(caching.BOARD)
+
+
+def _invalidate_category_cache(sender, **kwargs):
+    # 폼 선택지와 게시글의 카테고리 이름에 쓰는 프로세스 로컬 목록 (dashboard/categories.py)
+    categories.invalidate()
+
+
+def _invalidate_user_cache_on_save(sender, instance, created, raw=False, update_fields=None, **kwargs):
+    if raw:
+        return
+    if created:
+        caching.invalidate_on_commit(caching.DASHBOARD)
+    elif update_fields is None or 'username' in update_fields:
+        # 게시판 조각에는 작성자 이름이 들어가므로 사용자명이 바뀔 수 있는 저장이면 게시판 전체를 무효화합니다.
+        caching.invalidate_on_commit(caching.BOARD, caching.DASHBOARD)
+
+
+def _invalidate_user_cache_on_delete(sender, instance, **kwargs):
+    caching.invalidate_on_commit(caching.BOARD, caching.DASHBOARD)
+
+
+def _invalidate_auth_user(sender, instance, **kwargs):
+    # 로그인 사용자 캐시 (dashboard/auth.py). 비활성화나 비밀번호 변경이 다음 요청에 바로 반영됩니다.
+    auth.invalidate_users([instance.pk])
+
+
+post_save.connect(_invalidate_post_cache, sender=Post, dispatch_uid='cache_post_save')
+post_delete.connect(_invalidate_post_cache, sender=Post, dispatch_uid='cache_post_delete')
+post_save.connect(_invalidate_comment_cache, sender=Comment, dispatch_uid='cache_comment_save')
+post_delete.connect(_invalidate_comment_cache, sender=Comment, dispatch_uid='cache_comment_delete')
+post_save.connect(_invalidate_like_cache, sender=Like, dispatch_uid='cache_like_save')
+post_delete.connect(_invalidate_like_cache, sender=Like, dispatch_uid='cache_like_delete')
+like_toggled.connect(_invalidate_like_cache, dispatch_uid='cache_like_toggled')
+post_save.connect(_invalidate_bookmark_cache, sender=Bookmark, dispatch_uid='cache_bookmark_save')
+post_delete.connect(_invalidate_bookmark_cache, sender=Bookmark, dispatch_uid='cache_bookmark_delete')
+post_save.connect(_invalidate_board_cache, sender=Category, dispatch_uid='cache_category_save')
+post_delete.connect(_invalidate_board_cache, sender=Category, dispatch_uid='cache_category_delete')
+post_save.connect(_invalidate_category_cache, sender=Category, dispatch_uid='category_cache_save')
+post_delete.connect(_invalidate_category_cache, sender=Category, dispatch_uid='category_cache_delete')
+post_save.connect(_invalidate_user_cache_on_save, sender=User, dispatch_uid='cache_user_save')
+post_delete.connect(_invalidate_user_cache_on_delete, sender=User, dispatch_uid='cache_user_delete')
+post_save.connect(_invalidate_auth_user, sender=User, dispatch_uid='auth_user_cache_save')
+post_delete.connect(_invalidate_auth_user, sender=User, dispatch_uid='auth_user_cache_delete')
+
+
+# 게시글 상세 화면의 실시간 갱신(SSE): 커밋된 변경만 구독자에게 보냅니다.
+def _publish_like_toggled(sender, post_id, is_liked, like_count, **kwargs):
+    # like_toggled 는 이미 커밋 후에 보내지므로 바로 전달합니다.
+    live.publish(post_id, {'type': 'like', 'delta': 1 if is_liked else -1, 'like_count': like_count})
+
+
+def _publish_like_saved(sender, instance, created, raw=False, **kwargs):
+    # 관리자 화면 등 Like.toggle() 을 거치지 않는 변경. 좋아요 수는 화면에서 delta 로 맞춥니다.
+    if created and not raw:
+        transaction.on_commit(lambda: live.publish(instance.post_id, {'type': 'like', 'delta': 1}))
+
+
+def _publish_like_deleted(sender, instance, **kwargs):
+    transaction.on_commit(lambda: live.publish(instance.post_id, {'type': 'like', 'delta': -1}))
+
+
+def _publish_comment(sender, instance, created, raw=False, **kwargs):
+    if not created or raw:
+        return
+    post_id = instance.post_id
+
+    def publish():
+        # 보고 있는 연결이 없으면 렌더링하지 않고, 있으면 구독자 수와 관계없이 한 번만 렌더링합니다.
+        if not live.has_subscribers(post_id):
+            return
+        html = render_to_string('dashboard/_comment_list.html', {
+            'comments': [instance], 'post_id': post_id, 'is_first_page': False,
+        })
+        live.publish(post_id, {'type': 'comment', 'html': html})
+
+    transaction.on_commit(publish)
+
+
+like_toggled.connect(_publish_like_toggled, dispatch_uid='live_like_toggled')
+post_save.connect(_publish_like_saved, sender=Like, dispatch_uid='live_like_save')
+post_delete.connect(_publish_like_deleted, sender=Like, dispatch_uid='live_like_delete')
+post_save.connect(_publish_comment, sender=Comment, dispatch_uid='live_comment_save')
@@ -3,8 +3,8 @@
  * - 사이드바 토글
  * - 페이지 전환 (SPA처럼 동작)
  * - 다크 모드 테마 전환 및 저장
- * - Chart.js를 이용한 차트 렌더링 및 테마 업데이트
- * - 사용자 상태 변경 및 검색
+ * - Chart.js를 이용한 차트 렌더링(데이터는 chart_data 엔드포인트에서 조회) 및 테마 업데이트
+ * - 사용자 상태 변경(개별/일괄) 및 검색
  */
 document.addEventListener('DOMContentLoaded', () => {
     // 전역에서 사용할 차트 인스턴스 변수
@@ -124,13 +124,13 @@ document.addEventListener('DOMContentLoaded', () => {
         chartInstance.update();
     };
 
-    const createMauChart = () => {
+    const createMauChart = (series) => {
         const canvas = document.getElementById('mauChart');
-        if (!canvas || !window.Chart || !canvas.dataset.labels || !canvas.dataset.values) return null;
+        if (!canvas || !window.Chart || !series) return null;
 
         try {
-            const labels = JSON.parse(canvas.dataset.labels);
-            const data = JSON.parse(canvas.dataset.values);
+            const labels = series.labels;
+            const data = series.values;
             const theme = document.documentElement.getAttribute('data-theme') || 'light';
             const colors = getChartColors(theme);
 
@@ -186,18 +186,18 @@ document.addEventListener('DOMContentLoaded', () => {
                 }
             });
         } catch (e) {
-            console.error('MAU 차트 데이터 파싱 또는 생성 중 오류 발생:', e);
+            console.error('MAU 차트 생성 중 오류 발생:', e);
             return null;
         }
     };
 
-    const createContentPieChart = () => {
+    const createContentPieChart = (series) => {
         const canvas = document.getElementById('contentPieChart');
-        if (!canvas || !window.Chart || !canvas.dataset.labels || !canvas.dataset.values) return null;
+        if (!canvas || !window.Chart || !series) return null;
 
         try {
-            const labels = JSON.parse(canvas.dataset.labels);
-            const data = JSON.parse(canvas.dataset.values);
+            const labels = series.labels;
+            const data = series.values;
             const theme = document.documentElement.getAttribute('data-theme') || 'light';
             const colors = getChartColors(theme);
 
@@ -231,11 +231,31 @@ document.addEventListener('DOMContentLoaded', () => {
                 }
             });
         } catch (e) {
-            console.error('콘텐츠 분포 차트 데이터 파싱 또는 생성 중 오류 발생:', e);
+            console.error('콘텐츠 분포 차트 생성 중 오류 발생:', e);
             return null;
         }
     };
 
+    // 차트 데이터는 페이지와 따로 JSON 으로 받아 옵니다.
+    // 응답에 ETag/Last-Modified 가 있으므로 브라우저가 다시 요청할 때는 조건부 요청을 보내고,
+    // 데이터가 그대로면 서버는 본문 없이 304 로 답합니다.
+    const loadCharts = async () => {
+        const chartsGrid = document.querySelector('.charts-grid');
+        if (!chartsGrid || !chartsGrid.dataset.url || !window.Chart) return;
+
+        try {
+            const response = await fetch(chartsGrid.dataset.url, { headers: { 'Accept': 'application/json' } });
+            if (!response.ok) throw new Error(`HTTP ${response.status}`);
+            const chartData = await response.json();
+            if (mauChartInstance) mauChartInstance.destroy();
+            if (contentPieChartInstance) contentPieChartInstance.destroy();
+            mauChartInstance = createMauChart(chartData.mau);
+            contentPieChartInstance = createContentPieChart(chartData.content_distribution);
+        } catch (e) {
+            console.error('차트 데이터를 불러오는 중 오류 발생:', e);
+        }
+    };
+
     // --- 사용자 관리 기능 ---
     const userListWrapper = document.getElementById('user-list-wrapper');
 
@@ -254,6 +274,82 @@ document.addEventListener('DOMContentLoaded', () => {
         return cookieValue;
     };
 
+    // 상태 표시와 개별 토글 버튼을 is_active 값에 맞게 바꿉니다.
+    const renderUserStatus = (row, isActive) => {
+        const statusSpan = row.querySelector('.status-span');
+        const button = row.querySelector('.btn-toggle-status');
+        statusSpan.className = isActive ? 'status-span status-active' : 'status-span status-inactive';
+        statusSpan.textContent = isActive ? '활성' : '비활성';
+        if (button) {
+            button.className = isActive ? 'btn-toggle-status btn-deactivate' : 'btn-toggle-status btn-activate';
+            button.textContent = isActive ? '비활성화' : '활성화';
+        }
+    };
+
+    // --- 일괄 상태 변경 ---
+    // 선택한 사용자 id 는 페이지를 넘기거나 검색해도 유지됩니다.
+    const selectedUserIds = new Set();
+    const bulkButtons = document.querySelectorAll('.btn-bulk-status');
+    const bulkSelectedCount = document.getElementById('bulk-selected-count');
+
+    const updateBulkToolbar = () => {
+        if (bulkSelectedCount) bulkSelectedCount.textContent = `${selectedUserIds.size}명 선택`;
+        bulkButtons.forEach(button => { button.disabled = selectedUserIds.size === 0; });
+    };
+
+    // 새로 불러온 목록의 체크박스를 현재 선택 상태에 맞춥니다.
+    const syncSelection = () => {
+        if (!userListWrapper) return;
+        const checkboxes = userListWrapper.querySelectorAll('.user-select:not(:disabled)');
+        checkboxes.forEach(checkbox => { checkbox.checked = selectedUserIds.has(checkbox.value); });
+        const selectAll = userListWrapper.querySelector('.user-select-all');
+        if (selectAll) {
+            selectAll.checked = checkboxes.length > 0 && [...checkboxes].every(checkbox => checkbox.checked);
+        }
+        updateBulkToolbar();
+    };
+
+    const submitBulkStatus = async (isActive) => {
+        const userIds = [...selectedUserIds].map(Number);
+        const action = isActive ? '활성화' : '비활성화';
+        if (!userIds.length || !confirm(`선택한 사용자 ${userIds.length}명을 ${action}할까요?`)) return;
+
+        bulkButtons.forEach(button => { button.disabled = true; });
+        try {
+            const response = await fetch(userListWrapper.dataset.bulkUrl, {
+                method: 'POST',
+                headers: {
+                    'Content-Type': 'application/json',
+                    'X-CSRFToken': getCookie('csrftoken')
+                },
+                body: JSON.stringify({ user_ids: userIds, is_active: isActive })
+            });
+            const data = await response.json();
+            if (data.status !== 'success') {
+                alert('오류: ' + data.message);
+                return;
+            }
+            // 처리된 사용자는 선택에서 빼고, 현재 화면에 보이는 행의 상태를 갱신합니다.
+            Object.entries(data.results).forEach(([userId, result]) => {
+                if (result === 'self') return;
+                selectedUserIds.delete(userId);
+                const checkbox = userListWrapper.querySelector(`.user-select[value="${userId}"]`);
+                if (checkbox && result !== 'not_found') renderUserStatus(checkbox.closest('tr'), data.is_active);
+            });
+            const summary = data.summary;
+            alert(`${action} 완료: 변경 ${summary.activated + summary.deactivated}명, ` +
+                  `이미 ${action}됨 ${summary.unchanged}명, 없음 ${summary.not_found}명`);
+        } catch (error) {
+            alert('요청 처리 중 오류가 발생했습니다.');
+        } finally {
+            syncSelection();
+        }
+    };
+
+    bulkButtons.forEach(button => {
+        button.addEventListener('click', () => submitBulkStatus(button.dataset.isActive === 'true'));
+    });
+
     // 사용자 목록을 비동기적으로 가져와 업데이트하는 함수
     const fetchUserList = async (url) => {
         try {
@@ -266,7 +362,10 @@ document.addEventListener('DOMContentLoaded', () => {
             if (!response.ok) throw new Error('서버 응답 오류');
 
             const html = await response.text();
-            if (userListWrapper) userListWrapper.innerHTML = html;
+            if (userListWrapper) {
+                userListWrapper.innerHTML = html;
+                syncSelection();
+            }
 
         } catch (error) {
             console.error('사용자 목록 업데이트 중 오류 발생:', error);
@@ -286,7 +385,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 if (url) {
                     const ajaxUrl = new URL(this.dataset.ajaxUrl, window.location.origin);
                     const linkUrl = new URL(url, window.location.origin);
-                    ajaxUrl.search = linkUrl.search; // ?page=2&search=... 같은 파라미터 복사
+                    ajaxUrl.search = linkUrl.search; // ?page=2&search=... 또는 ?cursor=...&search=... 파라미터 복사
                     fetchUserList(ajaxUrl.toString());
                 }
             }
@@ -308,19 +407,7 @@ document.addEventListener('DOMContentLoaded', () => {
                 .then(response => response.ok ? response.json() : Promise.reject(response))
                 .then(data => {
                     if (data.status === 'success') {
-                        const row = button.closest('tr');
-                        const statusSpan = row.querySelector('.status-span');
-                        if (data.is_active) {
-                            statusSpan.className = 'status-span status-active';
-                            statusSpan.textContent = '활성';
-                            button.className = 'btn-toggle-status btn-deactivate';
-                            button.textContent = '비활성화';
-                        } else {
-                            statusSpan.className = 'status-span status-inactive';
-                            statusSpan.textContent = '비활성';
-                            button.className = 'btn-toggle-status btn-activate';
-                            button.textContent = '활성화';
-                        }
+                        renderUserStatus(button.closest('tr'), data.is_active);
                     } else {
                         alert('오류: ' + data.message);
                     }
@@ -328,6 +415,21 @@ document.addEventListener('DOMContentLoaded', () => {
                 .catch(() => alert('요청 처리 중 오류가 발생했습니다.'));
             }
         });
+
+        // 사용자 선택 체크박스 처리
+        userListWrapper.addEventListener('change', function(event) {
+            if (event.target.matches('.user-select-all')) {
+                this.querySelectorAll('.user-select:not(:disabled)').forEach(checkbox => {
+                    if (event.target.checked) selectedUserIds.add(checkbox.value);
+                    else selectedUserIds.delete(checkbox.value);
+                });
+                syncSelection();
+            } else if (event.target.matches('.user-select')) {
+                if (event.target.checked) selectedUserIds.add(event.target.value);
+                else selectedUserIds.delete(event.target.value);
+                syncSelection();
+            }
+        });
     }
 
     // 사용자 검색 기능 (디바운싱 적용)
@@ -341,7 +443,12 @@ document.addEventListener('DOMContentLoaded', () => {
             searchTimeout = setTimeout(() => {
                 const url = new URL(ajaxUrl, window.location.origin);
                 url.searchParams.set('search', searchTerm);
-                url.searchParams.set('page', '1'); // 검색 시에는 항상 첫 페이지로 이동
+                // 검색 시에는 항상 첫 페이지로 이동합니다. (커서 방식은 빈 cursor 가 첫 페이지)
+                if (userListWrapper.dataset.pagination === 'cursor') {
+                    url.searchParams.set('cursor', '');
+                } else {
+                    url.searchParams.set('page', '1');
+                }
                 fetchUserList(url.toString());
             }, 300); // 300ms 디바운스
         });
@@ -366,8 +473,7 @@ document.addEventListener('DOMContentLoaded', () => {
         setActivePage(defaultPageId);
 
         // 차트 생성
-        mauChartInstance = createMauChart();
-        contentPieChartInstance = createContentPieChart();
+        loadCharts();
     };
 
     initializeDashboard();
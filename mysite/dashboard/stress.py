@@ -0,0 +1,114 @@
+"""
+SQLite 동시 쓰기 스트레스 측정.
+
+여러 스레드가 각자 연결을 열고 좋아요 토글/댓글 작성과 같은 모양의 트랜잭션
+(카운터 읽기 -> 갱신 -> 행 추가)을 동시에 반복하면서 "database is locked" 로 실패한 횟수를 셉니다.
+mysite/database.py 의 프로필별 DATABASES 설정을 그대로 써서, 설정에 따라 쓰기 실패가
+사라지는지 확인하는 데 사용합니다. (운영 DB 가 아닌 별도의 SQLite 파일에서 실행합니다.)
+"""
+import threading
+import time
+
+from django.db import OperationalError, connections, transaction
+from django.db.backends.sqlite3.base import DatabaseWrapper
+
+STRESS_ALIAS = 'dashboard_stress'
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS stress_counter (id INTEGER PRIMARY KEY, value INTEGER NOT NULL)',
+    'CREATE TABLE IF NOT EXISTS stress_event (id INTEGER PRIMARY KEY, writer INTEGER NOT NULL, value INTEGER NOT NULL)',
+    'INSERT OR IGNORE INTO stress_counter (id, value) VALUES (1, 0)',
+)
+
+
+def _wrapper(database):
+    # configure_settings 가 빠진 키(ATOMIC_REQUESTS, TIME_ZONE 등)를 기본값으로 채워 줍니다.
+    # 'default' 항목이 반드시 있어야 하므로 같은 설정을 함께 넘깁니다.
+    configured = connections.configure_settings({'default': dict(database), STRESS_ALIAS: dict(database)})
+    settings_dict = configured[STRESS_ALIAS]
+    return DatabaseWrapper(settings_dict, STRESS_ALIAS)
+
+
+def _write_once(writer):
+    with transaction.atomic(using=STRESS_ALIAS):
+        with connections[STRESS_ALIAS].cursor() as cursor:
+            cursor.execute('SELECT value FROM stress_counter WHERE id = 1')
+            value = cursor.fetchone()[0] + 1
+            cursor.execute('UPDATE stress_counter SET value = %s WHERE id = 1', [value])
+            cursor.execute('INSERT INTO stress_event (writer, value) VALUES (%s, %s)', [writer, value])
+
+
+def _read_once():
+    with connections[STRESS_ALIAS].cursor() as cursor:
+        cursor.execute('SELECT COUNT(*), MAX(value) FROM stress_event')
+        cursor.fetchone()
+
+
+def run_write_stress(database, writers=8, operations=100, readers=2):
+    """
+    database(DATABASES 항목 하나)에 대해 writers 개 스레드가 operations 번씩 쓰고, readers 개 스레드가
+    그동안 계속 읽습니다. 성공/실패 건수와 최종 카운터 값을 dict 로 반환합니다.
+    """
+    setup = _wrapper(database)
+    with setup.cursor() as cursor:
+        for statement in _SCHEMA:
+            cursor.execute(statement)
+        cursor.execute('DELETE FROM stress_event')
+        cursor.execute('UPDATE stress_counter SET value = 0')
+    setup.close()
+
+    results = {'succeeded': 0, 'locked': 0, 'failed': 0, 'reads': 0}
+    lock = threading.Lock()
+    barrier = threading.Barrier(writers + readers)
+    writers_done = threading.Event()
+
+    def count(key):
+        with lock:
+            results[key] += 1
+
+    def worker(task):
+        connections[STRESS_ALIAS] = _wrapper(database)
+        try:
+            barrier.wait()
+            task()
+        finally:
+            connections[STRESS_ALIAS].close()
+            del connections[STRESS_ALIAS]
+
+    def write(writer):
+        for _ in range(operations):
+            try:
+                _write_once(writer)
+            except OperationalError as exc:
+                count('locked' if 'locked' in str(exc) else 'failed')
+            else:
+                count('succeeded')
+
+    def read():
+        while not writers_done.is_set():
+            _read_once()
+            count('reads')
+
+    threads = [threading.Thread(target=worker, args=(lambda n=n: write(n),)) for n in range(writers)]
+    reader_threads = [threading.Thread(target=worker, args=(read,)) for _ in range(readers)]
+    start = time.perf_counter()
+    for thread in threads + reader_threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    writers_done.set()
+    for thread in reader_threads:
+        thread.join()
+
+    check = _wrapper(database)
+    with check.cursor() as cursor:
+        cursor.execute('SELECT value FROM stress_counter WHERE id = 1')
+        results['counter'] = cursor.fetchone()[0]
+        cursor.execute('PRAGMA journal_mode')
+        results['journal_mode'] = cursor.fetchone()[0]
+    check.close()
+    results['operations'] = writers * operations
+    results['seconds'] = round(elapsed, 3)
+    results['writes_per_second'] = round(results['succeeded'] / elapsed, 1) if elapsed else None
+    return results
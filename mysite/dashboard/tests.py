@@ -1,3 +1,1742 @@
-from django.test import TestCase
+import asyncio
+import base64
+import concurrent.futures
+import csv
+import importlib
+import io
+import os
+import json
+import re
+import socketserver
+import sqlite3
+import tempfile
+import threading
+from datetime import date, timedelta
+from types import SimpleNamespace
+from unittest import mock, skipUnless
 
-# Create your tests here.
+from asgiref.sync import iscoroutinefunction, sync_to_async
+
+from django.apps import apps as django_apps
+from django.conf import settings
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core import mail as django_mail
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection, connections
+from django.test import Client, SimpleTestCase, TestCase, TransactionTestCase, override_settings
+from django.urls import include, path, reverse
+from django.utils import timezone
+
+from . import accounts, async_views, categories, exports, live, profiling, routers, search, urls as dashboard_urls
+from .benchmark import percentile, run as run_benchmark
+from .checks import check_auth_cache
+from .mail import deliver_outbox
+from .models import (
+    Bookmark, Category, Comment, DailyActivity, DashboardStats, Like, OutboxMessage, Post, SearchToken, UserSearchIndex,
+)
+from .forms import PostForm
+from .importing import Importer
+from .management.commands.explain_queries import representative_queries
+from .pagination import CursorPaginator, InvalidCursor
+from .search import filter_users, rebuild_index, rebuild_user_index, search_posts
+from .seeding import seed
+from .stress import run_write_stress
+from .views import SEARCH_MAX_PAGES, _mau_chart_series, _mau_querysets
+from mysite.database import apply_profile
+
+
+# 워커끼리 공유하는 캐시가 있을 때(DASHBOARD_CACHE_DIR)의 세션/사용자 캐시 설정.
+# 테스트는 한 프로세스에서 돌므로 로컬 메모리 캐시로도 같은 동작을 확인할 수 있습니다.
+shared_cache_auth = override_settings(
+    SESSION_ENGINE='django.contrib.sessions.backends.cached_db',
+    DASHBOARD_AUTH_USER_CACHE_TIMEOUT=60,
+)
+
+
+def _test_budgets():
+    # TestCase 안에서는 transaction.atomic() 이 SAVEPOINT/RELEASE 두 쿼리로 실행되므로
+    # 트랜잭션을 여는 뷰의 예산에 그만큼 여유를 더합니다.
+    budgets = dict(settings.DASHBOARD_QUERY_BUDGETS)
+    budgets['dashboard:toggle_like'] += 2
+    return budgets
+
+
+# 뷰를 호출하는 테스트는 쿼리 예산을 넘으면 경고 로그 대신 실패하게 합니다.
+enforce_query_budgets = override_settings(
+    DASHBOARD_QUERY_BUDGET_ACTION='raise', DASHBOARD_QUERY_BUDGETS=_test_budgets(),
+)
+
+
+class SeedData:
+    """
+    쿼리 수 테스트용 데이터 팩토리. 시그널을 거치지 않는 bulk_create 로 빠르게 채운 뒤
+    집계 값(DashboardStats, Post 카운터)과 검색 색인을 한 번에 다시 계산합니다.
+    """
+
+    def __init__(self, users=1000, posts=1000, comments_per_post=2, likes=3000, hot_post_comments=2000):
+        self.users = users
+        self.posts = posts
+        self.comments_per_post = comments_per_post
+        self.likes = likes
+        self.hot_post_comments = hot_post_comments
+
+    def create(self):
+        now = timezone.now()
+        password = make_password('password')
+        self.staff = User.objects.create_user('staff', 'staff@example.com', 'password', is_staff=True)
+        users = User.objects.bulk_create(
+            User(
+                username=f'user{i:05d}', email=f'user{i:05d}@example.com', password=password,
+                first_name=f'First{i}', last_name=f'Last{i}', date_joined=now - timedelta(minutes=i),
+            )
+            for i in range(self.users)
+        )
+        DailyActivity.objects.bulk_create(
+            DailyActivity(user=user, date=(now - timedelta(days=i % 300)).date()) for i, user in enumerate(users)
+        )
+
+        categories = Category.objects.bulk_create(Category(name=f'category {i}') for i in range(5))
+        posts = Post.objects.bulk_create(
+            Post(
+                author=users[i % len(users)], category=categories[i % len(categories)],
+                title=f'게시글 제목 {i}', content=f'게시글 본문 {i}', created_at=now - timedelta(minutes=i),
+            )
+            for i in range(self.posts)
+        )
+        # Post.created_at 은 auto_now_add 이므로 정렬이 의미 있도록 생성 후 다시 맞춥니다.
+        for i, post in enumerate(posts):
+            post.created_at = now - timedelta(minutes=i)
+        Post.objects.bulk_update(posts, ['created_at'], batch_size=500)
+
+        self.quiet_post, self.hot_post = posts[0], posts[1]
+        Comment.objects.bulk_create(
+            Comment(post=post, author=users[(i + j) % len(users)], content=f'댓글 {i}-{j}')
+            for i, post in enumerate(posts[2:]) for j in range(self.comments_per_post)
+        )
+        Comment.objects.bulk_create(
+            Comment(post=self.hot_post, author=users[i % len(users)], content=f'인기 댓글 {i}')
+            for i in range(self.hot_post_comments)
+        )
+        Like.objects.bulk_create(
+            Like(post=posts[i % len(posts)], user=users[(i // len(posts)) % len(users)]) for i in range(self.likes)
+        )
+        Bookmark.objects.bulk_create(Bookmark(post=posts[i], user=users[i]) for i in range(min(100, self.posts)))
+
+        DashboardStats.rebuild()
+        Post.objects.all().refresh_counters()
+        rebuild_index()
+        rebuild_user_index()
+        return self
+
+
+@enforce_query_budgets
+class QueryCountTestCase(TestCase):
+    """
+    각 뷰의 정확한 쿼리 수를 고정합니다. (세션 조회 1 + 사용자 조회 1 포함, 캐시가 비어 있는 상태)
+    프로세스에 상주하는 카테고리 목록(dashboard/categories.py)만은 미리 읽어 둔 상태를 기준으로 합니다.
+    쿼리 수가 늘어났다면 템플릿이나 뷰에 N+1 조회가 생기지 않았는지 확인하세요.
+    """
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seed = SeedData().create()
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.seed.staff)
+
+    def assertQueries(self, count, url, method='get', data=None):
+        cache.clear()
+        categories.snapshot()
+        with self.assertNumQueries(count):
+            response = getattr(self.client, method)(url, data or {})
+        self.assertLess(response.status_code, 400)
+        return response
+
+    def test_dashboard_view(self):
+        # MAU 월별 집계는 차트 데이터 요청(chart_data)으로 옮겨져 페이지에서는 MAU 수만 셉니다.
+        response = self.assertQueries(8, reverse('dashboard:dashboard'))
+        self.assertEqual(response.context['post_count'], self.seed.posts)
+
+    def test_dashboard_view_deep_user_page(self):
+        self.assertQueries(8, reverse('dashboard:dashboard') + '?page=90')
+
+    def test_user_list_partial(self):
+        self.assertQueries(4, reverse('dashboard:user_list_partial'))
+        self.assertQueries(4, reverse('dashboard:user_list_partial') + '?page=80')
+        self.assertQueries(3, reverse('dashboard:user_list_partial') + '?cursor=')
+
+    def test_user_list_partial_search(self):
+        response = self.assertQueries(4, reverse('dashboard:user_list_partial') + '?search=user0001')
+        self.assertEqual(len(response.context['users']), 10)
+
+    def test_post_list_view(self):
+        first = self.assertQueries(4, reverse('dashboard:post_list'))
+        self.assertQueries(4, reverse('dashboard:post_list') + '?page=90')
+        self.assertIn('게시글 제목 0', first.content.decode())
+
+    @shared_cache_auth
+    def test_post_list_view_user_state(self):
+        # 첫 페이지(최신 글 10개) 중 일부에 좋아요/북마크를 해 두어도 쿼리 수는 그대로입니다.
+        first_page = list(Post.objects.order_by('-created_at', '-id')[:10])
+        Like.objects.bulk_create(Like(post=post, user=self.seed.staff) for post in first_page[:6])
+        Bookmark.objects.bulk_create(Bookmark(post=post, user=self.seed.staff) for post in first_page[3:5])
+        html = self.assertQueries(4, reverse('dashboard:post_list')).content.decode()
+        self.assertEqual(html.count('post-item-likes liked'), 6)
+        self.assertEqual(html.count('post-item-bookmarked'), 2)
+
+        posts = Post.objects.filter(pk__in=[post.pk for post in first_page[2:5]]).with_user_state(self.seed.staff)
+        self.assertEqual(
+            sorted((post.user_has_liked, post.user_has_bookmarked) for post in posts),
+            [(True, False), (True, True), (True, True)],
+        )
+
+        # 목록은 함께 쓰고 사용자별 표시만 따로 읽으므로 다른 사용자의 표시가 섞이지 않습니다.
+        other = User.objects.get(username='user00999')
+        self.client.force_login(other)
+        # force_login 이 저장한 세션은 cached_db 캐시에서 읽으므로 세션 조회가 없습니다. (사용자, 표시)
+        with self.assertNumQueries(2):
+            html = self.client.get(reverse('dashboard:post_list')).content.decode()
+        self.assertNotIn('post-item-bookmarked', html)
+        self.assertNotIn('post-item-likes liked', html)
+
+    def test_post_list_view_cursor(self):
+        response = self.assertQueries(3, reverse('dashboard:post_list') + '?cursor=')
+        page = response.context['post_list_html']
+        self.assertIn('cursor=', page)
+
+    def test_post_detail_view_does_not_grow_with_comments(self):
+        self.assertQueries(5, reverse('dashboard:post_detail', args=[self.seed.quiet_post.pk]))
+        response = self.assertQueries(5, reverse('dashboard:post_detail', args=[self.seed.hot_post.pk]))
+        self.assertIn('comment-load-more', response.content.decode())
+
+    def test_post_detail_view_user_state(self):
+        post = self.seed.quiet_post
+        Bookmark.objects.create(post=post, user=self.seed.staff)
+        response = self.assertQueries(5, reverse('dashboard:post_detail', args=[post.pk]))
+        self.assertEqual((response.context['user_has_liked'], response.context['user_has_bookmarked']), (False, True))
+
+    @shared_cache_auth
+    def test_post_detail_view_cached(self):
+        url = reverse('dashboard:post_detail', args=[self.seed.hot_post.pk])
+        self.client.get(url)
+        # 화면 조각뿐 아니라 세션(cached_db)과 로그인 사용자(dashboard/auth.py)도 캐시에서 읽습니다.
+        with self.assertNumQueries(0):
+            self.client.get(url)
+
+    def test_comment_list_view(self):
+        url = reverse('dashboard:comment_list', args=[self.seed.hot_post.pk])
+        response = self.assertQueries(4, url)
+        self.assertEqual(response.content.decode().count('comment-item'), 50)
+
+    def test_comment_list_cursor(self):
+        url = reverse('dashboard:comment_list', args=[self.seed.hot_post.pk])
+        first = self.client.get(url).content.decode()
+        cursor = re.search(r'\?cursor=([\w-]+)', first).group(1)
+        second = self.client.get(url, {'cursor': cursor}).content.decode()
+        self.assertEqual(second.count('comment-item'), 50)
+        self.assertNotEqual(first, second)
+        # 같은 위치를 가리키는 다른 표기(base64 패딩)는 같은 캐시 항목을 씁니다. (세션, 사용자만 조회)
+        with self.assertNumQueries(2):
+            self.assertEqual(self.client.get(url, {'cursor': cursor + '=' * (-len(cursor) % 4)}).content.decode(), second)
+
+        # 해석할 수 없는 커서는 첫 페이지로 바꿔 보여 주지 않고 400 을 반환합니다.
+        malformed = base64.urlsafe_b64encode(b'{"v": [1]}').decode()
+        for bad in ('garbage', '!!', malformed, base64.urlsafe_b64encode(b'{"v": ["x", "y"]}').decode()):
+            self.assertEqual(self.client.get(url, {'cursor': bad}).status_code, 400, bad)
+        # 빈 커서는 첫 페이지입니다.
+        self.assertEqual(self.client.get(url, {'cursor': ''}).content.decode(), first)
+
+    def test_toggle_like_view(self):
+        url = reverse('dashboard:toggle_like', args=[self.seed.quiet_post.pk])
+        # 세션/사용자 2 + SAVEPOINT/RELEASE 2 (테스트 트랜잭션 안) + DELETE, INSERT, UPDATE x2, SELECT
+        liked = self.assertQueries(9, url, method='post').json()
+        # 좋아요 취소는 DELETE 로 행이 지워졌으므로 INSERT 를 건너뜁니다.
+        unliked = self.assertQueries(8, url, method='post').json()
+        self.assertTrue(liked['is_liked'])
+        self.assertFalse(unliked['is_liked'])
+        self.assertEqual(liked['like_count'], unliked['like_count'] + 1)
+
+    def test_toggle_like_view_missing_post(self):
+        response = self.client.post(reverse('dashboard:toggle_like', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_post_create_view(self):
+        # 세션/사용자 2. 카테고리 존재 확인과 선택지는 카테고리 캐시에서 읽습니다.
+        self.assertQueries(2, reverse('dashboard:post_create'))
+        category = Category.objects.first()
+        response = self.client.post(reverse('dashboard:post_create'), {
+            'title': '새 글', 'content': '내용', 'category': category.pk,
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(DashboardStats.load().post_count, self.seed.posts + 1)
+
+
+
+@enforce_query_budgets
+class ChartDataTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user('staff', password='password', is_staff=True)
+        today = timezone.localdate()
+        members = User.objects.bulk_create(User(username=f'member{i}') for i in range(3))
+        DailyActivity.objects.bulk_create([
+            DailyActivity(user=members[0], date=today),
+            DailyActivity(user=members[1], date=today),
+            DailyActivity(user=members[2], date=today - timedelta(days=400)),
+        ])
+        cls.category = Category.objects.create(name='공지')
+        DashboardStats.rebuild()
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.staff)
+        self.url = reverse('dashboard:chart_data')
+
+    def test_chart_data(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        # 더미 값 없이 실제 활동 기록만 집계합니다. 로그인한 관리자도 포함되며, 12개월보다 오래된 기록은 빠집니다.
+        self.assertEqual(len(data['mau']['labels']), 12)
+        self.assertEqual(data['mau']['labels'][-1], timezone.localdate().strftime('%Y-%m'))
+        self.assertEqual(data['mau']['values'], [0] * 11 + [3])
+        self.assertEqual(data['content_distribution']['values'], [0, 0, 0, 0])
+        self.assertIn('ETag', response)
+        self.assertIn('Last-Modified', response)
+
+        # 대시보드 HTML 에는 차트 데이터가 들어가지 않습니다.
+        dashboard = self.client.get(reverse('dashboard:dashboard'))
+        self.assertEqual(dashboard.context['mau_count'], 3)
+        self.assertContains(dashboard, f'data-url="{self.url}"')
+
+    @shared_cache_auth
+    def test_conditional_requests(self):
+        first = self.client.get(self.url)
+        etag = first['ETag']
+        # 캐시가 데워진 뒤 304 응답은 집계 행 조회 한 번으로 끝납니다.
+        with self.assertNumQueries(1):
+            not_modified = self.client.get(self.url, headers={'if-none-match': etag})
+        self.assertEqual(not_modified.status_code, 304)
+        self.assertEqual(not_modified.content, b'')
+        self.assertEqual(not_modified['ETag'], etag)
+        since = self.client.get(self.url, headers={'if-modified-since': first['Last-Modified']})
+        self.assertEqual(since.status_code, 304)
+
+        Post.objects.create(author=self.staff, category=self.category, title='제목', content='본문')
+        changed = self.client.get(self.url, headers={'if-none-match': etag})
+        self.assertEqual(changed.status_code, 200)
+        self.assertNotEqual(changed['ETag'], etag)
+        self.assertEqual(changed.json()['content_distribution']['values'], [1, 0, 0, 0])
+
+    def test_etag_depends_only_on_data(self):
+        etag = self.client.get(self.url)['ETag']
+        # MAU 캐시가 만료되어 다시 계산되거나(다른 워커도 마찬가지) 차트에 없는 집계 값만 바뀌어도 ETag 는 같습니다.
+        cache.clear()
+        User.objects.create_user('newcomer')
+        response = self.client.get(self.url, headers={'if-none-match': etag})
+        self.assertEqual(response.status_code, 304)
+
+        # MAU 값이 바뀌면 ETag 도 바뀝니다.
+        DailyActivity.objects.create(user=User.objects.get(username='newcomer'), date=timezone.localdate())
+        cache.clear()
+        response = self.client.get(self.url, headers={'if-none-match': etag})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['mau']['values'][-1], 4)
+
+    def test_async_view(self):
+        with override_settings(ROOT_URLCONF=AsyncURLConf):
+            response = self.client.get(self.url)
+            self.assertEqual(response.json()['mau']['values'][-1], 3)
+            self.assertEqual(self.client.get(self.url, headers={'if-none-match': response['ETag']}).status_code, 304)
+
+    def test_staff_only(self):
+        self.client.force_login(User.objects.get(username='member0'))
+        self.assertEqual(self.client.get(self.url).status_code, 302)
+
+
+@enforce_query_budgets
+class CategoryCacheTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('writer', password='password')
+        cls.category = Category.objects.create(name='공지')
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    def test_form_uses_cache(self):
+        categories.snapshot()
+        # 폼 렌더링과 캐시에 없는 값의 거부는 카테고리 테이블을 조회하지 않습니다.
+        with self.assertNumQueries(0):
+            html = str(PostForm())
+            self.assertFalse(PostForm({'title': '제목', 'content': '본문', 'category': 0}).is_valid())
+        # 캐시에 있는 값은 모델 검증이 DB 에서 한 번 더 확인합니다.
+        with self.assertNumQueries(1):
+            form = PostForm({'title': '제목', 'content': '본문', 'category': self.category.pk})
+            self.assertTrue(form.is_valid())
+        self.assertIn('공지', html)
+        self.assertEqual(form.cleaned_data['category'], self.category)
+
+    def test_stale_snapshot_is_rejected(self):
+        stale = Category.objects.create(name='폐지')
+        categories.snapshot()
+        # 다른 워커가 삭제해 이 프로세스의 캐시에는 아직 남아 있는 카테고리.
+        with connection.cursor() as cursor:
+            cursor.execute('DELETE FROM dashboard_category WHERE id = %s', [stale.pk])
+        self.assertIsNotNone(categories.get_category(stale.pk))
+        response = self.client.post(reverse('dashboard:post_create'), {
+            'title': '제목', 'content': '본문', 'category': stale.pk,
+        })
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('category', response.context['form'].errors)
+        self.assertFalse(Post.objects.exists())
+
+    def test_invalidated_on_save_and_delete(self):
+        self.assertEqual([category.name for category in categories.all_categories()], ['공지'])
+        added = Category.objects.create(name='자유')
+        self.assertIn('자유', str(PostForm()))
+        added.name = '잡담'
+        added.save()
+        self.assertEqual(categories.get_category(added.pk).name, '잡담')
+        added.delete()
+        self.assertIsNone(categories.get_category(added.pk))
+        self.assertEqual(len(categories.all_categories()), 1)
+
+    def test_post_category_name_from_cache(self):
+        post = Post.objects.create(author=self.user, category=self.category, title='제목', content='본문')
+        self.assertContains(self.client.get(reverse('dashboard:post_detail', args=[post.pk])), '공지')
+        self.category.delete()
+        self.assertEqual(self.client.get(reverse('dashboard:post_create')).status_code, 302)
+
+
+
+@shared_cache_auth
+@enforce_query_budgets
+class PostListCacheTestCase(TestCase):
+    """게시글 목록은 모든 사용자가 함께 쓰고, 좋아요/북마크 표시만 사용자별로 무효화됩니다."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.alice = User.objects.create_user('alice', password='password')
+        cls.bob = User.objects.create_user('bob', password='password')
+        category = Category.objects.create(name='일반')
+        cls.posts = [
+            Post.objects.create(author=cls.alice, category=category, title=f'제목 {i}', content='본문')
+            for i in range(3)
+        ]
+
+    def setUp(self):
+        cache.clear()
+        self.url = reverse('dashboard:post_list')
+        self.alice_client, self.bob_client = Client(), Client()
+        self.alice_client.force_login(self.alice)
+        self.bob_client.force_login(self.bob)
+        # 세션과 사용자를 캐시에 올려 두고 목록도 데웁니다.
+        self.alice_client.get(self.url)
+        self.bob_client.get(self.url)
+
+    def get(self, client, queries):
+        with self.assertNumQueries(queries):
+            return client.get(self.url).content.decode()
+
+    def test_warm_list_has_no_queries(self):
+        self.get(self.alice_client, 0)
+        self.get(self.bob_client, 0)
+
+    def test_bookmark_invalidates_only_that_user(self):
+        Bookmark.objects.create(post=self.posts[0], user=self.bob)
+        # 다른 사용자의 목록과 공용 목록은 그대로 적중합니다.
+        self.assertNotIn('post-item-bookmarked', self.get(self.alice_client, 0))
+        # 북마크한 사용자는 자신의 표시만 다시 읽습니다.
+        self.assertIn('post-item-bookmarked', self.get(self.bob_client, 1))
+
+    def test_like_rebuilds_shared_list_once(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Like.toggle(self.posts[1].pk, self.alice)
+        # 좋아요 수가 바뀌었으므로 공용 목록을 한 번 다시 만듭니다. (COUNT, SELECT - 좋아요 표시도 함께)
+        html = self.get(self.alice_client, 2)
+        self.assertEqual(html.count('post-item-likes liked'), 1)
+        # 다른 사용자는 다시 만든 목록을 그대로 쓰고 자신의 표시도 캐시에서 읽습니다.
+        html = self.get(self.bob_client, 0)
+        self.assertNotIn('post-item-likes liked', html)
+        self.assertIn('fa-heart"></i> 1</span>', html)
+
+
+@enforce_query_budgets
+class LikeToggleTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        cls.reader = User.objects.create_user('reader', password='password')
+        category = Category.objects.create(name='일반')
+        cls.post = Post.objects.create(author=cls.author, category=category, title='제목', content='본문')
+        DashboardStats.rebuild()
+
+    def counts(self):
+        self.post.refresh_from_db()
+        return self.post.like_count, DashboardStats.load().like_count, Like.objects.filter(post=self.post).count()
+
+    def test_toggle_on_and_off(self):
+        self.assertEqual(Like.toggle(self.post.pk, self.reader), (True, 1))
+        self.assertEqual(self.counts(), (1, 1, 1))
+        self.assertEqual(Like.toggle(self.post.pk, self.author), (True, 2))
+        self.assertEqual(Like.toggle(self.post.pk, self.reader), (False, 1))
+        self.assertEqual(self.counts(), (1, 1, 1))
+        self.assertFalse(Like.objects.filter(post=self.post, user=self.reader).exists())
+
+    def test_concurrent_insert_does_not_double_count(self):
+        # 이 요청의 DELETE 와 INSERT 사이에 같은 사용자의 다른 요청이 좋아요를 먼저 추가한 경우.
+        Like.objects.create(post=self.post, user=self.reader)
+        self.post.refresh_from_db()
+        with mock.patch.object(Like, '_delete_row', return_value=0), \
+                self.captureOnCommitCallbacks(execute=True) as callbacks:
+            self.assertEqual(Like.toggle(self.post.pk, self.reader), (True, 1))
+        self.assertEqual(self.counts(), (1, 1, 1))
+        # 아무것도 바뀌지 않았으므로 캐시 무효화/실시간 갱신도 보내지 않습니다.
+        self.assertEqual(callbacks, [])
+
+    def test_counter_drift_is_clamped(self):
+        Like.toggle(self.post.pk, self.reader)
+        Post.objects.filter(pk=self.post.pk).update(like_count=0)
+        self.assertEqual(Like.toggle(self.post.pk, self.reader), (False, 0))
+        self.assertEqual(Like.toggle(self.post.pk, self.reader), (True, 1))
+        Post.objects.filter(pk=self.post.pk).refresh_counters()
+        self.assertEqual(self.counts(), (1, 1, 1))
+
+    def test_missing_post(self):
+        with self.assertRaises(Post.DoesNotExist):
+            Like.toggle(0, self.reader)
+        self.assertEqual(DashboardStats.load().like_count, 0)
+        self.assertFalse(Like.objects.exists())
+
+
+@enforce_query_budgets
+class DashboardStatsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        cls.category = Category.objects.create(name='일반')
+        DashboardStats.rebuild()
+
+    def counts(self):
+        stats = DashboardStats.load()
+        return (stats.user_count, stats.post_count, stats.comment_count, stats.like_count, stats.bookmark_count)
+
+    def test_signals_adjust_counters(self):
+        self.assertEqual(self.counts(), (1, 0, 0, 0, 0))
+        reader = User.objects.create_user('reader', password='password')
+        post = Post.objects.create(author=self.author, category=self.category, title='제목', content='본문')
+        Comment.objects.create(post=post, author=reader, content='댓글')
+        like = Like.objects.create(post=post, user=reader)
+        Bookmark.objects.create(post=post, user=reader)
+        self.assertEqual(self.counts(), (2, 1, 1, 1, 1))
+
+        like.delete()
+        self.assertEqual(self.counts(), (2, 1, 1, 0, 1))
+        # 게시글을 지우면 연결된 댓글/북마크도 CASCADE 로 지워지며 각각 시그널을 보냅니다.
+        post.delete()
+        self.assertEqual(self.counts(), (2, 0, 0, 0, 0))
+        reader.delete()
+        self.assertEqual(self.counts(), (1, 0, 0, 0, 0))
+
+    def test_rebuild_fixes_drift(self):
+        # bulk_create 는 시그널을 보내지 않으므로 rebuild() 전까지 집계가 어긋납니다.
+        Post.objects.bulk_create(
+            Post(author=self.author, category=self.category, title=f'제목 {i}', content='본문') for i in range(3)
+        )
+        self.assertEqual(self.counts(), (1, 0, 0, 0, 0))
+        DashboardStats.rebuild()
+        self.assertEqual(self.counts(), (1, 3, 0, 0, 0))
+        self.assertEqual(DashboardStats.objects.count(), 1)
+
+    def test_load_creates_missing_row(self):
+        DashboardStats.objects.all().delete()
+        # 집계 행이 없을 때의 증감은 무시되고, 다음 load() 가 실제 테이블 기준으로 새로 계산합니다.
+        Post.objects.create(author=self.author, category=self.category, title='제목', content='본문')
+        self.assertFalse(DashboardStats.objects.exists())
+        self.assertEqual(self.counts(), (1, 1, 0, 0, 0))
+        self.assertTrue(DashboardStats.objects.filter(pk=DashboardStats.SINGLETON_PK).exists())
+
+
+@enforce_query_budgets
+class DailyActivityTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.members = User.objects.bulk_create(User(username=f'member{i}') for i in range(3))
+
+    def test_record_is_idempotent(self):
+        today = timezone.localdate()
+        DailyActivity.record(self.members[0])
+        DailyActivity.record(self.members[0])
+        DailyActivity.record(self.members[0], date=today - timedelta(days=1))
+        self.assertEqual(
+            sorted(DailyActivity.objects.filter(user=self.members[0]).values_list('date', flat=True)),
+            [today - timedelta(days=1), today],
+        )
+
+    def test_login_records_activity(self):
+        User.objects.create_user('login', password='password')
+        self.assertTrue(self.client.login(username='login', password='password'))
+        self.assertTrue(self.client.login(username='login', password='password'))
+        self.assertEqual(
+            list(DailyActivity.objects.filter(user__username='login').values_list('date', flat=True)),
+            [timezone.localdate()],
+        )
+
+    def test_monthly_series(self):
+        current = date(2026, 1, 15)
+        DailyActivity.objects.bulk_create([
+            # 같은 달에 여러 번 활동한 사용자는 한 번만 셉니다.
+            DailyActivity(user=self.members[0], date=date(2026, 1, 2)),
+            DailyActivity(user=self.members[0], date=date(2026, 1, 10)),
+            DailyActivity(user=self.members[1], date=date(2026, 1, 3)),
+            DailyActivity(user=self.members[1], date=date(2025, 12, 31)),
+            DailyActivity(user=self.members[2], date=date(2025, 2, 1)),
+            # 12개월 범위 밖
+            DailyActivity(user=self.members[2], date=date(2025, 1, 31)),
+        ])
+        mau_queryset, monthly_queryset = _mau_querysets(current)
+        self.assertEqual(mau_queryset.count(), 2)
+        labels, values = _mau_chart_series(current, monthly_queryset)
+        self.assertEqual(labels[0], '2025-02')
+        self.assertEqual(labels[-2:], ['2025-12', '2026-01'])
+        self.assertEqual(values, [1] + [0] * 9 + [1, 2])
+
+
+@enforce_query_budgets
+class PostCounterTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('author', password='password')
+        cls.readers = User.objects.bulk_create(User(username=f'reader{i}') for i in range(3))
+        category = Category.objects.create(name='일반')
+        cls.posts = [
+            Post.objects.create(author=cls.author, category=category, title=f'제목 {i}', content='본문')
+            for i in range(3)
+        ]
+
+    def counters(self, post):
+        post.refresh_from_db()
+        return post.like_count, post.comment_count, post.bookmark_count
+
+    def test_signals_adjust_counters(self):
+        post = self.posts[0]
+        comment = Comment.objects.create(post=post, author=self.readers[0], content='댓글')
+        Like.objects.create(post=post, user=self.readers[0])
+        Bookmark.objects.create(post=post, user=self.readers[1])
+        self.assertEqual(self.counters(post), (1, 1, 1))
+        comment.delete()
+        self.assertEqual(self.counters(post), (1, 0, 1))
+
+    def test_adjust_counter_clamps_at_zero(self):
+        post = self.posts[0]
+        self.assertEqual(Post.objects.filter(pk=post.pk).adjust_counter('like_count', 2), 1)
+        self.assertEqual(self.counters(post), (2, 0, 0))
+        Post.objects.filter(pk=post.pk).adjust_counter('like_count', -5)
+        self.assertEqual(self.counters(post), (0, 0, 0))
+        self.assertEqual(Post.objects.filter(pk=0).adjust_counter('like_count', 1), 0)
+
+    def test_refresh_counters(self):
+        # bulk_create 는 시그널을 보내지 않으므로 카운터가 실제 행 수와 어긋납니다.
+        Like.objects.bulk_create(Like(post=self.posts[0], user=user) for user in self.readers)
+        Comment.objects.bulk_create(Comment(post=self.posts[1], author=self.author, content='댓글') for _ in range(2))
+        Post.objects.filter(pk=self.posts[2].pk).update(bookmark_count=7)
+
+        self.assertEqual(Post.objects.filter(pk=self.posts[0].pk).refresh_counters(), 1)
+        self.assertEqual(self.counters(self.posts[0]), (3, 0, 0))
+        # 선택되지 않은 게시글은 그대로 둡니다.
+        self.assertEqual(self.counters(self.posts[1]), (0, 0, 0))
+        self.assertEqual(Post.objects.all().refresh_counters(), 3)
+        self.assertEqual(self.counters(self.posts[1]), (0, 2, 0))
+        self.assertEqual(self.counters(self.posts[2]), (0, 0, 0))
+
+    def test_repair_post_counters_command(self):
+        Like.objects.bulk_create(Like(post=post, user=self.readers[0]) for post in self.posts)
+        Post.objects.update(comment_count=4)
+        out = io.StringIO()
+        call_command('repair_post_counters', batch_size=2, stdout=out)
+        self.assertIn('3건', out.getvalue())
+        for post in self.posts:
+            self.assertEqual(self.counters(post), (1, 0, 0))
+
+
+@enforce_query_budgets
+class CursorPaginatorTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        author = User.objects.create_user('author', password='password')
+        posts = Post.objects.bulk_create(
+            Post(author=author, title=f'제목 {i}', content='본문') for i in range(11)
+        )
+        # 같은 created_at 이 여러 건이어도 id 로 순서가 정해져 빠지거나 겹치는 글이 없어야 합니다.
+        now = timezone.now()
+        for i, post in enumerate(posts):
+            post.created_at = now - timedelta(minutes=i // 3)
+        Post.objects.bulk_update(posts, ['created_at'])
+        cls.expected = list(Post.objects.order_by('-created_at', '-id').values_list('pk', flat=True))
+
+    def setUp(self):
+        self.paginator = CursorPaginator(Post.objects.all(), ordering=('-created_at', '-id'), per_page=4)
+
+    def walk(self, page, attribute):
+        pages = [page]
+        while getattr(page, attribute) is not None:
+            page = self.paginator.page(getattr(page, attribute))
+            pages.append(page)
+        return [[post.pk for post in page] for page in pages]
+
+    def test_forward_and_backward(self):
+        first = self.paginator.page()
+        self.assertFalse(first.has_previous())
+        forward = self.walk(first, 'next_cursor')
+        self.assertEqual([len(pks) for pks in forward], [4, 4, 3])
+        self.assertEqual(sum(forward, []), self.expected)
+
+        last = self.paginator.page(self.paginator.page(first.next_cursor).next_cursor)
+        self.assertFalse(last.has_next())
+        backward = self.walk(last, 'previous_cursor')
+        self.assertEqual(backward[::-1], forward)
+
+    def test_cursor_round_trip(self):
+        post = Post.objects.order_by('pk').first()
+        cursor = self.paginator.encode_cursor(post, backwards=True)
+        self.assertNotIn('=', cursor)
+        self.assertEqual(self.paginator.decode_cursor(cursor), ([post.created_at, post.pk], True))
+
+    def test_invalid_cursor(self):
+        def encode(payload):
+            return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        for cursor in [
+            '!!!', 'bm90IGpzb24', encode([1, 2]), encode({'b': False}), encode({'v': [1]}),
+            encode({'v': ['not a date', 1]}), encode({'v': 'ab'}),
+        ]:
+            with self.subTest(cursor=cursor):
+                with self.assertRaises(InvalidCursor):
+                    self.paginator.decode_cursor(cursor)
+                # 뷰에 그대로 넘어온 잘못된 커서는 첫 페이지로 처리됩니다.
+                self.assertEqual([post.pk for post in self.paginator.page(cursor)], self.expected[:4])
+
+
+@enforce_query_budgets
+@skipUnless(connection.vendor == 'sqlite', 'SQLite 의 EXPLAIN QUERY PLAN 형식을 검사합니다.')
+class QueryPlanTestCase(TestCase):
+    def assertUsesIndex(self, queryset, index_name):
+        plan = queryset.explain()
+        self.assertIn(index_name, plan)
+        # 인덱스 순서를 그대로 쓰므로 별도 정렬이 없어야 합니다.
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_list_queries_use_composite_indexes(self):
+        # explain_queries 와 같은 목록(뷰의 헬퍼로 만든 queryset)을 검사합니다.
+        queries = dict(representative_queries())
+        for name, index_name in [
+            ('post_list_view: page', 'dashboard_post_created_id'),
+            ('post_list_view: cursor', 'dashboard_post_created_id'),
+            ('post_detail_view: comments', 'dashboard_comment_post_created'),
+            ('comment_list_view: cursor', 'dashboard_comment_post_created'),
+        ]:
+            with self.subTest(name=name):
+                self.assertUsesIndex(queries[name], index_name)
+
+    def test_explain_queries_command(self):
+        out = io.StringIO()
+        call_command('explain_queries', '--fail-on-scan', stdout=out)
+        self.assertIn('전체 스캔 0건', out.getvalue())
+
+
+@shared_cache_auth
+@enforce_query_budgets
+class AuthCacheTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user('staff', password='password', is_staff=True)
+        cls.member = User.objects.create_user('member', password='password', email='member@example.com')
+        Category.objects.create(name='공지')
+
+    def setUp(self):
+        self.client.force_login(self.staff)
+        self.member_client = Client()
+        self.member_client.force_login(self.member)
+        cache.clear()
+
+    def assertLoggedIn(self, logged_in):
+        response = self.member_client.get(reverse('dashboard:post_create'))
+        if logged_in:
+            self.assertEqual(response.status_code, 200)
+        else:
+            self.assertRedirects(response, reverse('dashboard:login') + '?next=' + reverse('dashboard:post_create'))
+
+    def test_process_local_cache_warning(self):
+        self.assertEqual([error.id for error in check_auth_cache(None)], ['dashboard.W001', 'dashboard.W002'])
+        with override_settings(SESSION_ENGINE='django.contrib.sessions.backends.db', DASHBOARD_AUTH_USER_CACHE_TIMEOUT=0):
+            self.assertEqual(check_auth_cache(None), [])
+        shared = {'default': {'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache', 'LOCATION': '/tmp'}}
+        with override_settings(CACHES=shared):
+            self.assertEqual(check_auth_cache(None), [])
+
+    def test_warm_request_has_no_auth_queries(self):
+        url = reverse('dashboard:post_create')
+        # 세션, 사용자, 카테고리 목록
+        with self.assertNumQueries(3):
+            self.member_client.get(url)
+        with self.assertNumQueries(0):
+            response = self.member_client.get(url)
+        self.assertEqual(response.status_code, 200)
+
+    def test_toggle_user_status_rejects_immediately(self):
+        self.assertLoggedIn(True)
+        self.client.post(reverse('dashboard:toggle_user_status', args=[self.member.pk]))
+        self.assertLoggedIn(False)
+
+    def test_bulk_deactivate_rejects_immediately(self):
+        self.assertLoggedIn(True)
+        accounts.set_users_active([self.member.pk], False)
+        self.assertLoggedIn(False)
+
+    def test_profile_edit_refreshes_cached_user(self):
+        url = reverse('dashboard:profile_edit')
+        self.assertEqual(self.member_client.get(url).context['form'].instance.first_name, '')
+        self.member_client.post(url, {'first_name': '새이름', 'last_name': '', 'email': 'member@example.com'})
+        self.assertEqual(self.member_client.get(url).context['form'].instance.first_name, '새이름')
+
+
+@enforce_query_budgets
+class QueryBudgetTestCase(TestCase):
+    """settings.DASHBOARD_QUERY_BUDGETS 에 적힌 예산 안에서 모든 뷰가 동작하는지 확인합니다."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seed = SeedData(users=200, posts=200, likes=400, hot_post_comments=300).create()
+
+    def setUp(self):
+        cache.clear()
+        self.client.force_login(self.seed.staff)
+
+    def test_views_within_budget(self):
+        post_pk = self.seed.hot_post.pk
+        for url in [
+            reverse('dashboard:dashboard'),
+            reverse('dashboard:chart_data'),
+            reverse('dashboard:user_list_partial') + '?search=user',
+            reverse('dashboard:post_list'),
+            reverse('dashboard:post_search') + '?q=게시글',
+            reverse('dashboard:post_detail', args=[post_pk]),
+            reverse('dashboard:comment_list', args=[post_pk]),
+            reverse('dashboard:post_create'),
+        ]:
+            with self.subTest(url=url):
+                self.client.get(url)
+        self.client.post(reverse('dashboard:toggle_like', args=[post_pk]))
+
+    def test_template_time_is_recorded(self):
+        profiling.registry.reset()
+        self.client.get(reverse('dashboard:post_list'))
+        values = profiling.registry.snapshot()['dashboard:post_list']
+        self.assertEqual(values['requests'], 1)
+        self.assertGreater(values['queries'], 0)
+        self.assertGreater(values['template_seconds'], 0)
+        self.assertIn('dashboard_view_template_seconds_total{view="dashboard:post_list"}', profiling.metrics_text())
+
+
+@enforce_query_budgets
+class BulkUserStatusTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user('staff', password='password', is_staff=True)
+        cls.users = User.objects.bulk_create(User(username=f'spam{i:04d}') for i in range(1200))
+        cls.inactive = User.objects.create_user('inactive', is_active=False)
+
+    def setUp(self):
+        self.client.force_login(self.staff)
+
+    def post(self, payload):
+        return self.client.post(
+            reverse('dashboard:bulk_user_status'), json.dumps(payload), content_type='application/json',
+        )
+
+    def test_one_update_per_chunk(self):
+        ids = [user.pk for user in self.users]
+        # 묶음마다 SELECT 1 + UPDATE 1 (+ TestCase 트랜잭션 안이라 SAVEPOINT/RELEASE 2)
+        with self.assertNumQueries(3 * 4):
+            results = accounts.set_users_active(ids, False, chunk_size=500)
+        self.assertEqual(set(results.values()), {accounts.DEACTIVATED})
+        self.assertFalse(User.objects.filter(pk__in=ids, is_active=True).exists())
+
+    def test_endpoint_reports_each_id(self):
+        missing = User.objects.order_by('-pk').first().pk + 1
+        ids = [self.users[0].pk, self.users[1].pk, self.inactive.pk, self.staff.pk, missing, self.users[0].pk]
+        response = self.post({'user_ids': ids, 'is_active': False})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['results'], {
+            str(self.users[0].pk): 'deactivated',
+            str(self.users[1].pk): 'deactivated',
+            str(self.inactive.pk): 'unchanged',
+            str(self.staff.pk): 'self',
+            str(missing): 'not_found',
+        })
+        self.assertEqual(data['summary'], {'activated': 0, 'deactivated': 2, 'unchanged': 1, 'not_found': 1, 'self': 1})
+        self.assertTrue(User.objects.get(pk=self.staff.pk).is_active)
+
+        response = self.post({'user_ids': [self.users[0].pk, self.inactive.pk], 'is_active': True})
+        self.assertEqual(set(response.json()['results'].values()), {'activated'})
+
+    def test_deactivated_user_is_logged_out(self):
+        client = self.client_class()
+        client.force_login(self.users[0])
+        self.assertEqual(client.get(reverse('dashboard:post_list')).status_code, 200)
+        self.post({'user_ids': [self.users[0].pk], 'is_active': False})
+        self.assertEqual(client.get(reverse('dashboard:post_list')).status_code, 302)
+
+    def test_invalid_requests(self):
+        for payload in ({'user_ids': [], 'is_active': False}, {'user_ids': ['x'], 'is_active': False},
+                        {'user_ids': [1], 'is_active': 'no'}, {'is_active': False}, [],
+                        {'user_ids': '12', 'is_active': False}, {'user_ids': ['12'], 'is_active': False},
+                        {'user_ids': [1.9], 'is_active': False}, {'user_ids': [True], 'is_active': False},
+                        {'user_ids': [0], 'is_active': False}, {'user_ids': [2 ** 63], 'is_active': False},
+                        {'user_ids': {'1': 1}, 'is_active': False}):
+            self.assertEqual(self.post(payload).status_code, 400, payload)
+        self.assertEqual(self.post({'user_ids': [2 ** 63 - 1], 'is_active': False}).json()['results'],
+                         {str(2 ** 63 - 1): 'not_found'})
+        self.client.force_login(self.users[0])
+        self.assertEqual(self.post({'user_ids': [self.users[1].pk], 'is_active': False}).status_code, 302)
+
+    def test_management_command(self):
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False) as id_file:
+            id_file.write(f'# 스팸 계정\n{self.users[0].pk}\n\n{self.users[1].pk}\n')
+        self.addCleanup(os.remove, id_file.name)
+        call_command(
+            'set_user_status', str(self.users[2].pk), '--deactivate', '--file', id_file.name,
+            '--usernames', 'spam0003', '--chunk-size', '2', stdout=open(os.devnull, 'w'),
+        )
+        self.assertEqual(
+            set(User.objects.filter(is_active=False, username__startswith='spam').values_list('username', flat=True)),
+            {'spam0000', 'spam0001', 'spam0002', 'spam0003'},
+        )
+
+@enforce_query_budgets
+class ExportTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.staff = User.objects.create_user('staff', password='password', is_staff=True)
+        author = User.objects.create_user('작성자')
+        category = Category.objects.create(name='공지')
+        cls.posts = [Post.objects.create(author=author, category=category, title=f'제목, "{i}"', content='본문\n줄바꿈')
+                     for i in range(5)]
+        # 앞의 두 게시글은 오래된 글로 만듭니다.
+        Post.objects.filter(pk__in=[post.pk for post in cls.posts[:2]]).update(
+            created_at=timezone.make_aware(timezone.datetime(2020, 1, 15, 12)),
+        )
+        for post in cls.posts:
+            Comment.objects.create(post=post, author=author, content=f'{post.pk}번 글의 댓글')
+
+    def setUp(self):
+        self.client.force_login(self.staff)
+
+    def download(self, name, export_format, **params):
+        response = self.client.get(reverse('dashboard:export', args=[name, export_format]), params)
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        return b''.join(response.streaming_content).decode('utf-8')
+
+    def read_csv(self, text):
+        self.assertTrue(text.startswith('\ufeff'))
+        return list(csv.reader(io.StringIO(text[1:], newline='')))
+
+    def test_csv_with_date_range(self):
+        rows = self.read_csv(self.download('posts', 'csv', since='2020-01-01', until='2020-01-15'))
+        self.assertEqual(rows[0], list(exports.EXPORTS['posts'][1]))
+        self.assertEqual([int(row[0]) for row in rows[1:]], [post.pk for post in self.posts[:2]])
+        self.assertEqual(rows[1][4], '제목, "0"')
+        self.assertEqual(rows[1][5], '본문\n줄바꿈')
+
+        rows = self.read_csv(self.download('posts', 'csv', since='2020-01-16'))
+        self.assertEqual(len(rows), 1 + 3)
+
+    def test_csv_formula_injection(self):
+        author = User.objects.get(username='작성자')
+        Post.objects.filter(pk=self.posts[0].pk).update(title='=HYPERLINK("http://evil.example")', content='-2+3')
+        Comment.objects.filter(post=self.posts[1]).update(content='@SUM(A1)')
+        User.objects.filter(pk=author.pk).update(first_name='+82', last_name='\t=1')
+        rows = self.read_csv(self.download('posts', 'csv'))
+        self.assertEqual(rows[1][4:6], ['\'=HYPERLINK("http://evil.example")', "'-2+3"])
+        self.assertEqual(rows[2][4], '제목, "1"')
+        rows = self.read_csv(self.download('comments', 'csv'))
+        self.assertEqual(rows[2][4], "'@SUM(A1)")
+        rows = self.read_csv(self.download('users', 'csv'))
+        self.assertEqual(rows[2][3:5], ["'+82", "'\t=1"])
+        # NDJSON 은 값을 바꾸지 않습니다.
+        records = [json.loads(line) for line in self.download('posts', 'ndjson').splitlines()]
+        self.assertEqual(records[0]['title'], '=HYPERLINK("http://evil.example")')
+
+    def test_ndjson(self):
+        records = [json.loads(line) for line in self.download('comments', 'ndjson').splitlines()]
+        self.assertEqual([record['post_id'] for record in records], [post.pk for post in self.posts])
+        self.assertEqual(records[0]['author__username'], '작성자')
+        self.assertEqual(len(self.download('users', 'ndjson').splitlines()), 2)
+        self.assertEqual(len(self.download('likes', 'ndjson').splitlines()), 0)
+
+    def test_streams_in_chunks(self):
+        response = self.client.get(reverse('dashboard:export', args=['posts', 'csv']))
+        content = iter(response.streaming_content)
+        # 헤더는 쿼리 없이 바로 나오고, 행은 chunk_size 단위 iterator 쿼리 하나로 읽습니다.
+        with self.assertNumQueries(0):
+            self.assertTrue(next(content).decode('utf-8').startswith('\ufeffid,'))
+        with self.assertNumQueries(1):
+            self.assertEqual(len(list(csv.reader(io.StringIO(b''.join(content).decode('utf-8'), newline='')))), 5)
+
+        fields, rows = exports.export_queryset('posts')
+        with self.assertNumQueries(1):
+            self.assertEqual(len(''.join(exports.stream_ndjson(fields, rows, chunk_size=2)).splitlines()), 5)
+
+    def test_invalid_requests(self):
+        url = reverse('dashboard:export', args=['posts', 'csv'])
+        self.assertEqual(self.client.get(url, {'since': '2020-13-01'}).status_code, 400)
+        self.assertEqual(self.client.get(url, {'since': '2020-02-01', 'until': '2020-01-01'}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('dashboard:export', args=['sessions', 'csv'])).status_code, 404)
+        self.assertEqual(self.client.get(reverse('dashboard:export', args=['posts', 'xml'])).status_code, 404)
+        self.client.force_login(User.objects.get(username='작성자'))
+        self.assertEqual(self.client.get(url).status_code, 302)
+
+@enforce_query_budgets
+class ReplicaRoutingTestCase(TransactionTestCase):
+    """
+    읽기 복제본 대신 default 의 현재 상태를 복사한 두 번째 SQLite 파일을 씁니다.
+    (열린 트랜잭션이 있으면 복사할 수 없으므로 TransactionTestCase 를 사용합니다.)
+    """
+    @classmethod
+    def setUpClass(cls):
+        # 테스트 러너가 테스트 DB 를 만들 때는 'replica' 가 없어야 하므로 여기서 등록합니다.
+        cls.directory = tempfile.TemporaryDirectory()
+        database = {
+            'ENGINE': 'django.db.backends.sqlite3', 'NAME': os.path.join(cls.directory.name, 'replica.sqlite3'),
+            'TEST': {'MIRROR': 'default'},
+        }
+        connections.settings['replica'] = connections.configure_settings({'default': database, 'replica': database})['replica']
+        cls.databases = {'default', 'replica'}
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        del cls.databases
+        connections['replica'].close()
+        del connections['replica']
+        del connections.settings['replica']
+        cls.directory.cleanup()
+
+    def setUp(self):
+        self.staff = User.objects.create_user('staff', password='password', is_staff=True)
+        self.member = User.objects.create_user('member')
+        DashboardStats.rebuild()
+        connections['replica'].close()
+        replica = sqlite3.connect(connections['replica'].settings_dict['NAME'])
+        connections['default'].ensure_connection()
+        connections['default'].connection.backup(replica)
+        replica.close()
+        # 복제본에는 아직 반영되지 않은 가입자
+        User.objects.create_user('not_replicated')
+        self.client.force_login(self.staff)
+
+    def user_list(self):
+        return self.client.get(reverse('dashboard:user_list_partial')).content.decode()
+
+    def test_read_only_views_use_replica(self):
+        self.assertEqual(routers.replica_alias(), 'replica')
+        self.assertIn('member', self.user_list())
+        self.assertNotIn('not_replicated', self.user_list())
+        export = b''.join(self.client.get(reverse('dashboard:export', args=['users', 'csv'])).streaming_content)
+        self.assertNotIn(b'not_replicated', export)
+        self.assertEqual(self.client.get(reverse('dashboard:dashboard')).status_code, 200)
+        # 표시하지 않은 뷰는 default 에서 읽습니다.
+        self.assertEqual(User.objects.filter(username='not_replicated').count(), 1)
+
+    def test_async_views_use_replica(self):
+        with override_settings(ROOT_URLCONF=AsyncURLConf):
+            self.assertIn('member', self.user_list())
+            self.assertNotIn('not_replicated', self.user_list())
+            self.assertEqual(self.client.get(reverse('dashboard:dashboard')).status_code, 200)
+
+    def test_sticky_after_write(self):
+        response = self.client.post(reverse('dashboard:toggle_user_status', args=[self.member.pk]))
+        self.assertEqual(response.json(), {'status': 'success', 'is_active': False})
+        # 쓰기는 default 로만 갑니다.
+        self.assertTrue(User.objects.using('replica').get(pk=self.member.pk).is_active)
+        self.assertIn(routers.STICKY_SESSION_KEY, self.client.session)
+        # 쓰기 직후에는 default 에서 읽으므로 변경 내용과 새 가입자가 보입니다.
+        self.assertIn('not_replicated', self.user_list())
+
+        session = self.client.session
+        session[routers.STICKY_SESSION_KEY] = 0
+        session.save()
+        self.assertNotIn('not_replicated', self.user_list())
+
+
+@enforce_query_budgets
+class SearchTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('writer', 'writer@example.com', 'password', first_name='길동', last_name='홍')
+        cls.category = Category.objects.create(name='일반')
+        cls.korean = Post.objects.create(
+            author=cls.author, category=cls.category, title='게시판 사용법', content='게시판에서 글을 씁니다.',
+        )
+        cls.english = Post.objects.create(
+            author=cls.author, category=cls.category, title='Release notes', content='Search is faster now.',
+        )
+        Comment.objects.create(post=cls.english, author=cls.author, content='검색이 빨라졌네요')
+
+    def backfill(self):
+        migration = importlib.import_module('dashboard.migrations.0014_backfill_search_index')
+
+        def execute(sql):
+            with connection.cursor() as cursor:
+                cursor.execute(sql)
+        # 테스트 트랜잭션 안에서는 SQLite 스키마 에디터를 열 수 없으므로 필요한 속성만 넘깁니다.
+        migration.backfill_search_index(django_apps, SimpleNamespace(connection=connection, execute=execute))
+
+    def assertFinds(self):
+        self.assertEqual(search_posts('게시판'), [self.korean.pk])
+        self.assertEqual(search_posts('검색'), [self.english.pk])
+        self.assertEqual(search_posts('release'), [self.english.pk])
+        self.assertEqual(list(filter_users(User.objects.all(), '홍길동')), [self.author])
+        self.assertEqual(list(filter_users(User.objects.all(), 'writer@')), [self.author])
+
+    def assertBackfills(self):
+        search.get_backend().clear()
+        self.assertEqual(search_posts('게시판'), [])
+        self.backfill()
+        self.assertFinds()
+        # 다시 실행해도 색인이 중복되지 않습니다.
+        self.backfill()
+        self.assertFinds()
+
+    def test_tokenize(self):
+        # 한글은 2글자씩 겹쳐 나누고, 그 밖의 단어는 NFKC 정규화 후 소문자로 그대로 씁니다.
+        self.assertEqual(search.tokenize('게시판 사용법'), ['게시', '시판', '사용', '용법'])
+        self.assertEqual(search.tokenize('Ｒｅｌｅａｓｅ-notes v2, 글'), ['release', 'notes', 'v2', '글'])
+        self.assertEqual(search.tokenize('검색API'), ['검색', 'api'])
+        self.assertEqual(search.tokenize(None), [])
+
+    def assertSearches(self):
+        self.assertEqual(search_posts('게시판'), [self.korean.pk])
+        self.assertEqual(search_posts('사용'), [self.korean.pk])
+        self.assertEqual(search_posts('RELEASE notes'), [self.english.pk])
+        self.assertEqual(search_posts('faster'), [self.english.pk])
+        # 댓글에만 있는 단어로도 게시글을 찾습니다.
+        self.assertEqual(search_posts('빨라졌'), [self.english.pk])
+        self.assertEqual(search_posts('없는단어'), [])
+
+    def test_search_view_page_bounds(self):
+        self.client.force_login(self.author)
+        url = reverse('dashboard:post_search')
+        response = self.client.get(url, {'q': '게시판', 'page': 'abc'})
+        self.assertEqual(response.context['page_number'], 1)
+        self.assertEqual(list(response.context['posts']), [self.korean])
+        self.assertEqual(self.client.get(url, {'q': '게시판', 'page': SEARCH_MAX_PAGES}).status_code, 200)
+        for page in [SEARCH_MAX_PAGES + 1, '99999999999999999999']:
+            with self.subTest(page=page):
+                self.assertEqual(self.client.get(url, {'q': '게시판', 'page': page}).status_code, 404)
+
+    @skipUnless(search.fts5_available(), 'SQLite FTS5 가 필요합니다.')
+    def test_fts5_backend(self):
+        self.assertIsInstance(search.get_backend(), search.SQLiteFTS5Backend)
+        self.assertSearches()
+
+    @override_settings(DASHBOARD_SEARCH_BACKEND='tokens')
+    def test_token_table_backend(self):
+        self.assertIsInstance(search.get_backend(), search.TokenTableBackend)
+        rebuild_index()
+        self.assertSearches()
+
+    @skipUnless(search.fts5_trigram_available(), 'SQLite FTS5 trigram 토크나이저가 필요합니다.')
+    def test_backfill_fts5(self):
+        self.assertBackfills()
+        self.assertFalse(SearchToken.objects.exists())
+
+    @override_settings(DASHBOARD_SEARCH_BACKEND='tokens')
+    def test_backfill_tokens(self):
+        # 시그널로 이미 색인된 사용자는 그대로 두고, 0010 이 채우지 않은 사용자만 UserSearchIndex 에 더합니다.
+        other = User.objects.create_user('other')
+        self.assertEqual(list(UserSearchIndex.objects.values_list('user_id', flat=True)), [other.pk])
+        self.assertBackfills()
+        self.assertTrue(SearchToken.objects.filter(post=self.korean, term='게시').exists())
+        self.assertEqual(UserSearchIndex.objects.count(), 2)
+
+    @skipUnless(search.fts5_available(), 'SQLite FTS5 가 필요합니다.')
+    def test_trigram_only_gates_user_index(self):
+        # SQLite 3.34 미만(trigram 없음)에서도 게시글 검색은 FTS5 를 쓰고, 사용자 색인만 대체 백엔드를 씁니다.
+        with mock.patch.object(search, '_sqlite_has_trigram', return_value=False):
+            self.assertIsInstance(search.get_backend(), search.SQLiteFTS5Backend)
+            self.assertIsInstance(search.get_user_backend(), search.TokenTableBackend)
+            self.assertEqual(search_posts('게시판'), [self.korean.pk])
+            rebuild_user_index()
+            self.assertEqual(list(filter_users(User.objects.all(), '홍길동')), [self.author])
+
+
+@enforce_query_budgets
+class ImportContentTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.author = User.objects.create_user('작성자')
+        cls.category = Category.objects.create(name='공지')
+        cls.existing = Post.objects.create(author=cls.author, category=cls.category, title='기존 글', content='본문')
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+
+    def write(self, name, text):
+        path = os.path.join(self.tmp.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+
+    def run_import(self, path, *args):
+        rejects = os.path.join(self.tmp.name, 'rejects.jsonl')
+        call_command('import_content', path, '--rejects', rejects, *args, stdout=open(os.devnull, 'w'))
+        with open(rejects, encoding='utf-8') as f:
+            return {row['line']: row['reason'] for row in map(json.loads, f)}
+
+    def test_jsonl(self):
+        records = [
+            {'type': 'post', 'author': '작성자', 'category': '공지', 'title': '가져온 게시판 글', 'content': '본문',
+             'ref': 'a', 'created_at': '2020-01-02T03:04:05+00:00'},
+            {'type': 'comment', 'author': '작성자', 'content': '앞 글의 댓글', 'post_ref': 'a'},
+            {'type': 'comment', 'author': '작성자', 'content': '기존 글의 댓글', 'post': self.existing.pk},
+            {'type': 'post', 'author': '없는사람', 'category': '공지', 'title': '제목', 'content': '본문'},
+            {'type': 'post', 'author': '작성자', 'category': '없는 분류', 'title': '제목', 'content': '본문'},
+            {'type': 'post', 'author': '작성자', 'category': '공지', 'title': 'x' * 201, 'content': '본문'},
+            {'type': 'post', 'author': '작성자', 'category': '공지', 'title': '제목', 'content': '   '},
+            {'type': 'comment', 'author': '작성자', 'content': '댓글', 'post': 999999},
+            {'type': 'comment', 'author': '작성자', 'content': '댓글', 'post_ref': 'missing'},
+            {'type': 'like'},
+        ]
+        lines = [json.dumps(record, ensure_ascii=False) for record in records] + ['{broken']
+        DashboardStats.rebuild()
+        # 묶음 경계를 넘는 post_ref 도 찾을 수 있도록 묶음 크기를 작게 둡니다.
+        rejects = self.run_import(self.write('content.jsonl', '\n'.join(lines)), '--batch-size', '2')
+        self.assertEqual(sorted(rejects), [4, 5, 6, 7, 8, 9, 10, 11])
+        self.assertIn('title', rejects[6])
+
+        post = Post.objects.get(title='가져온 게시판 글')
+        self.assertEqual(post.created_at.year, 2020)
+        self.assertEqual(post.comment_count, 1)
+        self.assertEqual(Post.objects.get(pk=self.existing.pk).comment_count, 1)
+        stats = DashboardStats.load()
+        self.assertEqual((stats.post_count, stats.comment_count), (2, 2))
+        self.assertEqual(search_posts('게시판'), [post.pk])
+
+    def test_csv_with_new_categories(self):
+        path = self.write('content.csv', (
+            'type,author,category,title,content,post\n'
+            'post,작성자,새 분류,"제목, 쉼표","여러\n줄 본문",\n'
+            f'comment,작성자,,,댓글,{self.existing.pk}\n'
+        ))
+        rejects = self.run_import(path, '--create-categories')
+        self.assertEqual(rejects, {})
+        post = Post.objects.get(title='제목, 쉼표')
+        self.assertEqual((post.category.name, post.content), ('새 분류', '여러\n줄 본문'))
+        self.assertEqual(Comment.objects.get().post_id, self.existing.pk)
+
+    def test_lookups_are_cached_per_batch(self):
+        posts = [
+            {'type': 'post', 'author': '작성자', 'category': '공지', 'title': f'제목 {i}', 'content': '본문'}
+            for i in range(500)
+        ]
+        # 카테고리 1 + 작성자 1 + INSERT 5 (SQLite 의 변수 개수 제한으로 나뉨) + 색인 1 + 통계 1
+        # (+ TestCase 안이라 SAVEPOINT/RELEASE 2). 줄마다 조회하거나 폼을 만들면 수백 건이 됩니다.
+        with self.assertNumQueries(11):
+            counts = Importer(batch_size=1000).run(enumerate(posts, 1))
+        self.assertEqual(counts, {'read': 500, 'posts': 500, 'comments': 0, 'rejected': 0})
+
+    def test_duplicate_ref_in_one_batch(self):
+        records = [
+            {'type': 'post', 'author': '작성자', 'category': '공지', 'title': '처음', 'content': '본문', 'ref': 'dup'},
+            {'type': 'post', 'author': '작성자', 'category': '공지', 'title': '중복', 'content': '본문', 'ref': 'dup'},
+            {'type': 'comment', 'author': '작성자', 'content': '댓글', 'post_ref': 'dup'},
+        ]
+        rejected = {}
+        importer = Importer(batch_size=10, reject=lambda line_number, reason, record: rejected.update({line_number: reason}))
+        counts = importer.run(enumerate(records, 1))
+        self.assertEqual(counts, {'read': 3, 'posts': 1, 'comments': 1, 'rejected': 1})
+        self.assertEqual(list(rejected), [2])
+        self.assertIn('이미 가져온 게시글입니다', rejected[2])
+        self.assertFalse(Post.objects.filter(title='중복').exists())
+        self.assertEqual(Comment.objects.get(content='댓글').post.title, '처음')
+
+    def test_post_refs_spill_to_disk(self):
+        records = [
+            {'type': 'post', 'author': '작성자', 'category': '공지', 'title': f'제목 {i}', 'content': '본문', 'ref': f'r{i}'}
+            for i in range(5)
+        ] + [
+            {'type': 'comment', 'author': '작성자', 'content': f'댓글 {i}', 'post_ref': f'r{i}'} for i in range(5)
+        ] + [
+            {'type': 'post', 'author': '작성자', 'category': '공지', 'title': '중복', 'content': '본문', 'ref': 'r0'},
+        ]
+        rejected = []
+        # 메모리에는 ref 2건까지만 두므로 앞 묶음의 ref 는 임시 파일에서 찾습니다.
+        with mock.patch('dashboard.importing.LOOKUP_CACHE_SIZE', 2):
+            importer = Importer(batch_size=2, reject=lambda line_number, reason, record: rejected.append(line_number))
+            counts = importer.run(enumerate(records, 1))
+        self.assertEqual(counts, {'read': 11, 'posts': 5, 'comments': 5, 'rejected': 1})
+        self.assertEqual(rejected, [11])
+        for i in range(5):
+            self.assertEqual(Comment.objects.get(content=f'댓글 {i}').post.title, f'제목 {i}')
+
+@enforce_query_budgets
+class SeedCommandTestCase(TestCase):
+    def snapshot(self):
+        return (
+            list(User.objects.order_by('username').values_list('username', 'last_name', 'is_active')),
+            list(Post.objects.order_by('pk').values_list('author__username', 'category__name', 'title', 'like_count')),
+            sorted(Like.objects.values_list('post__title', 'user__username')),
+        )
+
+    def test_same_seed_builds_same_data(self):
+        created = seed(users=20, categories=3, posts=30, comments=60, likes=100, bookmarks=10, seed=3)
+        self.assertEqual(created, {
+            'users': 20, 'categories': 3, 'posts': 30, 'comments': 60, 'likes': 100, 'bookmarks': 10,
+        })
+        first = self.snapshot()
+        self.assertEqual(DashboardStats.load().like_count, 100)
+
+        for model in (Like, Bookmark, Comment, Post, Category, DailyActivity, User):
+            model.objects.all().delete()
+        seed(users=20, categories=3, posts=30, comments=60, likes=100, bookmarks=10, seed=3)
+        self.assertEqual(self.snapshot(), first)
+
+    @override_settings(DASHBOARD_SEARCH_BACKEND='tokens')
+    def test_indexes_only_seeded_rows(self):
+        writer = User.objects.create_user('writer', first_name='길동', last_name='홍')
+        existing = Post.objects.create(author=writer, title='기존 공지사항', content='본문')
+        seed(users=5, categories=1, posts=10, comments=10, likes=0, bookmarks=0, seed=1)
+        seed(users=5, categories=1, posts=10, comments=10, likes=0, bookmarks=0, seed=2)
+        # 기존 색인을 지우지 않고, 새로 만든 행을 한 번씩만 더합니다.
+        self.assertEqual(search_posts('공지사항'), [existing.pk])
+        self.assertEqual(SearchToken.objects.filter(comment=None).values('post').distinct().count(), 21)
+        self.assertEqual(SearchToken.objects.exclude(comment=None).values('comment').distinct().count(), 20)
+        self.assertEqual(UserSearchIndex.objects.count(), 11)
+        self.assertEqual(list(filter_users(User.objects.all(), '홍길동')), [writer])
+        self.assertEqual(filter_users(User.objects.all(), 'seed2_000003').count(), 1)
+
+
+@enforce_query_budgets
+class BenchmarkTestCase(TransactionTestCase):
+    # 측정기는 작업 스레드마다 별도의 DB 연결을 쓰므로 테스트 트랜잭션으로 감쌀 수 없습니다.
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual([percentile(values, pct) for pct in (50, 95, 99)], [50, 95, 99])
+        self.assertIsNone(percentile([], 50))
+
+    def test_run_reports_every_scenario(self):
+        User.objects.create_user('admin', password='password', is_staff=True)
+        seed(users=10, posts=20, comments=20, likes=20, bookmarks=5)
+        result = run_benchmark(requests=3, concurrency=1)
+        self.assertEqual(set(result['scenarios']), {'board', 'detail', 'like', 'dashboard'})
+        for scenario in result['scenarios'].values():
+            self.assertEqual((scenario['requests'], scenario['errors']), (3, 0))
+            self.assertGreater(scenario['queries_per_request'], 0)
+
+
+ASYNC_VIEWS = {
+    'dashboard': async_views.dashboard_view,
+    'user_list_partial': async_views.user_list_partial,
+    'chart_data': async_views.chart_data_view,
+    'post_list': async_views.post_list_view,
+    'post_detail': async_views.post_detail_view,
+    'toggle_like': async_views.toggle_like_view,
+    'post_events': async_views.post_events_view,
+}
+# DASHBOARD_ASYNC_VIEWS=True 일 때와 같은 URL 구성 (urls.py 는 임포트 시점에 뷰를 고르므로 따로 만듭니다.)
+class AsyncURLConf:
+    urlpatterns = [path('', include(([
+        path(str(pattern.pattern), ASYNC_VIEWS.get(pattern.name, pattern.callback), name=pattern.name)
+        for pattern in dashboard_urls.urlpatterns
+    ], 'dashboard')))]
+
+
+@override_settings(ROOT_URLCONF=AsyncURLConf)
+@enforce_query_budgets
+class AsyncViewTestCase(TestCase):
+    """async 뷰도 동기 뷰와 같은 결과를 같은 쿼리 수로 돌려주는지 확인합니다."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.seed = SeedData(users=100, posts=100, likes=200, hot_post_comments=120).create()
+
+    def setUp(self):
+        cache.clear()
+
+    def test_views_are_coroutines(self):
+        for view in ASYNC_VIEWS.values():
+            self.assertTrue(iscoroutinefunction(view))
+
+    def assertQueries(self, count, url):
+        # 동기 테스트 클라이언트도 async 뷰를 async_to_sync 로 실행하므로 같은 DB 연결의 쿼리를 셀 수 있습니다.
+        cache.clear()
+        categories.snapshot()
+        with self.assertNumQueries(count):
+            response = self.client.get(url)
+        self.assertLess(response.status_code, 400)
+        return response
+
+    def test_read_views_query_counts(self):
+        self.client.force_login(self.seed.staff)
+        response = self.assertQueries(8, reverse('dashboard:dashboard'))
+        self.assertEqual(response.context['post_count'], 100)
+        self.assertEqual(len(response.context['users']), 10)
+        response = self.assertQueries(4, reverse('dashboard:user_list_partial') + '?search=user0001')
+        self.assertEqual(len(response.context['users']), 10)
+        response = self.assertQueries(4, reverse('dashboard:post_list') + '?page=3')
+        self.assertIn('게시글 제목 20', response.content.decode())
+        self.assertQueries(3, reverse('dashboard:post_list') + '?cursor=')
+        response = self.assertQueries(5, reverse('dashboard:post_detail', args=[self.seed.hot_post.pk]))
+        self.assertIn('comment-load-more', response.content.decode())
+
+    async def test_read_views_over_asgi(self):
+        await self.async_client.aforce_login(self.seed.staff)
+        for url in [
+            reverse('dashboard:dashboard'),
+            reverse('dashboard:user_list_partial'),
+            reverse('dashboard:post_list'),
+            reverse('dashboard:post_detail', args=[self.seed.hot_post.pk]),
+        ]:
+            with self.subTest(url=url):
+                response = await self.async_client.get(url)
+                self.assertEqual(response.status_code, 200)
+        response = await self.async_client.get(reverse('dashboard:post_detail', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_profiling_counts_queries_over_asgi(self):
+        # async 뷰의 ORM 호출은 sync_to_async 스레드의 DB 연결에서 실행되므로 그 쿼리도 세어야 합니다.
+        await self.async_client.aforce_login(self.seed.staff)
+        await sync_to_async(categories.snapshot)()
+        profiling.registry.reset()
+        response = await self.async_client.get(reverse('dashboard:post_list'))
+        self.assertEqual(response.status_code, 200)
+        values = profiling.registry.snapshot()['dashboard:post_list']
+        self.assertEqual(values['requests'], 1)
+        self.assertGreater(values['queries'], 0)
+        self.assertGreater(values['db_seconds'], 0)
+
+    async def test_toggle_like_view(self):
+        await self.async_client.aforce_login(self.seed.staff)
+        url = reverse('dashboard:toggle_like', args=[self.seed.quiet_post.pk])
+        liked = (await self.async_client.post(url)).json()
+        unliked = (await self.async_client.post(url)).json()
+        self.assertEqual((liked['is_liked'], unliked['is_liked']), (True, False))
+        self.assertEqual(liked['like_count'], unliked['like_count'] + 1)
+        response = await self.async_client.post(reverse('dashboard:toggle_like', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    async def test_login_required(self):
+        response = await self.async_client.get(reverse('dashboard:post_list'))
+        self.assertEqual(response.status_code, 302)
+
+
+def _sse_data(chunk):
+    event, data = chunk.strip().split('\n')
+    assert event == 'event: update', chunk
+    return json.loads(data.removeprefix('data: '))
+
+
+class LiveUpdatesTestCase(SimpleTestCase):
+    async def test_event_stream_coalesces_bursts(self):
+        stream = live.event_stream(42, interval=0.2, heartbeat=5)
+        self.assertTrue((await anext(stream)).startswith('retry:'))
+        for like_count in range(10, 15):
+            live.publish(42, {'type': 'like', 'delta': 1, 'like_count': like_count})
+        live.publish(42, {'type': 'comment', 'html': '<p>첫 댓글</p>'})
+        live.publish(43, {'type': 'like', 'delta': 1, 'like_count': 1})
+
+        update = _sse_data(await asyncio.wait_for(anext(stream), 1))
+        self.assertEqual(
+            (update['like_count'], update['like_delta'], update['comment_delta'], update['comments']),
+            (14, 5, 1, ['<p>첫 댓글</p>']),
+        )
+
+        # 직전 전송 후 interval 이 지나기 전의 이벤트는 기다렸다가 한 번에 보냅니다.
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        live.publish(42, {'type': 'like', 'delta': -1, 'like_count': 13})
+        live.publish(42, {'type': 'like', 'delta': -1, 'like_count': 12})
+        update = _sse_data(await asyncio.wait_for(anext(stream), 1))
+        self.assertGreaterEqual(loop.time() - start, 0.1)
+        self.assertEqual((update['like_count'], update['like_delta']), (12, -2))
+
+        await stream.aclose()
+        self.assertEqual(live.get_broker().subscriber_count(42), 0)
+
+    async def test_heartbeat(self):
+        stream = live.event_stream(42, interval=0.1, heartbeat=0.05)
+        await anext(stream)
+        self.assertEqual(await asyncio.wait_for(anext(stream), 1), ': keepalive\n\n')
+        await stream.aclose()
+
+    async def test_relay_broker_fans_out_across_workers(self):
+        relay_loop = asyncio.new_event_loop()
+        address = concurrent.futures.Future()
+        relay = relay_loop.create_task(live.serve_relay('127.0.0.1', 0, ready=lambda *addr: address.set_result(addr)))
+        thread = threading.Thread(target=relay_loop.run_forever, daemon=True)
+        thread.start()
+        host, port = await asyncio.wrap_future(address)
+        workers = [live.RelayBroker(host, port), live.RelayBroker(host, port)]
+        try:
+            for worker in workers:
+                self.assertTrue(await sync_to_async(worker.wait_connected)(5))
+            subscription = workers[1].subscribe(7)
+            workers[0].publish(7, {'type': 'like', 'delta': 1, 'like_count': 3})
+            self.assertTrue(await subscription.wait(5))
+            self.assertEqual(subscription.drain()['like_count'], 3)
+            subscription.close()
+        finally:
+            for worker in workers:
+                worker.close()
+            async def stop_relay():
+                relay.cancel()
+                await asyncio.gather(relay, return_exceptions=True)
+
+            await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(stop_relay(), relay_loop))
+            relay_loop.call_soon_threadsafe(relay_loop.stop)
+            thread.join(5)
+            relay_loop.close()
+
+
+@override_settings(ROOT_URLCONF=AsyncURLConf)
+@enforce_query_budgets
+class PostEventsViewTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('reader', password='password')
+        category = Category.objects.create(name='일반')
+        cls.post = Post.objects.create(author=cls.user, category=category, title='제목', content='본문')
+
+    def toggle_and_comment(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            Like.toggle(self.post.pk, self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            Comment.objects.create(post=self.post, author=self.user, content='<b>실시간</b> 댓글')
+
+    @override_settings(DASHBOARD_LIVE_INTERVAL=0.05)
+    async def test_stream_pushes_likes_and_comments(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse('dashboard:post_events', args=[self.post.pk]))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        await anext(stream)
+
+        await sync_to_async(self.toggle_and_comment)()
+        update = _sse_data((await asyncio.wait_for(anext(stream), 2)).decode())
+        self.assertEqual((update['like_count'], update['like_delta'], update['comment_delta']), (1, 1, 1))
+        self.assertIn('&lt;b&gt;실시간&lt;/b&gt; 댓글', update['comments'][0])
+        await stream.aclose()
+
+    async def test_missing_post(self):
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get(reverse('dashboard:post_events', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_comment_renders_only_for_subscribers_after_commit(self):
+        with mock.patch('dashboard.signals.render_to_string', return_value='<li></li>') as render:
+            with self.captureOnCommitCallbacks(execute=True):
+                Comment.objects.create(post=self.post, author=self.user, content='아무도 안 보는 댓글')
+            render.assert_not_called()
+
+            with mock.patch.object(live.get_broker(), 'has_subscribers', return_value=True):
+                with self.captureOnCommitCallbacks(execute=True) as callbacks:
+                    Comment.objects.create(post=self.post, author=self.user, content='보는 사람이 있는 댓글')
+                    # 커밋 전에는 렌더링하지 않습니다.
+                    render.assert_not_called()
+            self.assertTrue(callbacks)
+            render.assert_called_once()
+
+
+@enforce_query_budgets
+class PostEventsWSGITestCase(TestCase):
+    """WSGI(기본 URL 구성)에서는 SSE 응답이 현재 상태 하나만 보내고 끝나야 워커를 붙잡지 않습니다."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user('reader', password='password')
+        category = Category.objects.create(name='일반')
+        cls.post = Post.objects.create(author=cls.user, category=category, title='제목', content='본문')
+        Like.toggle(cls.post.pk, cls.user)
+
+    def setUp(self):
+        self.client.force_login(self.user)
+
+    @override_settings(DASHBOARD_LIVE_POLL_INTERVAL=7)
+    def test_first_event_and_stream_ends(self):
+        response = self.client.get(reverse('dashboard:post_events', args=[self.post.pk]))
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        # 동기 클라이언트로 끝까지 읽을 수 있어야 합니다. (끝나지 않는 스트림이면 여기서 멈춥니다.)
+        chunks = [chunk.decode() for chunk in response.streaming_content]
+        self.assertEqual(chunks[0], 'retry: 7000\n\n')
+        update = _sse_data(chunks[1])
+        self.assertEqual((update['post_id'], update['like_count'], update['like_delta']), (self.post.pk, 1, 0))
+        self.assertEqual(update['comments'], [])
+        self.assertEqual(len(chunks), 2)
+
+    def test_missing_post(self):
+        response = self.client.get(reverse('dashboard:post_events', args=[0]))
+        self.assertEqual(response.status_code, 404)
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """테스트용 최소 SMTP 서버의 연결 하나. 받은 메일은 server.messages 에 쌓습니다."""
+
+    def reply(self, line):
+        self.wfile.write(f'{line}\r\n'.encode())
+
+    def handle(self):
+        self.server.connections += 1
+        self.reply('220 localhost test SMTP')
+        envelope, data = None, None
+        for raw in self.rfile:
+            line = raw.decode('utf-8', 'replace').rstrip('\r\n')
+            if data is not None:
+                if line == '.':
+                    self.server.messages.append({**envelope, 'data': '\n'.join(data)})
+                    envelope, data = None, None
+                    self.reply('250 OK')
+                else:
+                    data.append(line[1:] if line.startswith('..') else line)
+                continue
+            command = line[:4].upper()
+            if command in ('HELO', 'EHLO', 'NOOP'):
+                self.reply('250 localhost')
+            elif command == 'MAIL':
+                envelope = {'from': line.split(':', 1)[1].strip('<> '), 'to': []}
+                self.reply('250 OK')
+            elif command == 'RCPT':
+                address = line.split(':', 1)[1].strip('<> ')
+                reply = self.server.rcpt_replies.get(address, '250 OK')
+                if reply.startswith('250'):
+                    envelope['to'].append(address)
+                self.reply(reply)
+            elif command == 'DATA':
+                data = []
+                self.reply('354 End data with <CR><LF>.<CR><LF>')
+            elif command == 'RSET':
+                envelope = None
+                self.reply('250 OK')
+            elif command == 'QUIT':
+                self.reply('221 Bye')
+                return
+            else:
+                self.reply('502 Command not implemented')
+
+
+class DebuggingSMTPServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        super().__init__(('127.0.0.1', 0), _SMTPHandler)
+        self.messages = []
+        self.connections = 0
+        # 수신자별로 RCPT 응답을 바꿔 실패를 흉내냅니다. 예: {'a@example.com': '550 No such user'}
+        self.rcpt_replies = {}
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self.shutdown()
+        self.server_close()
+
+
+@override_settings(EMAIL_BACKEND='dashboard.mail.OutboxEmailBackend')
+@enforce_query_budgets
+class OutboxTestCase(TestCase):
+    def setUp(self):
+        self.smtp = DebuggingSMTPServer()
+        self.addCleanup(self.smtp.stop)
+        smtp_settings = override_settings(
+            DASHBOARD_OUTBOX_DELIVERY_BACKEND='django.core.mail.backends.smtp.EmailBackend',
+            EMAIL_HOST='127.0.0.1', EMAIL_PORT=self.smtp.server_address[1],
+            EMAIL_USE_TLS=False, EMAIL_HOST_USER='', EMAIL_HOST_PASSWORD='',
+        )
+        smtp_settings.enable()
+        self.addCleanup(smtp_settings.disable)
+
+    def test_password_reset_only_enqueues(self):
+        User.objects.create_user('reset', email='reset@example.com', password='password')
+        response = self.client.post(reverse('dashboard:password_reset'), {'email': 'reset@example.com'})
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.smtp.connections, 0)
+        message = OutboxMessage.objects.get()
+        self.assertEqual((message.status, message.recipients), (OutboxMessage.PENDING, 'reset@example.com'))
+
+        self.assertEqual(deliver_outbox(), {'sent': 1, 'retry': 0, 'failed': 0})
+        self.assertEqual(self.smtp.messages[0]['to'], ['reset@example.com'])
+        self.assertIn('/reset/', self.smtp.messages[0]['data'])
+
+    def test_batch_uses_one_connection(self):
+        for i in range(5):
+            django_mail.send_mail(f'제목 {i}', '본문', 'noreply@example.com', [f'user{i}@example.com'])
+        self.assertEqual(OutboxMessage.objects.filter(status=OutboxMessage.PENDING).count(), 5)
+        call_command('send_outbox', batch_size=2, stdout=open(os.devnull, 'w'))
+        self.assertEqual(len(self.smtp.messages), 5)
+        # 묶음(2건, 2건, 1건)마다 연결 하나
+        self.assertEqual(self.smtp.connections, 3)
+        self.assertFalse(OutboxMessage.objects.exclude(status=OutboxMessage.SENT).exists())
+
+    def test_retry_and_backoff(self):
+        self.smtp.rcpt_replies = {'busy@example.com': '451 Try again later', 'gone@example.com': '550 No such user'}
+        django_mail.send_mail('일시 실패', '본문', 'noreply@example.com', ['busy@example.com'])
+        django_mail.send_mail('영구 실패', '본문', 'noreply@example.com', ['gone@example.com'])
+        django_mail.send_mail('성공', '본문', 'noreply@example.com', ['ok@example.com'])
+
+        with self.assertLogs('dashboard.mail', 'WARNING') as logs:
+            self.assertEqual(deliver_outbox(), {'sent': 1, 'retry': 1, 'failed': 1})
+        self.assertEqual(len(logs.records), 2)
+        busy = OutboxMessage.objects.get(recipients='busy@example.com')
+        self.assertEqual((busy.status, busy.attempts), (OutboxMessage.PENDING, 1))
+        self.assertGreater(busy.next_attempt_at, timezone.now())
+        self.assertEqual(OutboxMessage.objects.get(recipients='gone@example.com').status, OutboxMessage.FAILED)
+
+        # 백오프 시간이 지나기 전에는 다시 보내지 않습니다.
+        self.assertEqual(deliver_outbox(), {'sent': 0, 'retry': 0, 'failed': 0})
+        OutboxMessage.objects.filter(pk=busy.pk).update(next_attempt_at=timezone.now())
+        self.smtp.rcpt_replies = {}
+        self.assertEqual(deliver_outbox(), {'sent': 1, 'retry': 0, 'failed': 0})
+
+    def test_server_down_is_retried(self):
+        self.smtp.stop()
+        django_mail.send_mail('제목', '본문', 'noreply@example.com', ['user@example.com'])
+        with self.assertLogs('dashboard.mail', 'WARNING'):
+            self.assertEqual(deliver_outbox(max_attempts=2), {'sent': 0, 'retry': 1, 'failed': 0})
+        OutboxMessage.objects.update(next_attempt_at=timezone.now())
+        with self.assertLogs('dashboard.mail', 'WARNING'):
+            self.assertEqual(deliver_outbox(max_attempts=2), {'sent': 0, 'retry': 0, 'failed': 1})
+
+
+class SQLiteProfileTestCase(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.database = {'ENGINE': 'django.db.backends.sqlite3', 'NAME': os.path.join(directory.name, 'stress.sqlite3')}
+
+    def test_apply_profile(self):
+        self.assertEqual(apply_profile(self.database, 'development'), self.database)
+        production = apply_profile(self.database, 'production')
+        self.assertEqual(production['CONN_MAX_AGE'], 600)
+        self.assertEqual(production['OPTIONS']['transaction_mode'], 'IMMEDIATE')
+        self.assertIn('PRAGMA journal_mode=WAL', production['OPTIONS']['init_command'])
+        # SQLite 가 아니면 그대로 둡니다.
+        postgres = {'ENGINE': 'django.db.backends.postgresql', 'NAME': 'pro'}
+        self.assertEqual(apply_profile(postgres, 'production'), postgres)
+        with self.assertRaises(ValueError):
+            apply_profile(self.database, 'staging')
+
+    def test_production_profile_has_no_lock_errors(self):
+        result = run_write_stress(apply_profile(self.database, 'production'), writers=6, operations=40)
+        self.assertEqual(result['journal_mode'], 'wal')
+        self.assertEqual((result['succeeded'], result['locked'], result['failed']), (240, 0, 0))
+        # 읽고 쓰는 트랜잭션끼리 갱신을 잃어버리지 않았습니다.
+        self.assertEqual(result['counter'], 240)
@@ -1,14 +1,22 @@
+from django.conf import settings
 from django.urls import path, reverse_lazy
 from django.contrib.auth import views as auth_views
-from . import views
+from . import async_views, views
  
 app_name = 'dashboard'
 
+# 읽기 위주 뷰는 settings.DASHBOARD_ASYNC_VIEWS 에 따라 async 버전을 연결합니다.
+read_views = async_views if settings.DASHBOARD_ASYNC_VIEWS else views
+
 urlpatterns = [
     # 기존 URL 패턴
-    path('', views.dashboard_view, name='dashboard'),
+    path('', read_views.dashboard_view, name='dashboard'),
     path('toggle_user_status/<int:user_id>/', views.toggle_user_status, name='toggle_user_status'),
-    path('user_list_partial/', views.user_list_partial, name='user_list_partial'),
+    path('users/bulk_status/', views.bulk_user_status_view, name='bulk_user_status'),
+    path('user_list_partial/', read_views.user_list_partial, name='user_list_partial'),
+    path('chart_data/', read_views.chart_data_view, name='chart_data'),
+    path('metrics/', views.metrics_view, name='metrics'),
+    path('exports/<slug:name>.<slug:export_format>', views.export_view, name='export'),
 
     # 로그인 후 리디렉션을 처리할 URL
     path('redirect/', views.login_redirect_view, name='login_redirect'),
@@ -16,11 +24,14 @@ urlpatterns = [
     path('profile/edit/', views.profile_edit_view, name='profile_edit'),
 
     # 게시판 URL 추가
-    path('board/', views.post_list_view, name='post_list'),
-    path('board/post/<int:pk>/', views.post_detail_view, name='post_detail'),
+    path('board/', read_views.post_list_view, name='post_list'),
+    path('board/search/', views.post_search_view, name='post_search'),
+    path('board/post/<int:pk>/', read_views.post_detail_view, name='post_detail'),
+    path('board/post/<int:pk>/comments/', views.comment_list_view, name='comment_list'),
+    path('board/post/<int:pk>/events/', read_views.post_events_view, name='post_events'),
     path('board/post/new/', views.post_create_view, name='post_create'),
     path('board/post/<int:pk>/edit/', views.post_edit_view, name='post_edit'),
-    path('board/post/<int:pk>/like/', views.toggle_like_view, name='toggle_like'),
+    path('board/post/<int:pk>/like/', read_views.toggle_like_view, name='toggle_like'),
 
     # 로그인 및 로그아웃 URL 추가
     path(
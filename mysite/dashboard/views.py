@@ -1,24 +1,54 @@
 # dashboard/views.py
 
+import hashlib
 import json
 from datetime import timedelta
-import random
 from datetime import date
+from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.contrib import messages
 from django.contrib.auth.decorators import user_passes_test, login_required
 from django.urls import reverse_lazy
 from django.contrib.auth.models import User
-from django.db.models import Q, Count
-from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
+from django.db.models import Count
+from django.core.paginator import Paginator
 from django.db.models.functions import TruncMonth
-from django.http import JsonResponse, HttpResponseRedirect
+from django.http import Http404, HttpResponse, HttpResponseBadRequest, JsonResponse, HttpResponseRedirect, StreamingHttpResponse
 from django.shortcuts import render, get_object_or_404, redirect
+from django.template.loader import render_to_string
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+from django.utils.translation import get_language
 from django.views.decorators.http import require_POST
 from django.core.exceptions import PermissionDenied
-from .models import Bookmark, Comment, Like, Post, Category
+from . import accounts, caching, categories, exports, live
+from .models import Bookmark, Comment, Like, Post, DashboardStats, DailyActivity
 from .forms import UserProfileForm, PostForm, CommentForm
+from .pagination import CursorPaginator, InvalidCursor
+from .profiling import metrics_text
+from .routers import read_from_replica
+from .search import filter_users, search_posts
+
+# 목록 정렬 키. 커서 페이지네이션에서도 그대로 키셋으로 사용되므로 마지막 필드는 유일해야 합니다.
+USER_LIST_ORDERING = ('-date_joined', '-id')
+POST_LIST_ORDERING = ('-created_at', '-id')
+
+COMMENT_LIST_ORDERING = ('created_at', 'id')
+# 게시글 상세 화면에서 한 번에 보여줄 댓글 수 (나머지는 "댓글 더 보기" 로 불러옵니다.)
+COMMENTS_PER_PAGE = 50
+
+# 검색 결과에서 넘겨 볼 수 있는 최대 페이지 (관련도 순이므로 뒤쪽 페이지는 거의 보지 않습니다.)
+SEARCH_MAX_PAGES = 100
+
+# MAU 집계 캐시 유지 시간(초)
+MAU_CACHE_TIMEOUT = 300
+
+# 사용자 일괄 상태 변경 요청 하나에 담을 수 있는 최대 사용자 수
+BULK_USER_STATUS_MAX_IDS = 10000
+# auth_user.id 가 담을 수 있는 가장 큰 값 (64비트 정수)
+MAX_USER_ID = 2 ** 63 - 1
+
 
 def staff_member_required(view_func):
     """
@@ -32,34 +62,52 @@ def staff_member_required(view_func):
     )(view_func)
 
 
-@staff_member_required
-def dashboard_view(request):
+def paginate(request, queryset, ordering, per_page):
     """
-    대시보드 페이지에 필요한 모든 데이터를 계산하고 템플릿에 전달하는 뷰.
+    요청에 맞는 페이지 객체를 반환합니다.
+    settings.DASHBOARD_CURSOR_PAGINATION 이 켜져 있거나 요청에 cursor 파라미터가 있으면
+    키셋(커서) 페이지네이션을, 그렇지 않으면 기존 Paginator(?page=N) 를 사용합니다.
     """
-    # 1. 전체 사용자 목록 (사용자 관리 페이지용)
-    user_list = User.objects.all().order_by('-date_joined')
-    page = request.GET.get('page', 1)
-    paginator = Paginator(user_list, 10)  # 한 페이지에 10명씩 표시
-    try:
-        users = paginator.page(page)
-    except (PageNotAnInteger, EmptyPage):
-        users = paginator.page(1)
+    cursor = request.GET.get('cursor')
+    if cursor is not None or getattr(settings, 'DASHBOARD_CURSOR_PAGINATION', False):
+        return CursorPaginator(queryset, ordering, per_page).page(cursor)
+    return Paginator(queryset.order_by(*ordering), per_page).get_page(request.GET.get('page'))
 
-    # 2. 요약 카드 데이터
-    user_count = user_list.count()
-    post_count = Post.objects.count()
-    comment_count = Comment.objects.count()
-    like_count = Like.objects.count()
-    bookmark_count = Bookmark.objects.count()
 
-    # 월간 활성 사용자 (MAU) - 최근 30일 이내에 로그인한 사용자
-    thirty_days_ago = timezone.now() - timedelta(days=30)
-    mau_count = User.objects.filter(last_login__gte=thirty_days_ago).count()
+def cacheable_page(page_obj):
+    """
+    페이지 객체를 캐시에 넣을 수 있게 만듭니다. Paginator 가 들고 있는 전체 쿼리셋은 피클할 때
+    모든 행을 읽게 되므로, 전체 개수(num_pages)를 미리 계산해 둔 뒤 빈 쿼리셋으로 바꿉니다.
+    """
+    page_obj.object_list = list(page_obj.object_list)
+    paginator = getattr(page_obj, 'paginator', None)
+    if paginator is not None:
+        paginator.num_pages
+        paginator.object_list = paginator.object_list.none()
+    return page_obj
+
+
+def _user_states_of(posts):
+    return {post.pk: (post.user_has_liked, post.user_has_bookmarked) for post in posts}
+
 
-    # 3. 차트 데이터 - 월간 활성 사용자 (MAU) 그래프 (최근 12개월)
+def _attach_user_state(posts, states):
+    for post in posts:
+        post.user_has_liked, post.user_has_bookmarked = states.get(post.pk, (False, False))
+    return posts
+
+
+def _mau_querysets(current_date):
+    """
+    (MAU 를 세는 queryset, 최근 12개월 월별 활성 사용자 수 queryset) 을 반환합니다.
+    """
+    # 월간 활성 사용자 (MAU) - 최근 30일 이내에 활동 기록이 있는 사용자
+    # auth_user 전체 대신 DailyActivity 의 날짜 범위만 읽습니다.
+    thirty_days_ago = current_date - timedelta(days=30)
+    mau_queryset = DailyActivity.objects.filter(date__gte=thirty_days_ago).values('user').distinct()
+
+    # 차트 데이터 - 월간 활성 사용자 (MAU) 그래프 (최근 12개월)
     # DB 조회를 12번에서 1번으로 줄여 성능을 개선합니다.
-    current_date = timezone.now().date()
 
     # 1. 12개월 전 첫날을 계산하여 쿼리 범위를 지정합니다.
     start_date_year = current_date.year
@@ -70,13 +118,20 @@ def dashboard_view(request):
     start_date_for_query = date(start_date_year, start_date_month, 1)
 
     # 2. DB에서 한 번의 쿼리로 월별 활성 사용자 수를 집계합니다.
-    mau_query_results = User.objects.filter(
-        last_login__gte=start_date_for_query
-    ).annotate(month=TruncMonth('last_login')) \
+    #    일자별 활동 기록을 사용하므로 각 달의 실제 활성 사용자 수가 나옵니다.
+    monthly_queryset = DailyActivity.objects.filter(
+        date__gte=start_date_for_query
+    ).annotate(month=TruncMonth('date')) \
      .values('month') \
-     .annotate(mau=Count('id', distinct=True)) \
+     .annotate(mau=Count('user', distinct=True)) \
      .values('month', 'mau')
+    return mau_queryset, monthly_queryset
 
+
+def _mau_chart_series(current_date, mau_query_results):
+    """
+    월별 집계 결과로 (차트 라벨 목록, 차트 값 목록) 을 만듭니다.
+    """
     # 3. 쿼리 결과를 { 'YYYY-MM': count } 형태의 딕셔너리로 변환하여 조회 속도를 높입니다.
     mau_data_map = {item['month'].strftime('%Y-%m'): item['mau'] for item in mau_query_results}
 
@@ -91,36 +146,131 @@ def dashboard_view(request):
             year -= 1
         label = date(year, month, 1).strftime("%Y-%m")
         mau_chart_labels.append(label)
-        # --- 데모용 더미 데이터 추가 ---
-        # NOTE: 이 부분은 차트가 어떻게 보이는지 확인하기 위한 더미 데이터입니다.
-        #       실제 운영 환경에서는 `+ random.randint(50, 300)` 부분을 삭제해야 합니다.
-        mau_chart_values.append(mau_data_map.get(label, 0) + random.randint(50, 300))
- 
-    # 전체 콘텐츠 분포
-    content_distribution_labels = ['게시글', '댓글', '좋아요', '북마크']
-    content_distribution_values = [post_count, comment_count, like_count, bookmark_count]
-
-    # 4. 최근 가입자 및 게시글 목록
-    recent_users = User.objects.order_by('-date_joined')[:5]
-    recent_posts = Post.objects.order_by('-created_at')[:5]
+        mau_chart_values.append(mau_data_map.get(label, 0))
 
-    context = {
+    return mau_chart_labels, mau_chart_values
+
+
+def _mau_chart(current_date, monthly_rows):
+    # 계산한 시각을 함께 저장해 차트 데이터 응답의 Last-Modified 에 사용합니다.
+    labels, values = _mau_chart_series(current_date, monthly_rows)
+    return {'labels': labels, 'values': values, 'computed_at': timezone.now()}
+
+
+def _recent_querysets():
+    """대시보드의 (최근 가입자 5명, 최근 게시글 5건) queryset."""
+    return (
+        User.objects.order_by('-date_joined')[:5],
+        Post.objects.select_related('author').order_by('-created_at')[:5],
+    )
+
+
+def _mau_chart_data(current_date):
+    """
+    최근 12개월 MAU 차트 데이터 {'labels', 'values', 'computed_at'} 를 계산합니다.
+    """
+    _, monthly_queryset = _mau_querysets(current_date)
+    return _mau_chart(current_date, monthly_queryset)
+
+
+def _dashboard_context(users, stats, mau_count, recent):
+    """
+    dashboard_view 와 async 버전이 함께 쓰는 템플릿 컨텍스트를 만듭니다.
+    차트 데이터는 페이지에 넣지 않고 dashboard.js 가 chart_data_view 에서 따로 받아 옵니다.
+    """
+    recent_users, recent_posts = recent
+    return {
         'users': users,
-        'user_count': user_count,
-        'post_count': post_count,
-        'comment_count': comment_count,
-        'like_count': like_count,
-        'bookmark_count': bookmark_count,
+        'user_count': stats.user_count,
+        'post_count': stats.post_count,
+        'comment_count': stats.comment_count,
+        'like_count': stats.like_count,
+        'bookmark_count': stats.bookmark_count,
         'mau_count': mau_count,
-        'mau_chart_labels': json.dumps(mau_chart_labels),
-        'mau_chart_values': json.dumps(mau_chart_values),
-        'content_distribution_labels': json.dumps(content_distribution_labels),
-        'content_distribution_values': json.dumps(content_distribution_values),
         'recent_users': recent_users,
         'recent_posts': recent_posts,
     }
+
+
+def _chart_response(request, stats, mau_chart):
+    """
+    차트 데이터 JSON 응답을 만듭니다. 요청의 If-None-Match / If-Modified-Since 가
+    현재 버전과 같으면 본문 없이 304 를 반환합니다.
+
+    ETag 는 응답 본문(콘텐츠 분포 집계 값과 MAU 값) 자체의 해시이므로, MAU 캐시가 다시 계산되거나
+    다른 워커가 응답해도 데이터가 같으면 그대로입니다. Last-Modified 는 If-None-Match 를 보내지 않는
+    클라이언트를 위한 것으로, 집계 행이 바뀐 시각과 MAU 차트를 계산한 시각 중 늦은 쪽입니다.
+    """
+    payload = {
+        'mau': {'labels': mau_chart['labels'], 'values': mau_chart['values']},
+        'content_distribution': {
+            'labels': ['게시글', '댓글', '좋아요', '북마크'],
+            'values': [stats.post_count, stats.comment_count, stats.like_count, stats.bookmark_count],
+        },
+    }
+    etag = quote_etag(hashlib.md5(json.dumps(payload, sort_keys=True).encode()).hexdigest())
+    last_modified = max(stats.updated_at, mau_chart['computed_at'])
+    response = get_conditional_response(request, etag=etag, last_modified=int(last_modified.timestamp()))
+    if response is None:
+        response = JsonResponse(payload)
+    response['ETag'] = etag
+    response['Last-Modified'] = http_date(last_modified.timestamp())
+    # 브라우저가 저장해 두되 쓸 때마다 조건부 요청으로 다시 확인하게 합니다.
+    response['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+@staff_member_required
+@read_from_replica
+def dashboard_view(request):
+    """
+    대시보드 페이지에 필요한 모든 데이터를 계산하고 템플릿에 전달하는 뷰.
+    """
+    # 1. 전체 사용자 목록 (사용자 관리 페이지용)
+    users = paginate(request, User.objects.all(), USER_LIST_ORDERING, 10)  # 한 페이지에 10명씩 표시
+
+    # 2. 요약 카드 데이터
+    # 시그널로 증감되는 DashboardStats 행을 한 번만 읽어 테이블 전체 COUNT(*)를 피합니다.
+    stats = DashboardStats.load()
+
+    # 3. 월간 활성 사용자 (MAU)
+    # 활동 기록은 시그널 없이 upsert 되므로 짧은 TTL 로만 캐시합니다. 차트는 chart_data_view 가 따로 보냅니다.
+    current_date = timezone.localdate()
+    mau_count = caching.get_or_set(
+        [caching.DASHBOARD], ('mau_count', current_date), lambda: _mau_querysets(current_date)[0].count(),
+        timeout=MAU_CACHE_TIMEOUT,
+    )
+
+    # 4. 최근 가입자 및 게시글 목록 (사용자/게시글 생성·삭제 시 무효화됩니다.)
+    recent = caching.get_or_set(
+        [caching.DASHBOARD], ('recent',), lambda: tuple(list(queryset) for queryset in _recent_querysets()),
+    )
+
+    context = _dashboard_context(users, stats, mau_count, recent)
     return render(request, 'dashboard/dashboard.html', context)
 
+
+@staff_member_required
+@read_from_replica
+def chart_data_view(request):
+    """
+    대시보드의 MAU 차트와 콘텐츠 분포 차트 데이터를 JSON 으로 반환하는 뷰. (ETag / Last-Modified 지원)
+    """
+    current_date = timezone.localdate()
+    mau_chart = caching.get_or_set(
+        [caching.DASHBOARD], ('mau_chart', current_date), lambda: _mau_chart_data(current_date),
+        timeout=MAU_CACHE_TIMEOUT,
+    )
+    return _chart_response(request, DashboardStats.load(), mau_chart)
+
+@staff_member_required
+def metrics_view(request):
+    """
+    뷰별 쿼리 수·DB 시간·렌더링 시간과 캐시 적중률을 Prometheus 텍스트 형식으로 반환하는 뷰.
+    """
+    return HttpResponse(metrics_text(), content_type='text/plain; version=0.0.4; charset=utf-8')
+
+
 @staff_member_required
 @require_POST
 def toggle_user_status(request, user_id):
@@ -137,24 +287,85 @@ def toggle_user_status(request, user_id):
 
 
 @staff_member_required
+@require_POST
+def bulk_user_status_view(request):
+    """
+    여러 사용자를 한 번에 활성화/비활성화하는 API.
+    요청 본문: {"user_ids": [1, 2, ...], "is_active": false}
+    응답의 results 는 사용자 id 별 처리 결과(activated, deactivated, unchanged, not_found, self)입니다.
+    """
+    try:
+        payload = json.loads(request.body)
+        user_ids = payload['user_ids']
+        is_active = payload['is_active']
+    except (ValueError, TypeError, KeyError):
+        return JsonResponse({'status': 'error', 'message': '요청 형식이 올바르지 않습니다.'}, status=400)
+    # "12" 나 1.9 를 정수로 바꿔 주지 않고, DB 정수 범위를 넘는 id 도 조회 전에 거부합니다. (bool 은 int 의 하위 클래스)
+    if not isinstance(user_ids, list) or not all(
+        type(user_id) is int and 1 <= user_id <= MAX_USER_ID for user_id in user_ids
+    ):
+        return JsonResponse({'status': 'error', 'message': 'user_ids 는 양의 정수 목록이어야 합니다.'}, status=400)
+    if not isinstance(is_active, bool):
+        return JsonResponse({'status': 'error', 'message': 'is_active 는 true 또는 false 여야 합니다.'}, status=400)
+    if not user_ids:
+        return JsonResponse({'status': 'error', 'message': '선택된 사용자가 없습니다.'}, status=400)
+    if len(user_ids) > BULK_USER_STATUS_MAX_IDS:
+        return JsonResponse(
+            {'status': 'error', 'message': f'한 번에 최대 {BULK_USER_STATUS_MAX_IDS}명까지 변경할 수 있습니다.'},
+            status=400,
+        )
+
+    results = accounts.set_users_active(user_ids, is_active, acting_user=request.user)
+    return JsonResponse({
+        'status': 'success',
+        'is_active': is_active,
+        'results': {str(user_id): result for user_id, result in results.items()},
+        'summary': accounts.summarize(results),
+    })
+
+@staff_member_required
+@read_from_replica
+def export_view(request, name, export_format):
+    """
+    사용자/게시글/댓글/좋아요를 CSV 또는 NDJSON 으로 내려받는 뷰. (예: exports/posts.csv?since=2024-01-01)
+    since/until(YYYY-MM-DD, until 포함)으로 기간을 제한할 수 있습니다.
+    """
+    if name not in exports.EXPORTS:
+        raise Http404('알 수 없는 내보내기입니다.')
+    if export_format not in exports.FORMATS:
+        raise Http404('지원하지 않는 형식입니다.')
+    try:
+        start, end = exports.parse_date_range(request.GET.get('since'), request.GET.get('until'))
+        fields, rows = exports.export_queryset(name, start, end)
+    except exports.ExportError as exc:
+        return HttpResponseBadRequest(str(exc))
+    # 행은 뷰가 반환된 뒤 응답을 흘려보내면서 읽으므로, 지금 라우팅된 DB(복제본)에 고정해 둡니다.
+    rows = rows.using(rows.db)
+
+    response = StreamingHttpResponse(
+        exports.STREAMERS[export_format](fields, rows), content_type=exports.FORMATS[export_format],
+    )
+    filename = f'{name}-{timezone.localdate():%Y%m%d}.{export_format}'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response['Cache-Control'] = 'no-store'
+    # 프록시가 응답 전체를 모은 뒤 보내지 않도록 합니다.
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+@staff_member_required
+@read_from_replica
 def user_list_partial(request):
     """
     AJAX 페이지네이션 및 검색 요청을 처리하여 사용자 목록 HTML 조각을 반환하는 뷰.
     """
     search_query = request.GET.get('search', '')
-    user_list = User.objects.all().order_by('-date_joined')
+    user_list = User.objects.all()
 
     if search_query:
-        user_list = user_list.filter(
-            Q(username__icontains=search_query) |
-            Q(email__icontains=search_query) |
-            Q(first_name__icontains=search_query) |
-            Q(last_name__icontains=search_query)
-        )
+        # auth_user 의 네 컬럼을 icontains 로 훑는 대신 사용자 검색 색인을 사용합니다.
+        user_list = filter_users(user_list, search_query)
 
-    page = request.GET.get('page', 1)
-    paginator = Paginator(user_list, 10)  # 한 페이지에 10명씩 표시
-    users = paginator.get_page(page)
+    users = paginate(request, user_list, USER_LIST_ORDERING, 10)  # 한 페이지에 10명씩 표시
     return render(request, 'dashboard/_user_list.html', {'users': users})
 
 
@@ -204,13 +415,148 @@ def post_list_view(request):
     """
     게시글 목록을 보여주는 뷰.
     """
-    post_list = Post.objects.select_related('author', 'category').annotate(
-        like_count=Count('likes', distinct=True)
-    ).all().order_by('-created_at')
-    paginator = Paginator(post_list, 10)  # 한 페이지에 10개씩
-    page_number = request.GET.get('page')
-    page_obj = paginator.get_page(page_number)
-    return render(request, 'dashboard/post_list.html', {'page_obj': page_obj})
+    loaded_states = None
+
+    def load_page():
+        nonlocal loaded_states
+        page_obj = paginate(request, _post_list_queryset(request.user), POST_LIST_ORDERING, 10)  # 한 페이지에 10개씩
+        # 카테고리 이름은 조인 대신 프로세스 로컬 카테고리 캐시에서 채웁니다.
+        page_obj.object_list = categories.attach(page_obj.object_list)
+        loaded_states = _user_states_of(page_obj.object_list)
+        return cacheable_page(page_obj)
+
+    # 목록 페이지는 모든 사용자가 함께 쓰고, 사용자별 좋아요/북마크 표시는 사용자 네임스페이스에 따로 캐시합니다.
+    # 좋아요/북마크가 바뀌어도 그 사용자의 표시만 다시 읽으며, 목록은 좋아요 수가 바뀔 때 한 번만 다시 만듭니다.
+    page_obj = caching.get_or_set(
+        [caching.BOARD, caching.POST_LIST], ('post_list', request.GET.get('page'), request.GET.get('cursor')), load_page,
+    )
+    post_ids = [post.pk for post in page_obj.object_list]
+    states = caching.get_or_set(
+        [caching.user_namespace(request.user.pk)], ('post_list_state', request.user.pk, *post_ids),
+        lambda: loaded_states if loaded_states is not None else _post_list_states(post_ids, request.user),
+    )
+    # 공용 캐시의 게시글에 남아 있는 다른 사용자의 표시는 여기서 덮어씁니다.
+    _attach_user_state(page_obj.object_list, states)
+    post_list_html = render_to_string('dashboard/_post_list_items.html', {'page_obj': page_obj})
+    return render(request, 'dashboard/post_list.html', {'post_list_html': post_list_html})
+
+
+@login_required
+def post_search_view(request):
+    """
+    검색 색인을 이용해 제목·본문·댓글에서 검색어를 찾아 관련도 순으로 게시글을 보여주는 뷰.
+    """
+    query = request.GET.get('q', '').strip()
+    try:
+        page_number = max(int(request.GET.get('page', 1)), 1)
+    except ValueError:
+        page_number = 1
+    if page_number > SEARCH_MAX_PAGES:
+        raise Http404('페이지를 찾을 수 없습니다.')
+    per_page = 10
+
+    posts = []
+    has_next = False
+    if query:
+        # 한 건을 더 가져와 다음 페이지 존재 여부를 판단합니다. (전체 개수는 세지 않습니다.)
+        post_ids = search_posts(query, limit=per_page + 1, offset=(page_number - 1) * per_page)
+        has_next = len(post_ids) > per_page
+        post_ids = post_ids[:per_page]
+        posts_by_id = Post.objects.select_related('author').in_bulk(post_ids)
+        posts = categories.attach(posts_by_id[post_id] for post_id in post_ids if post_id in posts_by_id)
+
+    context = {
+        'query': query,
+        'posts': posts,
+        'page_number': page_number,
+        'has_previous': page_number > 1,
+        'has_next': has_next,
+    }
+    return render(request, 'dashboard/post_search.html', context)
+
+
+def _post_list_queryset(user):
+    # 좋아요 수는 Post.like_count 컬럼에서 바로 읽으므로 Like 테이블과 조인하지 않고,
+    # 이 사용자의 좋아요/북마크 여부는 같은 SELECT 안의 EXISTS 서브쿼리로 함께 가져옵니다.
+    return Post.objects.select_related('author').with_user_state(user)
+
+
+def _post_detail_queryset():
+    return Post.objects.select_related('author')
+
+
+def _get_cached_post(pk):
+    return caching.get_or_set(
+        [caching.BOARD, caching.post_namespace(pk)], ('post', pk),
+        lambda: categories.attach([get_object_or_404(_post_detail_queryset(), pk=pk)])[0],
+    )
+
+
+def _post_list_states_queryset(post_ids, user):
+    return Post.objects.filter(pk__in=post_ids).with_user_state(user).values_list(
+        'pk', 'user_has_liked', 'user_has_bookmarked',
+    )
+
+
+def _post_list_states(post_ids, user):
+    """게시글들에 대한 user 의 {pk: (좋아요 여부, 북마크 여부)}. 사용자별 EXISTS 를 붙인 쿼리 한 번입니다."""
+    if not post_ids:
+        return {}
+    return {pk: (liked, bookmarked) for pk, liked, bookmarked in _post_list_states_queryset(post_ids, user)}
+
+
+def _user_state_queryset(pk, user):
+    return Post.objects.filter(pk=pk).with_user_state(user).values_list('user_has_liked', 'user_has_bookmarked')
+
+
+def _user_state(pk, user):
+    """게시글 pk 에 대한 user 의 (좋아요 여부, 북마크 여부). 쿼리 한 번으로 함께 조회합니다."""
+    return _user_state_queryset(pk, user).first() or (False, False)
+
+
+def _comment_paginator(post_id):
+    comments = Comment.objects.filter(post_id=post_id).select_related('author')
+    return CursorPaginator(comments, COMMENT_LIST_ORDERING, COMMENTS_PER_PAGE)
+
+
+def _comment_cache_parts(paginator, post_id, cursor):
+    """
+    댓글 페이지의 (캐시 키, 첫 페이지 여부) 를 반환합니다. 캐시 키에는 요청 문자열 대신 해석한 커서 값을 넣어
+    같은 위치를 가리키는 커서가 한 항목을 함께 쓰게 합니다. 커서가 잘못되었으면 InvalidCursor 가 발생합니다.
+    """
+    position = paginator.decode_cursor(cursor) if cursor else None
+    return ('comments', post_id, repr(position), get_language()), position is None
+
+
+def _render_comments(post_id, cursor=None):
+    """
+    댓글 한 페이지(최대 COMMENTS_PER_PAGE 개)와 "댓글 더 보기" 버튼을 HTML 조각으로 렌더링합니다.
+    (post_id, created_at, id) 키셋으로 조회하므로 댓글 수와 관계없이 비용이 일정합니다.
+    """
+    paginator = _comment_paginator(post_id)
+    cache_parts, is_first_page = _comment_cache_parts(paginator, post_id, cursor)
+
+    def render_page():
+        return render_to_string('dashboard/_comment_list.html', {
+            'comments': paginator.page(cursor),
+            'post_id': post_id,
+            'is_first_page': is_first_page,
+        })
+
+    namespaces = [caching.BOARD, caching.post_namespace(post_id)]
+    return caching.get_or_set(namespaces, cache_parts, render_page)
+
+
+@login_required
+def comment_list_view(request, pk):
+    """
+    "댓글 더 보기" 요청에 다음 댓글 페이지의 HTML 조각을 반환하는 뷰.
+    """
+    post = _get_cached_post(pk)
+    try:
+        return HttpResponse(_render_comments(post.pk, request.GET.get('cursor')))
+    except InvalidCursor:
+        return HttpResponseBadRequest('잘못된 커서입니다.')
 
 
 @login_required
@@ -218,9 +564,10 @@ def post_detail_view(request, pk):
     """
     게시글 상세 내용과 댓글을 보여주는 뷰.
     """
-    post = get_object_or_404(Post.objects.select_related('author', 'category'), pk=pk)
-    comments = post.comments.select_related('author').order_by('created_at')
-    
+    # 게시글, 댓글 조각, 사용자별 좋아요 여부는 게시글 네임스페이스에 캐시되며
+    # 게시글/댓글/좋아요/카테고리 변경 시그널이 무효화합니다.
+    post = _get_cached_post(pk)
+
     if request.method == 'POST':
         comment_form = CommentForm(request.POST)
         if comment_form.is_valid():
@@ -233,29 +580,48 @@ def post_detail_view(request, pk):
     else:
         comment_form = CommentForm()
 
+    # 첫 페이지 댓글만 렌더링합니다.
+    comments_html = _render_comments(post.pk)
+
     # 좋아요 상태와 카운트는 GET/POST에 상관없이 항상 필요합니다.
-    like_count = post.likes.count()
-    user_has_liked = False
-    if request.user.is_authenticated:
-        user_has_liked = post.likes.filter(user=request.user).exists()
+    user_has_liked, user_has_bookmarked = caching.get_or_set(
+        [caching.post_namespace(pk)], ('user_state', pk, request.user.pk),
+        lambda: _user_state(pk, request.user),
+    )
 
     context = {
         'post': post,
-        'comments': comments,
+        'comments_html': comments_html,
         'comment_form': comment_form,
-        'like_count': like_count,
+        'like_count': post.like_count,
         'user_has_liked': user_has_liked,
+        'user_has_bookmarked': user_has_bookmarked,
     }
     return render(request, 'dashboard/post_detail.html', context)
 
 
+@login_required
+def post_events_view(request, pk):
+    """
+    async_views.post_events_view 의 WSGI 버전.
+    끝나지 않는 스트림은 워커를 계속 붙잡으므로, 현재 좋아요 수만 보내고 응답을 끝냅니다.
+    브라우저는 retry 간격 뒤에 다시 연결합니다.
+    """
+    like_count = Post.objects.filter(pk=pk).values_list('like_count', flat=True).first()
+    if like_count is None:
+        raise Http404('게시글을 찾을 수 없습니다.')
+    response = StreamingHttpResponse(live.snapshot_stream(pk, like_count), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    return response
+
+
 @login_required
 def post_create_view(request):
     """
     새로운 게시글을 작성하는 뷰.
     """
     # 글을 작성하기 전에 카테고리가 존재하는지 확인합니다.
-    if not Category.objects.exists():
+    if not categories.exists():
         messages.error(request, '게시글을 작성하려면 먼저 관리자 페이지에서 카테고리를 하나 이상 생성해야 합니다.')
         return redirect('dashboard:post_list')
 
@@ -297,25 +663,11 @@ def post_edit_view(request, pk):
 @login_required
 @require_POST
 def toggle_like_view(request, pk):
+    """
+    게시글 좋아요를 토글하고 갱신된 상태와 좋아요 수를 JSON 으로 반환하는 뷰.
+    """
     try:
-        user = request.user
-        post = get_object_or_404(Post, pk=pk)
-
-        like, created = Like.objects.get_or_create(user=user, post=post)
-
-        if not created:
-            like.delete()
-            is_liked = False
-        else:
-            like.save()  # 👈 명시적으로 저장
-            is_liked = True
-
-        like_count = post.likes.count()
-
-        print(f'[DEBUG] Like 객체 생성됨: {created}, 현재 좋아요 수: {like_count}')
-        return JsonResponse({'is_liked': is_liked, 'like_count': like_count})
-
-    except Exception as e:
-        import traceback
-        traceback.print_exc()
-        return JsonResponse({'error': str(e)}, status=500)
+        is_liked, like_count = Like.toggle(pk, request.user)
+    except Post.DoesNotExist:
+        raise Http404('게시글을 찾을 수 없습니다.')
+    return JsonResponse({'is_liked': is_liked, 'like_count': like_count})
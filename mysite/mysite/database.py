@@ -0,0 +1,57 @@
+"""
+DATABASES 설정 프로필.
+
+settings.py 에서 DASHBOARD_DB_PROFILE 환경 변수로 고릅니다.
+    development (기본값)  Django 기본 SQLite 설정. 요청마다 연결을 새로 엽니다.
+    production            아래 PRAGMA 와 지속 연결(CONN_MAX_AGE)을 적용합니다.
+
+production 프로필이 바꾸는 것
+    journal_mode=WAL       읽기와 쓰기가 서로를 막지 않습니다. (쓰기는 여전히 한 번에 하나)
+    synchronous=NORMAL     WAL 에서는 커밋마다 fsync 하지 않아도 DB 가 깨지지 않습니다.
+                           (전원이 꺼지면 마지막 몇 개의 커밋만 잃을 수 있습니다.)
+    mmap_size, cache_size  읽기를 메모리 매핑과 더 큰 페이지 캐시로 처리합니다.
+    busy_timeout           다른 연결이 쓰는 중이면 바로 "database is locked" 를 내지 않고 기다립니다.
+    transaction_mode       atomic() 이 BEGIN IMMEDIATE 로 시작해 쓰기 잠금을 먼저 잡습니다.
+                           DEFERRED 트랜잭션이 읽은 뒤 쓰기로 올라가려 할 때는 SQLite 가
+                           busy_timeout 을 기다리지 않고 바로 실패시키므로 함께 필요합니다.
+
+이 모듈은 settings.py 에서 import 되므로 Django 모델이나 django.db 를 불러오지 않습니다.
+"""
+
+# (PRAGMA, 값) 순서대로 연결을 열 때마다 실행됩니다.
+SQLITE_PRODUCTION_PRAGMAS = (
+    ('journal_mode', 'WAL'),
+    ('synchronous', 'NORMAL'),
+    ('busy_timeout', 20000),             # 밀리초
+    ('mmap_size', 256 * 1024 * 1024),    # 256MB
+    ('cache_size', -64 * 1024),          # 음수는 KiB 단위: 64MB
+    ('temp_store', 'MEMORY'),
+)
+SQLITE_PRODUCTION_CONN_MAX_AGE = 600
+
+PROFILES = ('development', 'production')
+
+
+def sqlite_init_command(pragmas=SQLITE_PRODUCTION_PRAGMAS):
+    return '; '.join(f'PRAGMA {name}={value}' for name, value in pragmas)
+
+
+def apply_profile(database, profile, conn_max_age=SQLITE_PRODUCTION_CONN_MAX_AGE):
+    """DATABASES 항목 하나에 프로필을 적용한 새 dict 를 반환합니다."""
+    if profile not in PROFILES:
+        raise ValueError(f'Unknown DASHBOARD_DB_PROFILE: {profile!r} (expected one of {", ".join(PROFILES)})')
+    database = dict(database)
+    if profile == 'development' or not database['ENGINE'].endswith('sqlite3'):
+        return database
+    busy_timeout_ms = dict(SQLITE_PRODUCTION_PRAGMAS)['busy_timeout']
+    database['CONN_MAX_AGE'] = conn_max_age
+    # 오래 유지한 연결이 끊겼다면 요청 시작 시 다시 엽니다.
+    database['CONN_HEALTH_CHECKS'] = True
+    database['OPTIONS'] = {
+        **database.get('OPTIONS', {}),
+        'init_command': sqlite_init_command(),
+        'transaction_mode': 'IMMEDIATE',
+        # sqlite3.connect(timeout=...) 도 busy_timeout 과 같은 값으로 맞춥니다. (초 단위)
+        'timeout': busy_timeout_ms / 1000,
+    }
+    return database
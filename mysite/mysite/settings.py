@@ -10,8 +10,11 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
+import os
 from pathlib import Path
 
+from .database import apply_profile
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -42,11 +45,15 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    # 뷰별 쿼리 수·DB 시간·렌더링 시간 측정 (세션/인증 미들웨어의 쿼리까지 포함하도록 앞쪽에 둡니다.)
+    'dashboard.profiling.QueryProfilingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.locale.LocaleMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # 읽기 복제본을 쓸 때 쓰기 직후의 세션을 default 에 고정합니다. (dashboard/routers.py 참고)
+    'dashboard.routers.ReplicaRoutingMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
 ]
@@ -55,7 +62,7 @@ ROOT_URLCONF = 'mysite.urls'
 
 TEMPLATES = [
     {
-        'BACKEND': 'django.template.backends.django.DjangoTemplates',
+        'BACKEND': 'dashboard.profiling.ProfilingDjangoTemplates',
         'DIRS': [],
         'APP_DIRS': True,
         'OPTIONS': {
@@ -81,6 +88,69 @@ DATABASES = {
     }
 }
 
+# 배포 시에는 DASHBOARD_DB_PROFILE=production 으로 WAL, busy_timeout, mmap 등의 PRAGMA 와
+# 지속 연결(CONN_MAX_AGE)을 적용합니다. 자세한 내용은 mysite/database.py 를 참고하세요.
+DASHBOARD_DB_PROFILE = os.environ.get('DASHBOARD_DB_PROFILE', 'development')
+DATABASES['default'] = apply_profile(DATABASES['default'], DASHBOARD_DB_PROFILE)
+
+# 대시보드 집계, 사용자 목록, 내보내기는 읽기 복제본에서 조회할 수 있습니다.
+# DASHBOARD_REPLICA_DB 에 default 를 복제한 SQLite 파일(LiteFS, Litestream 등)의 경로를 주면
+# 'replica' 별칭으로 등록되고, 쓰기와 그 밖의 조회는 계속 default 를 사용합니다.
+# 쓰기가 있었던 세션은 DASHBOARD_REPLICA_STICKY_SECONDS 초 동안 default 에서만 읽습니다.
+DASHBOARD_REPLICA_DATABASE = 'replica'
+DASHBOARD_REPLICA_STICKY_SECONDS = 10
+if os.environ.get('DASHBOARD_REPLICA_DB'):
+    DATABASES[DASHBOARD_REPLICA_DATABASE] = apply_profile({
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': os.environ['DASHBOARD_REPLICA_DB'],
+        # 테스트에서는 별도 DB 를 만들지 않고 default 테스트 DB 를 그대로 씁니다.
+        'TEST': {'MIRROR': 'default'},
+    }, DASHBOARD_DB_PROFILE)
+DATABASE_ROUTERS = ['dashboard.routers.ReplicaRouter']
+
+
+# Cache
+# https://docs.djangoproject.com/en/5.2/topics/cache/
+# 기본은 프로세스별 로컬 메모리 캐시이며, 가득 차면 가장 오래 쓰이지 않은 항목부터 정리(LRU)됩니다.
+# 여러 워커가 캐시와 무효화를 공유해야 한다면 DASHBOARD_CACHE_DIR 환경 변수로 파일 캐시를 사용합니다.
+
+if os.environ.get('DASHBOARD_CACHE_DIR'):
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.environ['DASHBOARD_CACHE_DIR'],
+            'TIMEOUT': 300,
+            'OPTIONS': {'MAX_ENTRIES': 10000},
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+            'LOCATION': 'dashboard',
+            'TIMEOUT': 300,
+            'OPTIONS': {'MAX_ENTRIES': 5000, 'CULL_FREQUENCY': 4},
+        }
+    }
+
+# 세션과 로그인 사용자 조회
+# 워커끼리 공유하는 캐시(DASHBOARD_CACHE_DIR)가 있으면 세션을 cached_db 엔진으로 캐시에서 먼저 읽고
+# (저장은 DB 에도 함께), 로그인한 사용자는 DASHBOARD_AUTH_USER_CACHE_TIMEOUT 초 동안 캐시합니다.
+# 프로세스별 로컬 메모리 캐시에서는 로그아웃이나 비활성화가 다른 워커의 캐시에 남아 있을 수 있으므로
+# 기본값으로 DB 세션을 쓰고 사용자도 캐시하지 않습니다. (0 이면 요청마다 DB 에서 읽습니다.)
+# 사용자를 저장하거나 비활성화하면 바로 무효화됩니다. 자세한 내용은 dashboard/auth.py 를 참고하세요.
+_SHARED_CACHE = bool(os.environ.get('DASHBOARD_CACHE_DIR'))
+SESSION_ENGINE = os.environ.get(
+    'DASHBOARD_SESSION_ENGINE',
+    'django.contrib.sessions.backends.cached_db' if _SHARED_CACHE else 'django.contrib.sessions.backends.db',
+)
+DASHBOARD_AUTH_USER_CACHE_TIMEOUT = int(os.environ.get('DASHBOARD_AUTH_USER_CACHE_TIMEOUT', 60 if _SHARED_CACHE else 0))
+AUTHENTICATION_BACKENDS = [
+    'dashboard.auth.CachedModelBackend',
+    # 캐시 백엔드를 쓰기 전에 로그인한 세션에는 기존 백엔드 경로가 저장되어 있으므로 함께 둡니다.
+    'django.contrib.auth.backends.ModelBackend',
+]
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -129,6 +199,41 @@ X_FRAME_OPTIONS = 'SAMEORIGIN'# mysite/settings.py
 
 # ... 다른 설정들 ...
 
+# 게시판/사용자 목록에 키셋(커서) 페이지네이션을 기본으로 사용할지 여부
+# False 이면 ?page=N 방식을 유지하며, ?cursor= 파라미터가 있는 요청만 커서 방식으로 처리합니다.
+DASHBOARD_CURSOR_PAGINATION = False
+
+# 게시판 검색 백엔드: 'auto' (FTS5 를 지원하는 SQLite 면 FTS5, 아니면 토큰 테이블), 'fts5', 'tokens'
+DASHBOARD_SEARCH_BACKEND = 'auto'
+
+# 뷰별 SQL 쿼리 수 상한 (세션/인증 미들웨어의 쿼리 포함, 캐시가 비어 있는 경우 기준)
+# 초과 시 DASHBOARD_QUERY_BUDGET_ACTION 이 'log' 이면 경고 로그를, 'raise' 이면 예외를 발생시킵니다.
+DASHBOARD_QUERY_BUDGETS = {
+    'dashboard:dashboard': 10,
+    'dashboard:user_list_partial': 4,
+    'dashboard:chart_data': 4,
+    'dashboard:post_list': 5,
+    'dashboard:post_search': 5,
+    'dashboard:post_detail': 6,
+    'dashboard:comment_list': 5,
+    'dashboard:post_create': 10,
+    'dashboard:toggle_like': 8,
+}
+DASHBOARD_QUERY_BUDGET_ACTION = 'log'
+
+# ASGI(uvicorn 등)로 배포할 때 게시판 목록/상세, 좋아요, 대시보드, 사용자 목록에 async 뷰를 연결합니다.
+# WSGI 에서는 async 뷰가 요청마다 이벤트 루프를 새로 만들므로 꺼 두는 편이 빠릅니다.
+DASHBOARD_ASYNC_VIEWS = os.environ.get('DASHBOARD_ASYNC_VIEWS', '').lower() in ('1', 'true', 'yes')
+
+# 게시글 상세 화면 실시간 갱신(SSE): 연결마다 최대 DASHBOARD_LIVE_INTERVAL 초에 한 번 갱신을 보내고,
+# 변경이 없으면 DASHBOARD_LIVE_HEARTBEAT 초마다 keepalive 주석을 보냅니다.
+# 워커가 여러 개라면 'manage.py live_broker' 를 띄우고 그 주소를 DASHBOARD_LIVE_BROKER_URL 로 지정합니다.
+DASHBOARD_LIVE_INTERVAL = 1.0
+DASHBOARD_LIVE_HEARTBEAT = 20.0
+# WSGI(DASHBOARD_ASYNC_VIEWS 꺼짐)에서는 연결을 열어 두지 않고 이 간격(초)으로 현재 좋아요 수를 다시 읽습니다.
+DASHBOARD_LIVE_POLL_INTERVAL = 10.0
+DASHBOARD_LIVE_BROKER_URL = os.environ.get('DASHBOARD_LIVE_BROKER_URL', '')
+
 # 로그인 성공 후 이동할 기본 URL
 LOGIN_REDIRECT_URL = 'dashboard:login_redirect'
 
@@ -140,7 +245,10 @@ LOGIN_URL = 'dashboard:login'
 # WARNING: 실제 서비스에서는 이메일 주소와 비밀번호를 코드에 직접 작성하지 마세요.
 #          보안을 위해 환경 변수나 별도의 설정 파일을 사용하는 것이 좋습니다.
 # --------------------------------------------------------------------------
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
+# 요청 처리 중에는 메일을 DB 대기열(OutboxMessage)에 넣기만 하고, 'manage.py send_outbox --loop' 워커가
+# 아래 DASHBOARD_OUTBOX_DELIVERY_BACKEND(SMTP) 연결 하나로 묶어 발송합니다.
+EMAIL_BACKEND = 'dashboard.mail.OutboxEmailBackend'
+DASHBOARD_OUTBOX_DELIVERY_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
 EMAIL_HOST = 'smtp.gmail.com'  # Gmail SMTP 서버 주소
 EMAIL_PORT = 587               # Gmail SMTP 포트 (TLS)
 EMAIL_USE_TLS = True           # TLS 암호화 사용